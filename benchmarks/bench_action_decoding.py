@@ -0,0 +1,109 @@
+"""
+Benchmark: tagged vs. untagged action decoding.
+
+Parses a tournament-sized transcript (600 actions) with the
+``action_type``-tagged union used by ``GameTranscript`` and with the
+plain ``Action`` union it replaced, and reports the speedup.
+
+Run with::
+
+    python benchmarks/bench_action_decoding.py
+"""
+
+import timeit
+
+from pydantic import Field
+
+from warscribe.schema.action import (
+    Action,
+    ChargeAction,
+    FightAction,
+    MoveAction,
+    ShootAction,
+)
+from warscribe.schema.transcript import GameTranscript, Player
+from warscribe.schema.unit import UnitReference
+
+ACTIONS = 600
+REPEAT = 5
+NUMBER = 20
+
+
+class UntaggedTranscript(GameTranscript):
+    """Transcript decoding actions through the untagged union."""
+
+    actions: list[Action] = Field(default_factory=list)
+
+
+def build_transcript(n_actions: int) -> GameTranscript:
+    """Build a transcript cycling through the four core action types."""
+    marines = UnitReference(name="Intercessors", faction="Space Marines")
+    orks = UnitReference(name="Boyz", faction="Orks")
+    transcript = GameTranscript(
+        player1=Player(name="Alice", faction="Space Marines"),
+        player2=Player(name="Bob", faction="Orks"),
+    )
+    for i in range(n_actions):
+        turn = i // 120 + 1
+        kind = i % 4
+        if kind == 0:
+            action: Action = MoveAction(
+                turn=turn, phase="movement", actor=marines, distance_inches=6.0
+            )
+        elif kind == 1:
+            action = ShootAction(
+                turn=turn,
+                phase="shooting",
+                actor=marines,
+                target=orks,
+                weapon_name="Bolt Rifle",
+                shots=10,
+                dice_rolls={"hit": [3, 4, 5, 6, 1, 2, 3, 4, 5, 6]},
+                hits=7,
+                wounds=5,
+                saves_failed=3,
+            )
+        elif kind == 2:
+            action = ChargeAction(
+                turn=turn,
+                phase="charge",
+                actor=marines,
+                targets=[orks],
+                charge_roll=(4, 5),
+                distance_needed=7.0,
+                made_charge=True,
+            )
+        else:
+            action = FightAction(
+                turn=turn,
+                phase="fight",
+                actor=marines,
+                target=orks,
+                weapon_name="Chainsword",
+                attacks=4,
+                hits=3,
+                wounds=2,
+            )
+        transcript.add_action(action)
+    return transcript
+
+
+def best_time(fn) -> float:
+    """Best per-call time in seconds over ``REPEAT`` rounds."""
+    return min(timeit.repeat(fn, repeat=REPEAT, number=NUMBER)) / NUMBER
+
+
+def main() -> None:
+    payload = build_transcript(ACTIONS).to_json()
+
+    tagged = best_time(lambda: GameTranscript.model_validate_json(payload))
+    untagged = best_time(lambda: UntaggedTranscript.model_validate_json(payload))
+
+    print(f"actions:   {ACTIONS}")
+    print(f"untagged:  {untagged * 1000:8.2f} ms")
+    print(f"tagged:    {tagged * 1000:8.2f} ms")
+    print(f"speedup:   {untagged / tagged:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
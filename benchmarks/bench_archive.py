@@ -0,0 +1,63 @@
+"""
+Benchmark: random access into a multi-game archive.
+
+Writes 2,000 games of 50 actions to one archive, then times opening it and
+fetching a game by position and by id, against reading a game from its
+own JSON file.
+
+Run with::
+
+    python benchmarks/bench_archive.py
+"""
+
+import random
+import tempfile
+import timeit
+from pathlib import Path
+from uuid import uuid4
+
+from bench_action_decoding import build_transcript
+
+from warscribe.schema.transcript import GameTranscript
+from warscribe.serialization.archive import GameArchive, write_archive
+
+GAMES = 2000
+ACTIONS = 50
+REPEAT = 5
+NUMBER = 200
+
+
+def best_time(fn) -> float:
+    """Best per-call time in seconds over ``REPEAT`` rounds."""
+    return min(timeit.repeat(fn, repeat=REPEAT, number=NUMBER)) / NUMBER
+
+
+def main() -> None:
+    template = build_transcript(ACTIONS)
+    games = [template.model_copy(update={"id": uuid4()}) for _ in range(GAMES)]
+    rng = random.Random(0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "corpus.wsca"
+        write_archive(path, games)
+        json_path = Path(tmp) / "game.json"
+        json_path.write_text(games[0].to_json())
+
+        open_close = best_time(lambda: GameArchive(path).close())
+        with GameArchive(path) as archive:
+            by_position = best_time(lambda: archive[rng.randrange(GAMES)])
+            by_id = best_time(lambda: archive.get(games[rng.randrange(GAMES)].id))
+            entry = best_time(lambda: archive.entry(rng.randrange(GAMES)))
+        from_file = best_time(lambda: GameTranscript.from_json(json_path.read_text()))
+        size = path.stat().st_size
+
+    print(f"games:          {GAMES} x {ACTIONS} actions ({size / 1e6:.1f} MB)")
+    print(f"open archive:   {open_close * 1e6:8.1f} us")
+    print(f"metadata entry: {entry * 1e6:8.1f} us")
+    print(f"game by index:  {by_position * 1000:8.2f} ms")
+    print(f"game by id:     {by_id * 1000:8.2f} ms")
+    print(f"JSON file:      {from_file * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Benchmark: compact binary format vs. indented JSON.
+
+Compares encoded size and decode time of a 600-action transcript in the
+binary format against ``GameTranscript.to_json``/``from_json``. Expect
+a size ratio of about 10x but a decode ratio of only 1.1-1.7x.
+
+Run with::
+
+    python benchmarks/bench_binary_format.py
+"""
+
+import timeit
+
+from bench_action_decoding import ACTIONS, build_transcript
+
+from warscribe.schema.transcript import GameTranscript
+from warscribe.serialization.binary import decode_transcript, encode_transcript
+
+REPEAT = 5
+NUMBER = 20
+
+
+def best_time(fn) -> float:
+    """Best per-call time in seconds over ``REPEAT`` rounds."""
+    return min(timeit.repeat(fn, repeat=REPEAT, number=NUMBER)) / NUMBER
+
+
+def main() -> None:
+    transcript = build_transcript(ACTIONS)
+    text = transcript.to_json()
+    data = encode_transcript(transcript)
+    assert decode_transcript(data) == transcript
+
+    json_time = best_time(lambda: GameTranscript.from_json(text))
+    binary_time = best_time(lambda: decode_transcript(data))
+    json_size = len(text.encode())
+
+    print(f"actions:       {ACTIONS}")
+    print(f"json size:     {json_size:10d} bytes")
+    print(f"binary size:   {len(data):10d} bytes")
+    print(f"size ratio:    {json_size / len(data):10.2f}x")
+    print(f"json decode:   {json_time * 1000:10.2f} ms")
+    print(f"binary decode: {binary_time * 1000:10.2f} ms")
+    print(f"decode ratio:  {json_time / binary_time:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark: parallel corpus validation.
+
+Writes 400 JSON transcripts of 300 actions and times ``validate_corpus``
+with one worker and with one worker per CPU.
+
+Run with::
+
+    python benchmarks/bench_corpus_validation.py
+"""
+
+import os
+import tempfile
+import time
+from pathlib import Path
+from uuid import uuid4
+
+from bench_action_decoding import build_transcript
+
+from warscribe.corpus.pipeline import validate_corpus
+
+GAMES = 400
+ACTIONS = 300
+
+
+def timed(paths, workers: int) -> float:
+    start = time.perf_counter()
+    summaries = list(validate_corpus(paths, workers=workers))
+    elapsed = time.perf_counter() - start
+    assert len(summaries) == len(paths)
+    return elapsed
+
+
+def main() -> None:
+    template = build_transcript(ACTIONS)
+    workers = os.cpu_count() or 1
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(GAMES):
+            path = Path(tmp) / f"game{i}.json"
+            path.write_text(template.model_copy(update={"id": uuid4()}).to_json())
+            paths.append(path)
+
+        serial = timed(paths, 1)
+        parallel = timed(paths, workers)
+
+    print(f"games:      {GAMES} x {ACTIONS} actions")
+    print(f"1 worker:   {serial:8.2f} s")
+    print(f"{workers} workers: {parallel:8.2f} s")
+    print(f"speedup:    {serial / parallel:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark: vectorized dice statistics vs. Python loops.
+
+Builds a 200-game corpus of 600-action transcripts and compares a
+per-player, per-step face histogram computed with ``DiceTable`` against
+the equivalent nested Python loop over ``dice_rolls``.
+
+Run with::
+
+    python benchmarks/bench_dice_analytics.py
+"""
+
+import time
+from collections import Counter
+
+from bench_action_decoding import ACTIONS, build_transcript
+
+from warscribe.analytics.dice import DiceTable
+from warscribe.schema.action import FightAction, ShootAction
+
+GAMES = 200
+
+
+def python_histograms(transcripts) -> Counter:
+    counts: Counter = Counter()
+    for transcript in transcripts:
+        for action in transcript.actions:
+            if isinstance(action, (ShootAction, FightAction)):
+                for step, rolls in action.dice_rolls.items():
+                    for value in rolls:
+                        counts[action.actor.faction, step, value] += 1
+    return counts
+
+
+def numpy_histograms(transcripts) -> dict:
+    table = DiceTable.from_transcripts(transcripts)
+    return {
+        step: table.select(step=step).grouped_histogram("faction")
+        for step in table.steps
+    }
+
+
+def timed(fn, *args) -> float:
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    corpus = [build_transcript(ACTIONS)] * GAMES
+    table = DiceTable.from_transcripts(corpus)
+
+    loop = timed(python_histograms, corpus)
+    flatten = timed(DiceTable.from_transcripts, corpus)
+    vectorized = timed(numpy_histograms, corpus)
+    aggregate = timed(lambda: table.grouped_histogram("step"))
+
+    print(f"dice:             {len(table)}")
+    print(f"python loop:      {loop * 1000:8.1f} ms")
+    print(f"flatten + numpy:  {vectorized * 1000:8.1f} ms")
+    print(f"  flatten only:   {flatten * 1000:8.1f} ms")
+    print(f"  aggregate only: {aggregate * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
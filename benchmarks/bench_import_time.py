@@ -0,0 +1,58 @@
+"""
+Benchmark: ``import warscribe`` start-up time.
+
+Times fresh interpreters importing the package (and, for comparison, the
+schema models and the 10th Edition plugin) against a bare interpreter.
+With ``--max-ms`` it exits with status 1 if ``import warscribe`` costs
+more than that over the bare interpreter, for use as a regression check.
+
+Run with::
+
+    python benchmarks/bench_import_time.py [--max-ms 50]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+RUNS = 15
+
+STATEMENTS = {
+    "bare": "pass",
+    "import warscribe": "import warscribe",
+    "warscribe.GameTranscript": "import warscribe; warscribe.GameTranscript",
+    "edition 10th": "from warscribe.edition import get_edition; get_edition('10th')",
+}
+
+
+def median_time(statement: str) -> float:
+    """Median wall time in seconds of a fresh interpreter running ``statement``."""
+    times = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    results = {label: median_time(code) for label, code in STATEMENTS.items()}
+    bare = results["bare"]
+    for label, seconds in results.items():
+        extra = (seconds - bare) * 1000
+        print(f"{label:26} {seconds * 1000:8.1f} ms  (+{extra:6.1f} ms)")
+
+    overhead = (results["import warscribe"] - bare) * 1000
+    if args.max_ms is not None and overhead > args.max_ms:
+        print(f"import warscribe: +{overhead:.1f} ms exceeds {args.max_ms} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark: cost of the instrumentation hooks.
+
+Validates the actions of a 600-action transcript with the 10th Edition
+plugin, one at a time and as a batch, with instrumentation off (the
+default) and on.
+
+Run with::
+
+    python benchmarks/bench_instrumentation.py
+"""
+
+import timeit
+
+from bench_action_decoding import ACTIONS, build_transcript
+
+from warscribe import instrumentation
+from warscribe.edition.tenth import TenthEditionPlugin
+
+REPEAT = 5
+NUMBER = 20
+
+
+def best_time(fn) -> float:
+    """Best per-call time in seconds over ``REPEAT`` rounds."""
+    return min(timeit.repeat(fn, repeat=REPEAT, number=NUMBER)) / NUMBER
+
+
+def measure(plugin, actions) -> tuple[float, float]:
+    single = best_time(lambda: [plugin.validate_action(action) for action in actions])
+    batch = best_time(lambda: plugin.validate_actions(actions))
+    return single, batch
+
+
+def main() -> None:
+    actions = build_transcript(ACTIONS).actions
+    plugin = TenthEditionPlugin()
+
+    off_single, off_batch = measure(plugin, actions)
+    instrumentation.enable()
+    on_single, on_batch = measure(plugin, actions)
+    instrumentation.disable()
+
+    print(f"actions:        {ACTIONS}")
+    print(f"off:            {off_single * 1000:8.2f} ms")
+    print(f"on:             {on_single * 1000:8.2f} ms")
+    print(f"off batch:      {off_batch * 1000:8.2f} ms")
+    print(f"on batch:       {on_batch * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
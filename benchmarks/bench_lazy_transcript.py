@@ -0,0 +1,44 @@
+"""
+Benchmark: lazy metadata access vs. full decoding.
+
+Reads the winner of a 600-action transcript through ``LazyTranscript``
+and through ``GameTranscript.from_json``.
+
+Run with::
+
+    python benchmarks/bench_lazy_transcript.py
+"""
+
+import timeit
+
+from bench_action_decoding import ACTIONS, build_transcript
+
+from warscribe.schema.lazy import LazyTranscript
+from warscribe.schema.transcript import GameTranscript
+
+REPEAT = 5
+NUMBER = 20
+
+
+def best_time(fn) -> float:
+    """Best per-call time in seconds over ``REPEAT`` rounds."""
+    return min(timeit.repeat(fn, repeat=REPEAT, number=NUMBER)) / NUMBER
+
+
+def main() -> None:
+    transcript = build_transcript(ACTIONS)
+    transcript.winner = 1
+    text = transcript.to_json()
+
+    eager = best_time(lambda: GameTranscript.from_json(text).winner)
+    lazy = best_time(lambda: LazyTranscript.from_json(text).winner)
+    one_turn = best_time(lambda: LazyTranscript.from_json(text).get_actions_for_turn(2))
+
+    print(f"actions:          {ACTIONS}")
+    print(f"eager winner:     {eager * 1000:8.3f} ms")
+    print(f"lazy winner:      {lazy * 1000:8.3f} ms  ({eager / lazy:.0f}x)")
+    print(f"lazy single turn: {one_turn * 1000:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
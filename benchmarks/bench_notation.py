@@ -0,0 +1,56 @@
+"""
+Benchmark: bracket notation parsing throughput.
+
+Parses a 40,000-line game in the text notation of ``docs/notation.md``
+from an in-memory stream and reports lines per minute against the
+1M lines/minute target for bulk scorekeeper input.
+
+Run with::
+
+    python benchmarks/bench_notation.py
+"""
+
+import io
+import timeit
+
+from warscribe.serialization import NotationReader
+
+REPEAT = 5
+TURNS = 50
+TARGET_PER_MINUTE = 1_000_000
+
+
+def build_text() -> str:
+    lines = []
+    for turn in range(1, TURNS + 1):
+        lines.append(f"=== Turn {turn} ===")
+        for i in range(160):
+            lines += [
+                f'[MOVE: CPT-{i % 6:02} -> Zone-A, Distance: 6"]',
+                f"[SHOOT: TNK-{i % 6:02} -> Enemy-{i % 5:02}, Result: 3 wounds]",
+                '[CHARGE: TAC-03 -> OBJ-1, Roll: 4+5, Distance: 8", Success]',
+                "[FIGHT: CPT-01 -> Enemy-HQ, Weapon: Relic Blade, Attacks: 6, "
+                "Hits: 5, Wounds: 4, Saves Failed: 2]",
+                "",
+            ]
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    text = build_text()
+    lines = text.count("\n")
+
+    def parse() -> None:
+        for _ in NotationReader().read(io.StringIO(text)):
+            pass
+
+    best = min(timeit.repeat(parse, repeat=REPEAT, number=1))
+    per_minute = lines / best * 60
+    print(f"lines:          {lines}")
+    print(f"parse:          {best * 1000:8.2f} ms")
+    print(f"throughput:     {per_minute / 1e6:8.2f} M lines/min")
+    print(f"target:         {TARGET_PER_MINUTE / 1e6:8.2f} M lines/min")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark: vectorized vs. nested-loop RelativeDistance computation.
+
+Computes relative distances for a turn of 20 moving units against 20
+enemy units, with ``compute_relative_distances`` and with the nested
+Python loops it replaces.
+
+Run with::
+
+    python benchmarks/bench_relative_distances.py
+"""
+
+import math
+import random
+import timeit
+
+from warscribe.analytics.distances import compute_relative_distances
+from warscribe.schema.action import MoveAction, RelativeDistance
+from warscribe.schema.unit import UnitReference
+
+UNITS = 20
+REPEAT = 5
+NUMBER = 200
+
+
+def best_time(fn) -> float:
+    """Best per-call time in seconds over ``REPEAT`` rounds."""
+    return min(timeit.repeat(fn, repeat=REPEAT, number=NUMBER)) / NUMBER
+
+
+def nested_loops(moves, enemies) -> list[list[RelativeDistance]]:
+    results = []
+    for move in moves:
+        distances = []
+        for enemy in enemies:
+            target = (enemy.position_x, enemy.position_y)
+            final = math.dist(move.end_position, target)
+            distances.append(
+                RelativeDistance(
+                    target_unit_id=enemy.id,
+                    target_unit_name=enemy.name,
+                    delta_inches=final - math.dist(move.start_position, target),
+                    final_distance=final,
+                )
+            )
+        results.append(distances)
+    return results
+
+
+def main() -> None:
+    rng = random.Random(0)
+    enemies = [
+        UnitReference(
+            name=f"Boyz {i}",
+            faction="Orks",
+            position_x=rng.uniform(0, 60),
+            position_y=rng.uniform(30, 44),
+        )
+        for i in range(UNITS)
+    ]
+    moves = []
+    for i in range(UNITS):
+        start = (rng.uniform(0, 60), rng.uniform(0, 12))
+        end = (start[0], start[1] + 6)
+        actor = UnitReference(name=f"Marines {i}", faction="Space Marines")
+        moves.append(
+            MoveAction(
+                turn=1,
+                phase="movement",
+                actor=actor,
+                distance_inches=6,
+                start_position=start,
+                end_position=end,
+            )
+        )
+
+    players = {move.actor.id: 1 for move in moves} | {e.id: 2 for e in enemies}
+    loops = best_time(lambda: nested_loops(moves, enemies))
+    vectorized = best_time(
+        lambda: compute_relative_distances(
+            moves, enemies, populate=False, players=players
+        )
+    )
+    print(f"pairs:       {UNITS} x {UNITS}")
+    print(f"loops:       {loops * 1000:8.3f} ms")
+    print(f"vectorized:  {vectorized * 1000:8.3f} ms")
+    print(f"speedup:     {loops / vectorized:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
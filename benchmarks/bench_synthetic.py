@@ -0,0 +1,37 @@
+"""
+Benchmark: synthetic transcript generation throughput.
+
+Generates 500- and 5,000-action games with ``TranscriptGenerator`` and
+reports actions generated per second, clean and with 5% of the actions
+corrupted.
+
+Run with::
+
+    python benchmarks/bench_synthetic.py
+"""
+
+import timeit
+
+from warscribe.corpus import TranscriptGenerator
+
+REPEAT = 5
+GAMES = 10
+
+
+def rate(actions: int, invalid_rate: float = 0.0) -> float:
+    """Best actions per second over ``REPEAT`` rounds of ``GAMES`` games."""
+    generator = TranscriptGenerator(seed=1, actions=actions, invalid_rate=invalid_rate)
+    best = min(
+        timeit.repeat(lambda: list(generator.games(GAMES)), repeat=REPEAT, number=1)
+    )
+    return actions * GAMES / best
+
+
+def main() -> None:
+    for actions in (500, 5000):
+        print(f"{actions:5} actions:       {rate(actions):10,.0f} actions/s")
+        print(f"{actions:5} actions, 5%:   {rate(actions, 0.05):10,.0f} actions/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Benchmark: trusted load vs. validated load.
+
+Compares ``GameTranscript.from_trusted_json`` against ``from_json`` on a
+600-action transcript.
+
+Run with::
+
+    python benchmarks/bench_trusted_load.py
+"""
+
+import timeit
+
+from bench_action_decoding import ACTIONS, build_transcript
+
+from warscribe.schema.transcript import GameTranscript
+
+REPEAT = 5
+NUMBER = 20
+
+
+def best_time(fn) -> float:
+    """Best per-call time in seconds over ``REPEAT`` rounds."""
+    return min(timeit.repeat(fn, repeat=REPEAT, number=NUMBER)) / NUMBER
+
+
+def main() -> None:
+    transcript = build_transcript(ACTIONS)
+    text = transcript.to_json()
+    trusted = transcript.to_trusted_json()
+    assert GameTranscript.from_trusted_json(trusted) == transcript
+
+    validated = best_time(lambda: GameTranscript.from_json(text))
+    unvalidated = best_time(lambda: GameTranscript.from_trusted_json(trusted))
+
+    print(f"actions:    {ACTIONS}")
+    print(f"from_json:  {validated * 1000:8.2f} ms")
+    print(f"trusted:    {unvalidated * 1000:8.2f} ms")
+    print(f"speedup:    {validated / unvalidated:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Benchmark: cached vs. uncached action validation.
+
+Validates the actions of a 600-action transcript with the 10th Edition
+plugin directly and through a warm ``ValidationCache``, one action at a
+time and as a batch. The cache sees the same action objects again, so
+it finds their keys by identity instead of hashing their content.
+
+Run with::
+
+    python benchmarks/bench_validation_cache.py
+"""
+
+import timeit
+
+from bench_action_decoding import ACTIONS, build_transcript
+
+from warscribe.edition import ValidationCache
+from warscribe.edition.tenth import TenthEditionPlugin
+
+REPEAT = 5
+NUMBER = 20
+
+
+def best_time(fn) -> float:
+    """Best per-call time in seconds over ``REPEAT`` rounds."""
+    return min(timeit.repeat(fn, repeat=REPEAT, number=NUMBER)) / NUMBER
+
+
+def main() -> None:
+    actions = build_transcript(ACTIONS).actions
+    plugin = TenthEditionPlugin()
+    cache = ValidationCache(plugin, maxsize=len(actions))
+    cache.validate_actions(actions)
+
+    def single(validator):
+        return lambda: [validator.validate_action(action) for action in actions]
+
+    direct = best_time(single(plugin))
+    cached = best_time(single(cache))
+    direct_batch = best_time(lambda: plugin.validate_actions(actions))
+    cached_batch = best_time(lambda: cache.validate_actions(actions))
+
+    print(f"actions:        {ACTIONS}")
+    print(f"direct:         {direct * 1000:8.2f} ms")
+    print(f"cached:         {cached * 1000:8.2f} ms")
+    print(f"direct batch:   {direct_batch * 1000:8.2f} ms")
+    print(f"cached batch:   {cached_batch * 1000:8.2f} ms")
+    print(f"hit rate:       {cache.hits / (cache.hits + cache.misses):8.2%}")
+
+
+if __name__ == "__main__":
+    main()
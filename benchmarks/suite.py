@@ -0,0 +1,194 @@
+"""
+Benchmark suite: parse, validate, query and serialize at several scales.
+
+Times the core operations on games of 50, 500 and 5,000 actions and on
+corpora of 10 and 100 games, writes the results as JSON and compares
+them with a stored baseline:
+
+- ``parse/N``, ``serialize/N``: ``GameTranscript.from_json`` / ``to_json``
+- ``binary_decode/N``: ``decode_transcript`` of the binary encoding
+- ``validate_action/N``: ``TenthEditionPlugin.validate_action`` per action
+- ``validate_actions/N``: the batch path over the whole game
+- ``actions_for_turn/N``, ``actions_by_unit/N``: indexed lookups
+- ``registry_get``: ``get_edition("10th")``
+- ``corpus/G``: parse and validate ``G`` 500-action games
+
+Each value is the best of several rounds, in seconds per call. A case
+more than ``--tolerance`` (and ``NOISE_FLOOR``) slower than the baseline
+is a regression, as is missing the ROADMAP target of parsing a transcript
+in under 100 ms; either makes the suite exit with status 1. Timings are
+only comparable on one machine, so record a baseline per environment.
+
+Run with::
+
+    python benchmarks/suite.py                          # compare with baseline
+    python benchmarks/suite.py --output results.json    # also save results
+    python benchmarks/suite.py --update-baseline        # record a new baseline
+    python benchmarks/suite.py --quick                  # small sizes only
+"""
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+from bench_action_decoding import build_transcript
+
+import warscribe
+from warscribe.edition import get_edition
+from warscribe.schema.transcript import GameTranscript
+from warscribe.serialization.binary import decode_transcript, encode_transcript
+
+GAME_SIZES = (50, 500, 5000)
+CORPUS_SIZES = (10, 100)
+CORPUS_GAME_SIZE = 500
+REPEAT = 5
+# Differences below this many seconds per call are timer noise.
+NOISE_FLOOR = 5e-6
+
+BASELINE = Path(__file__).with_name("baseline.json")
+
+# ROADMAP.md: "<100ms transcript parse", for a tournament-sized game.
+TARGETS = {"parse/500": 0.100}
+
+
+def best_time(fn: Callable[[], object]) -> float:
+    """Best per-call time in seconds, auto-scaling the calls per round."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=REPEAT, number=number)) / number
+
+
+def game_cases(size: int) -> dict[str, Callable[[], object]]:
+    transcript = build_transcript(size)
+    text = transcript.to_json()
+    data = encode_transcript(transcript)
+    actions = transcript.actions
+    plugin = get_edition("10th")
+    unit_id = actions[0].actor.id
+    transcript.get_actions_for_turn(1)
+
+    def validate_each() -> None:
+        for action in actions:
+            plugin.validate_action(action)
+
+    return {
+        f"parse/{size}": lambda: GameTranscript.from_json(text),
+        f"serialize/{size}": transcript.to_json,
+        f"binary_decode/{size}": lambda: decode_transcript(data),
+        f"validate_action/{size}": validate_each,
+        f"validate_actions/{size}": lambda: plugin.validate_actions(actions),
+        f"actions_for_turn/{size}": lambda: transcript.get_actions_for_turn(1),
+        f"actions_by_unit/{size}": lambda: transcript.get_actions_by_unit(unit_id),
+    }
+
+
+def corpus_case(games: int) -> dict[str, Callable[[], object]]:
+    texts = [build_transcript(CORPUS_GAME_SIZE).to_json() for _ in range(games)]
+    plugin = get_edition("10th")
+
+    def run() -> None:
+        for text in texts:
+            plugin.validate_actions(GameTranscript.from_json(text).actions)
+
+    return {f"corpus/{games}": run}
+
+
+def run_suite(game_sizes, corpus_sizes) -> dict[str, float]:
+    """Time every case; returns seconds per call by case name."""
+    cases: dict[str, Callable[[], object]] = {
+        "registry_get": lambda: get_edition("10th")
+    }
+    for size in game_sizes:
+        cases.update(game_cases(size))
+    for games in corpus_sizes:
+        cases.update(corpus_case(games))
+
+    results = {}
+    for name, fn in cases.items():
+        results[name] = best_time(fn)
+        print(f"  {name:24} {results[name] * 1000:10.3f} ms", file=sys.stderr)
+    return results
+
+
+def metadata() -> dict[str, str]:
+    return {
+        "warscribe": warscribe.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+
+
+def compare(
+    results: dict[str, float], baseline: dict[str, float], tolerance: float
+) -> list[str]:
+    """Print a comparison table; returns the regressed cases."""
+    regressions = []
+    print(f"{'case':24} {'baseline ms':>12} {'current ms':>12} {'ratio':>7}")
+    for name, seconds in results.items():
+        before = baseline.get(name)
+        if before is None:
+            print(f"{name:24} {'-':>12} {seconds * 1000:12.3f} {'new':>7}")
+            continue
+        ratio = seconds / before
+        flag = ""
+        if ratio > 1 + tolerance and seconds - before > NOISE_FLOOR:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(
+            f"{name:24} {before * 1000:12.3f} {seconds * 1000:12.3f} {ratio:7.2f}{flag}"
+        )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="WARScribe benchmark suite.")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--tolerance", type=float, default=0.5)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument(
+        "--quick", action="store_true", help="50/500 actions, 10 games only"
+    )
+    args = parser.parse_args()
+
+    game_sizes = GAME_SIZES[:2] if args.quick else GAME_SIZES
+    corpus_sizes = CORPUS_SIZES[:1] if args.quick else CORPUS_SIZES
+    results = run_suite(game_sizes, corpus_sizes)
+    report = {"meta": metadata(), "results": results}
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Baseline written to {args.baseline}.")
+        return 0
+
+    failures = [
+        f"{name}: {results[name] * 1000:.1f} ms exceeds the "
+        f"{limit * 1000:.0f} ms target"
+        for name, limit in TARGETS.items()
+        if name in results and results[name] > limit
+    ]
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())["results"]
+        failures += [
+            f"{name}: slower than baseline by more than {args.tolerance:.0%}"
+            for name in compare(results, baseline, args.tolerance)
+        ]
+    else:
+        print(f"No baseline at {args.baseline}; run with --update-baseline.")
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,18 +2,25 @@
 WARScribe-Core: The notation engine for Warhammer gameplay.
 
 Edition-agnostic action notation for recording games.
+
+The public names below are imported on first access, so ``import
+warscribe`` itself does not load pydantic or build the schema models.
 """
 
-from warscribe.schema.action import (
-    Action,
-    ActionType,
-    ChargeAction,
-    FightAction,
-    MoveAction,
-    ShootAction,
-)
-from warscribe.schema.transcript import GameTranscript
-from warscribe.schema.unit import UnitReference
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from warscribe.schema.action import (
+        Action,
+        ActionType,
+        ChargeAction,
+        FightAction,
+        MoveAction,
+        ShootAction,
+    )
+    from warscribe.schema.transcript import GameTranscript
+    from warscribe.schema.unit import UnitReference
 
 __version__ = "0.1.0"
 
@@ -27,3 +34,37 @@ __all__ = [
     "ShootAction",
     "UnitReference",
 ]
+
+# Module defining each lazily imported name.
+_LAZY = {
+    "Action": "warscribe.schema.action",
+    "ActionType": "warscribe.schema.action",
+    "ChargeAction": "warscribe.schema.action",
+    "FightAction": "warscribe.schema.action",
+    "MoveAction": "warscribe.schema.action",
+    "ShootAction": "warscribe.schema.action",
+    "GameTranscript": "warscribe.schema.transcript",
+    "UnitReference": "warscribe.schema.unit",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is not None:
+        value = getattr(import_module(module), name)
+    else:
+        # Submodules, as ``import_module`` would find them.
+        try:
+            value = import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as exc:
+            if exc.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY})
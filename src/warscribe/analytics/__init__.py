@@ -0,0 +1,23 @@
+"""
+Analytics for WARScribe transcripts.
+
+Requires NumPy, installed with the ``analytics`` extra::
+
+    pip install warscribe-core[analytics]
+"""
+
+try:
+    import numpy  # noqa: F401
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "warscribe.analytics requires NumPy; "
+        "install it with 'pip install warscribe-core[analytics]'."
+    ) from exc
+
+from warscribe.analytics.dice import DiceTable
+from warscribe.analytics.distances import compute_relative_distances
+
+__all__ = [
+    "DiceTable",
+    "compute_relative_distances",
+]
@@ -0,0 +1,231 @@
+"""
+Vectorized dice statistics.
+
+``DiceTable`` flattens the ``dice_rolls`` of every ``ShootAction`` and
+``FightAction`` in one or more transcripts into contiguous NumPy arrays:
+one entry per die, with parallel key arrays for the roll step ("hit",
+"wound", ...), turn, player, actor faction, weapon and game. String keys
+are stored as integer codes into the table's label lists.
+
+Aggregations (histograms, success rates, grouped variants) are single
+``bincount`` calls over those arrays, and ``select`` narrows a table with
+boolean masks, so no statistic loops over dice in Python.
+"""
+
+from dataclasses import dataclass
+from typing import Iterable, Optional, Union
+
+import numpy as np
+
+from warscribe.schema.action import FightAction, ShootAction
+from warscribe.schema.transcript import GameTranscript
+
+_GROUPS = ("step", "turn", "player", "faction", "weapon", "game")
+
+
+class _Codes:
+    """Assigns consecutive integer codes to labels."""
+
+    def __init__(self) -> None:
+        self.codes: dict[str, int] = {}
+
+    def __call__(self, label: str) -> int:
+        code = self.codes.get(label)
+        if code is None:
+            code = self.codes[label] = len(self.codes)
+        return code
+
+    @property
+    def labels(self) -> list[str]:
+        return list(self.codes)
+
+
+def _player_of(transcript: GameTranscript) -> dict:
+    """Map unit ids, then factions, to player number."""
+    players: dict = {}
+    for number, player in ((2, transcript.player2), (1, transcript.player1)):
+        if transcript.player1.faction != transcript.player2.faction:
+            players[player.faction] = number
+        for unit in player.units:
+            players[unit.id] = number
+    return players
+
+
+@dataclass
+class DiceTable:
+    """
+    Every recorded die of a set of transcripts, one array entry per die.
+
+    ``values`` holds the die faces. ``step``, ``faction``, ``weapon`` and
+    ``game`` are codes into ``steps``, ``factions``, ``weapons`` and
+    ``game_ids``; ``turn`` is the turn number and ``player`` is 1 or 2
+    (0 if the actor's side is unknown).
+    """
+
+    values: np.ndarray
+    step: np.ndarray
+    turn: np.ndarray
+    player: np.ndarray
+    faction: np.ndarray
+    weapon: np.ndarray
+    game: np.ndarray
+    steps: list[str]
+    factions: list[str]
+    weapons: list[str]
+    game_ids: list[str]
+
+    @classmethod
+    def from_transcript(cls, transcript: GameTranscript) -> "DiceTable":
+        """Flatten the dice of one transcript."""
+        return cls.from_transcripts([transcript])
+
+    @classmethod
+    def from_transcripts(cls, transcripts: Iterable[GameTranscript]) -> "DiceTable":
+        """Flatten the dice of many transcripts into one table."""
+        steps, factions, weapons = _Codes(), _Codes(), _Codes()
+        game_ids: list[str] = []
+        values: list[int] = []
+        lengths: list[int] = []
+        # One row per (action, step) run of dice, expanded at the end.
+        runs: list[tuple[int, int, int, int, int, int]] = []
+
+        for game, transcript in enumerate(transcripts):
+            game_ids.append(str(transcript.id))
+            players = _player_of(transcript)
+            for action in transcript.actions:
+                if not isinstance(action, (ShootAction, FightAction)):
+                    continue
+                actor = action.actor
+                player = players.get(actor.id) or players.get(actor.faction, 0)
+                faction = factions(actor.faction)
+                weapon = weapons(action.weapon_name)
+                for name, rolls in action.dice_rolls.items():
+                    if not rolls:
+                        continue
+                    values.extend(rolls)
+                    lengths.append(len(rolls))
+                    runs.append(
+                        (steps(name), action.turn, player, faction, weapon, game)
+                    )
+
+        keys = np.array(runs, dtype=np.int32).reshape(-1, 6)
+        counts = np.array(lengths, dtype=np.intp)
+        expanded = np.repeat(keys, counts, axis=0)
+        return cls(
+            values=np.array(values, dtype=np.int32),
+            step=expanded[:, 0],
+            turn=expanded[:, 1],
+            player=expanded[:, 2],
+            faction=expanded[:, 3],
+            weapon=expanded[:, 4],
+            game=expanded[:, 5],
+            steps=steps.labels,
+            factions=factions.labels,
+            weapons=weapons.labels,
+            game_ids=game_ids,
+        )
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def _labels(self, by: str) -> list:
+        if by == "step":
+            return self.steps
+        if by == "faction":
+            return self.factions
+        if by == "weapon":
+            return self.weapons
+        if by == "game":
+            return self.game_ids
+        if by == "player":
+            return [0, 1, 2]
+        if by == "turn":
+            return list(range(int(self.turn.max(initial=0)) + 1))
+        raise ValueError(f"Cannot group by '{by}'; use one of {', '.join(_GROUPS)}.")
+
+    def _mask(self, mask: np.ndarray) -> "DiceTable":
+        return DiceTable(
+            values=self.values[mask],
+            step=self.step[mask],
+            turn=self.turn[mask],
+            player=self.player[mask],
+            faction=self.faction[mask],
+            weapon=self.weapon[mask],
+            game=self.game[mask],
+            steps=self.steps,
+            factions=self.factions,
+            weapons=self.weapons,
+            game_ids=self.game_ids,
+        )
+
+    def select(
+        self,
+        step: Optional[str] = None,
+        faction: Optional[str] = None,
+        weapon: Optional[str] = None,
+        player: Optional[int] = None,
+        turn: Optional[int] = None,
+    ) -> "DiceTable":
+        """Dice matching every given key, sharing this table's labels."""
+        mask = np.ones(len(self), dtype=bool)
+        for codes, labels, label in (
+            (self.step, self.steps, step),
+            (self.faction, self.factions, faction),
+            (self.weapon, self.weapons, weapon),
+        ):
+            if label is not None:
+                if label not in labels:
+                    mask[:] = False
+                    break
+                mask &= codes == labels.index(label)
+        if player is not None:
+            mask &= self.player == player
+        if turn is not None:
+            mask &= self.turn == turn
+        return self._mask(mask)
+
+    def histogram(self, faces: int = 6, normalize: bool = False) -> np.ndarray:
+        """
+        Count of each face, ``result[i]`` being face ``i + 1``.
+
+        Values outside ``1..faces`` are ignored. With ``normalize`` the
+        counts are divided by their total.
+        """
+        valid = (self.values >= 1) & (self.values <= faces)
+        counts = np.bincount(self.values[valid] - 1, minlength=faces)
+        if normalize:
+            return counts / max(counts.sum(), 1)
+        return counts
+
+    def grouped_histogram(
+        self, by: str, faces: int = 6, normalize: bool = False
+    ) -> dict[Union[str, int], np.ndarray]:
+        """
+        Face counts per group, e.g. ``by="player"`` for per-player
+        distributions. Groups with no dice are omitted.
+        """
+        labels = self._labels(by)
+        codes = getattr(self, by)
+        valid = (self.values >= 1) & (self.values <= faces)
+        flat = codes[valid].astype(np.intp) * faces + (self.values[valid] - 1)
+        counts = np.bincount(flat, minlength=len(labels) * faces).reshape(-1, faces)
+        totals = counts.sum(axis=1)
+        if normalize:
+            counts = counts / np.maximum(totals, 1)[:, None]
+        return {labels[i]: counts[i] for i in np.flatnonzero(totals)}
+
+    def success_rate(self, target: int) -> float:
+        """Fraction of dice rolling ``target`` or more (NaN if none)."""
+        if not len(self):
+            return float("nan")
+        return float(np.count_nonzero(self.values >= target) / len(self))
+
+    def grouped_success_rate(
+        self, by: str, target: int
+    ) -> dict[Union[str, int], float]:
+        """``success_rate`` per group; groups with no dice are omitted."""
+        labels = self._labels(by)
+        codes = getattr(self, by)
+        totals = np.bincount(codes, minlength=len(labels))
+        hits = np.bincount(codes[self.values >= target], minlength=len(labels))
+        return {labels[i]: float(hits[i] / totals[i]) for i in np.flatnonzero(totals)}
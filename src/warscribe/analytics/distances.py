@@ -0,0 +1,128 @@
+"""
+Vectorized ``RelativeDistance`` computation.
+
+``compute_relative_distances`` takes a batch of moves (typically one
+turn's) and the units to measure against, and computes every
+move/reference distance at once with NumPy broadcasting: an
+``(moves, references)`` matrix of start distances, one of end distances,
+and their difference.
+
+For each move and reference unit, ``final_distance`` is the distance from
+``end_position`` and ``delta_inches`` is that minus the distance from
+``start_position`` (negative = moved closer), matching the convention of
+``RelativeDistance``.
+
+Enemies are told apart by player, not faction, so mirror matches and
+units named after a chapter or subfaction are handled: each unit's
+player comes from the ``players`` mapping if given, else from its
+``UnitState.player``.
+"""
+
+from typing import Mapping, Optional, Sequence, Union
+from uuid import UUID
+
+import numpy as np
+
+from warscribe.schema.action import MoveAction, RelativeDistance
+from warscribe.schema.trusted import construct
+from warscribe.schema.unit import UnitReference
+from warscribe.state.reducer import UnitState
+
+Reference = Union[UnitReference, UnitState]
+
+
+def _position(unit: Reference) -> Optional[tuple[float, float]]:
+    if isinstance(unit, UnitState):
+        return unit.position
+    if unit.position_x is None or unit.position_y is None:
+        return None
+    return unit.position_x, unit.position_y
+
+
+def compute_relative_distances(
+    moves: Sequence[MoveAction],
+    references: Sequence[Reference],
+    enemies_only: bool = True,
+    populate: bool = True,
+    players: Optional[Mapping[UUID, int]] = None,
+) -> list[list[RelativeDistance]]:
+    """
+    Relative distances from each move to each reference unit.
+
+    Moves without both a start and an end position, and references without
+    a position, are skipped. A unit is never measured against itself; with
+    ``enemies_only`` (the default) references of the mover's own player
+    are skipped too. ``players`` maps unit ids to player numbers (1 or 2),
+    for movers and for references that are not ``UnitState``; with
+    ``enemies_only`` a ``ValueError`` is raised if any unit's player is
+    unknown. With ``populate`` each move's ``relative_distances`` is
+    replaced by the result; moves that were skipped are left as they are.
+
+    Returns one list per move, in order.
+    """
+    results: list[list[RelativeDistance]] = [[] for _ in moves]
+    measured = [
+        i
+        for i, move in enumerate(moves)
+        if move.start_position is not None and move.end_position is not None
+    ]
+    placed = [
+        (unit, position)
+        for unit in references
+        if (position := _position(unit)) is not None
+    ]
+    if not measured or not placed:
+        return results
+
+    starts = np.array([moves[i].start_position for i in measured], dtype=float)
+    ends = np.array([moves[i].end_position for i in measured], dtype=float)
+    points = np.array([position for _, position in placed], dtype=float)
+
+    # (moves, references, xy) differences, reduced to distances.
+    final = np.hypot(*np.moveaxis(ends[:, None, :] - points[None, :, :], -1, 0))
+    initial = np.hypot(*np.moveaxis(starts[:, None, :] - points[None, :, :], -1, 0))
+    delta = final - initial
+
+    codes = {unit.id: code for code, (unit, _) in enumerate(placed)}
+    actors = np.array([codes.get(moves[i].actor.id, -1) for i in measured])
+    keep = actors[:, None] != np.arange(len(placed))[None, :]
+    if enemies_only:
+        known = {
+            unit.id: unit.player
+            for unit in references
+            if isinstance(unit, UnitState) and unit.player
+        }
+        if players is not None:
+            known.update(players)
+        actor_players = [known.get(moves[i].actor.id, 0) for i in measured]
+        unit_players = [known.get(unit.id, 0) for unit, _ in placed]
+        if 0 in actor_players or 0 in unit_players:
+            raise ValueError(
+                "enemies_only needs the player of every unit: pass UnitState "
+                "references or a players mapping."
+            )
+        keep &= np.array(actor_players)[:, None] != np.array(unit_players)[None, :]
+
+    # The values are valid by construction (finite, final distance >= 0),
+    # so the models are built without re-running validation.
+    delta_rows = delta.tolist()
+    final_rows = final.tolist()
+    for row, i in enumerate(measured):
+        deltas = delta_rows[row]
+        finals = final_rows[row]
+        distances = [
+            construct(
+                RelativeDistance,
+                {
+                    "target_unit_id": placed[column][0].id,
+                    "target_unit_name": placed[column][0].name,
+                    "delta_inches": deltas[column],
+                    "final_distance": finals[column],
+                },
+            )
+            for column in np.flatnonzero(keep[row]).tolist()
+        ]
+        results[i] = distances
+        if populate:
+            moves[i].relative_distances = distances
+    return results
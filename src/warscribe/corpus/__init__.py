@@ -0,0 +1,27 @@
+"""
+Corpus tools for WARScribe.
+
+Operations over many transcripts at once: archives, JSON files or
+in-memory transcripts, and synthetic games to run them on.
+"""
+
+from warscribe.corpus.pipeline import (
+    GameSummary,
+    load_transcript,
+    validate_corpus,
+    validate_file,
+)
+from warscribe.corpus.query import CorpusQuery, QueryMatch
+from warscribe.corpus.synthetic import ArmySpec, SyntheticGame, TranscriptGenerator
+
+__all__ = [
+    "ArmySpec",
+    "CorpusQuery",
+    "GameSummary",
+    "QueryMatch",
+    "SyntheticGame",
+    "TranscriptGenerator",
+    "load_transcript",
+    "validate_corpus",
+    "validate_file",
+]
@@ -0,0 +1,146 @@
+"""
+Parallel corpus validation.
+
+``validate_corpus`` shards transcript files across a process pool. Each
+worker loads and validates whole files and sends back a small
+``GameSummary`` of plain values (counts, and a capped list of error
+messages) rather than the transcript models, so the cost of moving
+results between processes does not depend on game size.
+
+Files may hold a JSON transcript, a trusted transcript or a binary
+transcript; the format is recognised from the first bytes.
+"""
+
+import multiprocessing
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+
+from pydantic import ValidationError
+
+from warscribe.edition import get_edition
+from warscribe.edition.plugin import EditionPlugin
+from warscribe.schema.transcript import GameTranscript
+from warscribe.serialization.binary import MAGIC, decode_transcript
+
+_TRUSTED_MARKER = b"#warscribe-trusted"
+
+# Plugin shared by every file handled in this worker process, if any.
+_worker_plugin: Optional[EditionPlugin] = None
+
+
+@dataclass
+class GameSummary:
+    """Validation summary for one transcript file."""
+
+    path: str
+    game_id: Optional[str] = None
+    edition: Optional[str] = None
+    action_count: int = 0
+    invalid_count: int = 0
+    warning_count: int = 0
+    errors: list[tuple[int, str]] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def is_valid(self) -> bool:
+        """True if the file loaded and every action is valid."""
+        return self.error is None and self.invalid_count == 0
+
+
+def load_transcript(path: Union[str, Path]) -> GameTranscript:
+    """Load a JSON, trusted or binary transcript file."""
+    data = Path(path).read_bytes()
+    if data.startswith(MAGIC):
+        return decode_transcript(data)
+    text = data.decode("utf-8")
+    if data.startswith(_TRUSTED_MARKER):
+        return GameTranscript.from_trusted_json(text)
+    return GameTranscript.from_json(text)
+
+
+def validate_file(
+    path: Union[str, Path],
+    plugin: Optional[EditionPlugin] = None,
+    max_errors: int = 20,
+) -> GameSummary:
+    """
+    Load and validate one transcript file.
+
+    Without a ``plugin`` the edition plugin registered for the
+    transcript's ``edition`` is used. At most ``max_errors`` messages are
+    kept, as ``(action index, message)`` pairs; the counts are always
+    complete.
+    """
+    summary = GameSummary(path=str(path))
+    try:
+        transcript = load_transcript(path)
+    except (OSError, UnicodeDecodeError, ValidationError, ValueError) as exc:
+        summary.error = f"{type(exc).__name__}: {exc}"
+        return summary
+
+    summary.game_id = str(transcript.id)
+    summary.edition = transcript.edition
+    summary.action_count = len(transcript.actions)
+    if plugin is None:
+        plugin = get_edition(transcript.edition)
+        if plugin is None:
+            summary.error = f"No plugin for edition '{transcript.edition}'."
+            return summary
+
+    batch = plugin.validate_actions(transcript.actions)
+    summary.invalid_count = batch.status.count(batch.INVALID)
+    summary.warning_count = batch.status.count(batch.WARNING)
+    for index in sorted(batch.errors):
+        for message in batch.errors[index]:
+            if len(summary.errors) == max_errors:
+                return summary
+            summary.errors.append((index, message))
+    return summary
+
+
+def _init_worker(plugin: Optional[EditionPlugin]) -> None:
+    global _worker_plugin
+    _worker_plugin = plugin
+
+
+def _validate_in_worker(task: tuple[str, int]) -> GameSummary:
+    path, max_errors = task
+    return validate_file(path, _worker_plugin, max_errors)
+
+
+def validate_corpus(
+    paths: Iterable[Union[str, Path]],
+    plugin: Optional[EditionPlugin] = None,
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    max_errors: int = 20,
+    start_method: Optional[str] = None,
+) -> Iterator[GameSummary]:
+    """
+    Validate many transcript files in parallel.
+
+    Summaries are yielded as workers finish them, not in input order.
+    ``workers`` defaults to the CPU count; with ``workers=1`` files are
+    validated in this process. ``chunksize`` (files sent to a worker at a
+    time) defaults to a value that gives each worker several chunks.
+    ``start_method`` (``"fork"``, ``"spawn"`` or ``"forkserver"``) picks
+    how workers are started, by default as ``multiprocessing`` does; under
+    spawn and forkserver the ``plugin`` is pickled to each worker.
+    """
+    tasks = [(str(path), max_errors) for path in paths]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(tasks)))
+
+    if workers == 1:
+        for path, _ in tasks:
+            yield validate_file(path, plugin, max_errors)
+        return
+
+    if chunksize is None:
+        chunksize = max(1, len(tasks) // (workers * 8))
+    context = multiprocessing.get_context(start_method)
+    with context.Pool(workers, initializer=_init_worker, initargs=(plugin,)) as pool:
+        yield from pool.imap_unordered(_validate_in_worker, tasks, chunksize)
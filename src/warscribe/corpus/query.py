@@ -0,0 +1,213 @@
+"""
+Corpus-level action queries.
+
+A ``CorpusQuery`` combines game predicates (edition, factions, winner)
+with action predicates (type, phase, turn range, actor and target
+faction, weapon, result) and runs them over many transcripts at once::
+
+    query = CorpusQuery(
+        action_types={ActionType.SHOOT},
+        weapon_name="Bolt Rifle",
+        target_faction="Orks",
+        min_turn=2,
+    )
+    for match in query.run(archive):
+        ...
+
+Predicates are pushed down as far as the source allows. Games whose
+metadata (edition, player factions, winner) cannot match are skipped
+before any action is decoded: for a
+``GameArchive`` that uses the index entries, for JSON input the
+``LazyTranscript`` header. For JSON input the turn range is also checked
+before each action is decoded.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Union,
+)
+from uuid import UUID
+
+from warscribe.schema.action import (
+    Action,
+    ActionResult,
+    ActionType,
+    ChargeAction,
+    FightAction,
+    ShootAction,
+)
+from warscribe.schema.lazy import LazyTranscript
+from warscribe.schema.transcript import GameTranscript
+from warscribe.serialization.archive import GameArchive
+
+CorpusItem = Union[GameTranscript, LazyTranscript, str, Path]
+Corpus = Union[GameArchive, Iterable[CorpusItem]]
+
+
+class QueryMatch(NamedTuple):
+    """An action matched by a query."""
+
+    game_id: UUID
+    index: int
+    action: Action
+
+
+def _target_factions(action: Action) -> tuple[str, ...]:
+    if isinstance(action, (ShootAction, FightAction)):
+        return (action.target.faction,)
+    if isinstance(action, ChargeAction):
+        return tuple(unit.faction for unit in action.targets)
+    return ()
+
+
+@dataclass
+class CorpusQuery:
+    """
+    Predicates over games and their actions.
+
+    Unset predicates match everything. ``factions`` requires every listed
+    faction to be playing; ``where`` is an extra action predicate applied
+    after all the others.
+    """
+
+    # Game predicates
+    edition: Optional[str] = None
+    factions: frozenset[str] = frozenset()
+    winner: Optional[int] = None
+
+    # Action predicates
+    action_types: frozenset[ActionType] = frozenset()
+    phases: frozenset[str] = frozenset()
+    min_turn: Optional[int] = None
+    max_turn: Optional[int] = None
+    actor_faction: Optional[str] = None
+    target_faction: Optional[str] = None
+    weapon_name: Optional[str] = None
+    result: Optional[ActionResult] = None
+    where: Optional[Callable[[Action], bool]] = None
+
+    def __post_init__(self) -> None:
+        self.factions = frozenset(self.factions)
+        self.action_types = frozenset(ActionType(t) for t in self.action_types)
+        self.phases = frozenset(self.phases)
+        if self.result is not None:
+            self.result = ActionResult(self.result)
+
+    def matches_game(
+        self,
+        edition: str,
+        factions: Iterable[str],
+        winner: Optional[int],
+        action_count: Optional[int] = None,
+    ) -> bool:
+        """Whether a game with this metadata can contain a match."""
+        if action_count == 0:
+            return False
+        if self.edition is not None and edition != self.edition:
+            return False
+        if self.winner is not None and winner != self.winner:
+            return False
+        # Unit factions need not equal the players' (a chapter or subfaction
+        # of the army), so actor and target faction are checked per action.
+        return self.factions <= set(factions)
+
+    def matches_turn(self, turn: int) -> bool:
+        """Whether an action in ``turn`` can match."""
+        if self.min_turn is not None and turn < self.min_turn:
+            return False
+        return self.max_turn is None or turn <= self.max_turn
+
+    def matches(self, action: Action) -> bool:
+        """Whether ``action`` matches the action predicates."""
+        if self.action_types and action.action_type not in self.action_types:
+            return False
+        if self.phases and action.phase not in self.phases:
+            return False
+        if not self.matches_turn(action.turn):
+            return False
+        if self.result is not None and action.result != self.result:
+            return False
+        if (
+            self.actor_faction is not None
+            and action.actor.faction != self.actor_faction
+        ):
+            return False
+        if self.weapon_name is not None and (
+            getattr(action, "weapon_name", None) != self.weapon_name
+        ):
+            return False
+        if (
+            self.target_faction is not None
+            and self.target_faction not in _target_factions(action)
+        ):
+            return False
+        return self.where is None or self.where(action)
+
+    def _matches_transcript(
+        self, transcript: Union[GameTranscript, LazyTranscript]
+    ) -> bool:
+        return self.matches_game(
+            transcript.edition,
+            (transcript.player1.faction, transcript.player2.faction),
+            transcript.winner,
+        )
+
+    def _search_transcript(self, transcript: GameTranscript) -> Iterator[QueryMatch]:
+        if not self._matches_transcript(transcript):
+            return
+        for index, action in enumerate(transcript.actions):
+            if self.matches(action):
+                yield QueryMatch(transcript.id, index, action)
+
+    def _search_lazy(self, transcript: LazyTranscript) -> Iterator[QueryMatch]:
+        if not self._matches_transcript(transcript):
+            return
+        actions = transcript.actions
+        check_turns = self.min_turn is not None or self.max_turn is not None
+        turns = actions.turns() if check_turns else None
+        for index in range(len(actions)):
+            if turns is not None and not self.matches_turn(turns[index]):
+                continue
+            action = actions[index]
+            if self.matches(action):
+                yield QueryMatch(transcript.id, index, action)
+
+    def _search_archive(self, archive: GameArchive) -> Iterator[QueryMatch]:
+        for index, entry in enumerate(archive.entries()):
+            if self.matches_game(
+                entry.edition,
+                (entry.player1_faction, entry.player2_faction),
+                entry.winner,
+                entry.action_count,
+            ):
+                yield from self._search_transcript(archive[index])
+
+    def run(self, corpus: Corpus) -> Iterator[QueryMatch]:
+        """
+        Yield every matching action in ``corpus``.
+
+        ``corpus`` is a ``GameArchive`` or an iterable of transcripts,
+        lazy transcripts, JSON strings or paths to JSON files.
+        """
+        if isinstance(corpus, GameArchive):
+            yield from self._search_archive(corpus)
+            return
+        for item in corpus:
+            if isinstance(item, GameTranscript):
+                yield from self._search_transcript(item)
+                continue
+            if isinstance(item, Path):
+                item = item.read_text(encoding="utf-8")
+            if isinstance(item, str):
+                item = LazyTranscript.from_json(item)
+            yield from self._search_lazy(item)
+
+    def count(self, corpus: Corpus) -> int:
+        """Number of matching actions in ``corpus``."""
+        return sum(1 for _ in self.run(corpus))
@@ -0,0 +1,396 @@
+"""
+Synthetic transcripts for load and fuzz testing.
+
+``TranscriptGenerator`` builds realistic 10th Edition games from a seed:
+two armies of configurable composition take alternating player turns,
+moving, shooting, charging and fighting in legal phase order, with dice
+rolled for every step and results derived from the dice. The same seed
+and game index always give the same transcript, ids and timestamps
+included, and games can be streamed without bound.
+
+With ``invalid_rate`` a share of the actions is corrupted so that
+``TenthEditionPlugin`` rejects them (more hits than shots, a charge die
+of 7, an action in the wrong phase, ...); ``SyntheticGame.invalid``
+lists their indices.
+
+Models are built with the trusted ``construct``, since every value is
+valid by construction (or deliberately invalid, but schema-correct).
+As with ``from_json``, every roster entry, actor and target is its own
+``UnitReference``; units keep their deployment position and starting
+wounds and models.
+
+``benchmarks/bench_synthetic.py`` measures about 65,000-80,000 actions
+per second on a typical development machine. Building the unit copies is
+about a third of that time.
+"""
+
+import math
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from itertools import accumulate
+from typing import Iterator, NamedTuple, Optional, Sequence
+from uuid import UUID
+
+from warscribe.schema.action import (
+    ActionResult,
+    ActionType,
+    ChargeAction,
+    FightAction,
+    MoveAction,
+    ShootAction,
+)
+from warscribe.schema.transcript import GameTranscript, Player
+from warscribe.schema.trusted import construct, uuid_from_int
+from warscribe.schema.unit import UnitReference
+
+TABLE_WIDTH = 60.0
+TABLE_HEIGHT = 44.0
+
+_START = datetime(2024, 1, 1, 10, 0)
+# Time between consecutive actions, 5 to 89 seconds.
+_GAPS = [timedelta(seconds=seconds) for seconds in range(5, 90)]
+
+# Version 4 UUID bits: version nibble and RFC 4122 variant.
+_UUID_CLEAR = ~((0xF000 << 64) | (0xC000 << 48))
+_UUID_V4 = (0x4000 << 64) | (0x8000 << 48)
+_ID_COUNTER = (1 << 48) - 1
+
+# Most dice rolled for one step, and the span of the per-game dice buffer
+# that slices start in. The buffer is filled from random bytes; 252 is the
+# largest multiple of 6 in a byte, so bytes from 252 up are dropped.
+_MAX_DICE = 12
+_DICE_SPAN = 1024
+_DICE_BYTES = 1100
+_DICE_LIMIT = 252
+
+# Share of each player turn's actions spent in each phase.
+_PHASES = (
+    (0.3, "movement", ActionType.MOVE),
+    (0.35, "shooting", ActionType.SHOOT),
+    (0.1, "charge", ActionType.CHARGE),
+    (0.25, "fight", ActionType.FIGHT),
+)
+_DAMAGE = {1: "1", 2: "2"}
+
+
+@dataclass(frozen=True)
+class ArmySpec:
+    """
+    Composition of one synthetic army.
+
+    Each unit has ``models`` models of ``wounds`` wounds; ``skill`` is the
+    hit roll needed (BS/WS) and ``save`` the armour save.
+    """
+
+    faction: str
+    units: Sequence[str] = (
+        "Intercessors",
+        "Assault Intercessors",
+        "Hellblasters",
+        "Aggressors",
+        "Eradicators",
+        "Captain",
+    )
+    models: int = 5
+    wounds: int = 2
+    skill: int = 3
+    save: int = 3
+
+    def __post_init__(self) -> None:
+        if not self.units:
+            raise ValueError("An army needs at least one unit.")
+        if not 2 <= self.skill <= 6 or not 2 <= self.save <= 7:
+            raise ValueError("skill must be 2-6 and save 2-7 (7: no save).")
+        if self.models < 1 or self.wounds < 1:
+            raise ValueError("Units need at least one model and one wound.")
+
+
+DEFAULT_ARMIES = (
+    ArmySpec("Space Marines"),
+    ArmySpec(
+        "Orks",
+        units=("Boyz", "Boyz", "Nobz", "Lootas", "Meganobz", "Warboss"),
+        models=10,
+        wounds=1,
+        skill=5,
+        save=5,
+    ),
+)
+
+
+class SyntheticGame(NamedTuple):
+    """A generated transcript and the indices of its corrupted actions."""
+
+    transcript: GameTranscript
+    invalid: list[int]
+
+
+class _Unit:
+    """A generated unit and its running position."""
+
+    __slots__ = ("values", "army", "x", "y")
+
+    def __init__(self, values: dict, army: ArmySpec, x: float, y: float):
+        self.values = values
+        self.army = army
+        self.x = x
+        self.y = y
+
+    def ref(self) -> UnitReference:
+        """A new reference to this unit, for one roster entry or action."""
+        return construct(UnitReference, self.values.copy())
+
+
+class TranscriptGenerator:
+    """
+    Seeded generator of synthetic games.
+
+    ``actions`` is the number of actions per game, spread over
+    ``rounds`` battle rounds (more actions per turn for bigger games).
+    ``invalid_rate`` is the probability of each action being corrupted.
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        actions: int = 500,
+        armies: Sequence[ArmySpec] = DEFAULT_ARMIES,
+        rounds: int = 5,
+        invalid_rate: float = 0.0,
+    ) -> None:
+        if len(armies) != 2:
+            raise ValueError("A game needs exactly two armies.")
+        if actions < 0 or rounds < 1:
+            raise ValueError("actions must be >= 0 and rounds >= 1.")
+        if not 0.0 <= invalid_rate <= 1.0:
+            raise ValueError("invalid_rate must be between 0 and 1.")
+        self.seed = seed
+        self.actions = actions
+        self.armies = tuple(armies)
+        self.rounds = rounds
+        self.invalid_rate = invalid_rate
+
+    def games(self, count: Optional[int] = None) -> Iterator[SyntheticGame]:
+        """Stream games 0, 1, 2, ... (``count`` of them, or forever)."""
+        index = 0
+        while count is None or index < count:
+            yield self.game(index)
+            index += 1
+
+    def transcripts(self, count: Optional[int] = None) -> Iterator[GameTranscript]:
+        """Stream transcripts only, as ``games`` does."""
+        for game in self.games(count):
+            yield game.transcript
+
+    def game(self, index: int) -> SyntheticGame:
+        """Generate game ``index``; deterministic for a given seed."""
+        return _Game(self, random.Random(f"{self.seed}:{index}")).build()
+
+
+class _Game:
+    """State of one game being generated."""
+
+    def __init__(self, spec: TranscriptGenerator, rng: random.Random) -> None:
+        self.spec = spec
+        self.rng = rng
+        self.random = rng.random
+        self.started = self.clock = _START + timedelta(days=rng.randrange(3650))
+        # Buffer of D6 rolls and, per target, prefix counts of rolls below it.
+        self.buffer: list[int] = []
+        while len(self.buffer) < _DICE_SPAN + _MAX_DICE:
+            self.buffer += [
+                byte % 6 + 1
+                for byte in rng.randbytes(_DICE_BYTES)
+                if byte < _DICE_LIMIT
+            ]
+        self.below = [
+            list(accumulate(map(target.__gt__, self.buffer), initial=0))
+            for target in range(8)
+        ]
+        self.actions: list = []
+        self.invalid: list[int] = []
+        self.sides: list[list[_Unit]] = []
+        for side, army in enumerate(spec.armies):
+            # Each side deploys along its own long table edge.
+            y = 6.0 if side == 0 else TABLE_HEIGHT - 6.0
+            units = []
+            for number, name in enumerate(army.units):
+                x = (number + 1) * TABLE_WIDTH / (len(army.units) + 1)
+                values = {
+                    "id": self.uuid(),
+                    "name": name,
+                    "faction": army.faction,
+                    "wounds_remaining": army.models * army.wounds,
+                    "models_remaining": army.models,
+                    "position_x": x,
+                    "position_y": y,
+                }
+                units.append(_Unit(values, army, x, y))
+            self.sides.append(units)
+
+    def uuid(self) -> UUID:
+        bits = self.rng.getrandbits(128) & _UUID_CLEAR | _UUID_V4
+        return uuid_from_int(bits)
+
+    def build(self) -> SyntheticGame:
+        spec = self.spec
+        per_turn = max(1, math.ceil(spec.actions / (spec.rounds * 2)))
+        counts = [max(1, round(per_turn * share)) for share, *_ in _PHASES]
+        builders = {
+            ActionType.MOVE: self.move,
+            ActionType.SHOOT: self.shoot,
+            ActionType.CHARGE: self.charge,
+            ActionType.FIGHT: self.fight,
+        }
+        random = self.random
+        invalid_rate = spec.invalid_rate
+        # Action ids share random high bits and count up in the low 48.
+        ids = self.rng.getrandbits(128) & _UUID_CLEAR & ~_ID_COUNTER | _UUID_V4
+        actions = self.actions
+        turn = 0
+        while len(actions) < spec.actions:
+            turn += 1
+            for side in (0, 1):
+                own, enemy = self.sides[side], self.sides[1 - side]
+                for (_, phase, action_type), count in zip(_PHASES, counts):
+                    build = builders[action_type]
+                    for _ in range(count):
+                        index = len(actions)
+                        if index == spec.actions:
+                            break
+                        actor = own[int(random() * len(own))]
+                        target = enemy[int(random() * len(enemy))]
+                        self.clock += _GAPS[int(random() * len(_GAPS))]
+                        values = {
+                            "id": uuid_from_int(ids | index),
+                            "action_type": action_type,
+                            "turn": turn,
+                            "phase": phase,
+                            "timestamp": self.clock,
+                            "actor": actor.ref(),
+                            "result": ActionResult.SUCCESS,
+                            "notes": None,
+                        }
+                        corrupt = random() < invalid_rate
+                        if corrupt:
+                            self.invalid.append(index)
+                            if random() < 0.25:
+                                # A legal action in a phase that does not
+                                # allow it.
+                                values["phase"] = "command"
+                                corrupt = False
+                        actions.append(build(values, actor, target, corrupt))
+
+        first, second = spec.armies
+        transcript = GameTranscript(
+            id=self.uuid(),
+            player1=Player(
+                name="Player 1",
+                faction=first.faction,
+                units=[unit.ref() for unit in self.sides[0]],
+            ),
+            player2=Player(
+                name="Player 2",
+                faction=second.faction,
+                units=[unit.ref() for unit in self.sides[1]],
+            ),
+            mission="Synthetic",
+            started_at=self.started,
+        )
+        transcript.actions = actions
+        transcript.current_turn = max(turn, 1)
+        return SyntheticGame(transcript, self.invalid)
+
+    def move(
+        self, values: dict, unit: _Unit, target: _Unit, corrupt: bool
+    ) -> MoveAction:
+        random = self.random
+        advance = random() < 0.2
+        distance = round(1.0 + random() * (11.0 if advance else 5.0), 1)
+        angle = random() * math.tau
+        start = (unit.x, unit.y)
+        unit.x = min(max(unit.x + distance * math.cos(angle), 0.0), TABLE_WIDTH)
+        unit.y = min(max(unit.y + distance * math.sin(angle), 0.0), TABLE_HEIGHT)
+        values["distance_inches"] = distance
+        values["start_position"] = start
+        values["end_position"] = (unit.x, unit.y)
+        values["is_advance"] = advance or corrupt
+        values["is_fall_back"] = corrupt
+        values["terrain_crossed"] = []
+        values["relative_distances"] = []
+        return construct(MoveAction, values)
+
+    def charge(
+        self, values: dict, unit: _Unit, target: _Unit, corrupt: bool
+    ) -> ChargeAction:
+        random = self.random
+        first = int(random() * 6) + 1
+        second = 7 if corrupt else int(random() * 6) + 1
+        needed = round(2.0 + random() * 10.0, 1)
+        values["targets"] = [target.ref()]
+        values["charge_roll"] = (first, second)
+        values["distance_needed"] = needed
+        values["made_charge"] = made = first + second >= needed
+        if not made:
+            values["result"] = ActionResult.FAILED
+        return construct(ChargeAction, values)
+
+    def shoot(
+        self, values: dict, unit: _Unit, target: _Unit, corrupt: bool
+    ) -> ShootAction:
+        values["weapon_name"] = "Boltgun"
+        values["shots"] = self.attack(values, unit, target, corrupt)
+        return construct(ShootAction, values)
+
+    def fight(
+        self, values: dict, unit: _Unit, target: _Unit, corrupt: bool
+    ) -> FightAction:
+        values["weapon_name"] = "Close combat weapon"
+        values["attacks"] = self.attack(values, unit, target, corrupt)
+        return construct(FightAction, values)
+
+    def attack(self, values: dict, unit: _Unit, target: _Unit, corrupt: bool) -> int:
+        """Roll an attack into ``values``; returns the number of attacks."""
+        random = self.random
+        buffer = self.buffer
+        defender = target.army
+        count = int(random() * _MAX_DICE) + 1
+        damage = 1 if random() < 0.5 else 2
+
+        # Each step's dice are a buffer slice at a random offset; the prefix
+        # counts give how many of them are below the target.
+        start = int(random() * _DICE_SPAN)
+        below = self.below[unit.army.skill]
+        hit_rolls = buffer[start : start + count]
+        hits = count - (below[start + count] - below[start])
+
+        start = int(random() * _DICE_SPAN)
+        below = self.below[4]
+        wound_rolls = buffer[start : start + hits]
+        wounds = hits - (below[start + hits] - below[start])
+
+        start = int(random() * _DICE_SPAN)
+        below = self.below[defender.save]
+        save_rolls = buffer[start : start + wounds]
+        saves_failed = below[start + wounds] - below[start]
+
+        dealt = saves_failed * damage
+        killed = dealt // defender.wounds
+
+        values["target"] = target.ref()
+        values["weapon_profile"] = {"D": _DAMAGE[damage]}
+        values["modifiers"] = []
+        values["dice_rolls"] = {
+            "hit": hit_rolls,
+            "wound": wound_rolls,
+            "save": save_rolls,
+        }
+        values["hits"] = count + 1 if corrupt else hits
+        values["wounds"] = wounds
+        values["saves_failed"] = saves_failed
+        values["damage_dealt"] = dealt
+        values["models_killed"] = killed if killed < saves_failed else saves_failed
+        if not saves_failed:
+            values["result"] = ActionResult.FAILED
+        return count
@@ -7,20 +7,31 @@ Each edition defines its own phases, action validation, and rules.
 
 from typing import Optional
 
+from warscribe.edition.cache import ValidationCache
 from warscribe.edition.plugin import (
+    BatchValidationResult,
     EditionPlugin,
     GamePhase,
     PhaseDefinition,
+    PhaseTable,
     ValidationResult,
 )
 from warscribe.edition.registry import EditionRegistry
+from warscribe.edition.rules import Rule, RuleTable
+from warscribe.edition.sequence import PhaseSequenceValidator, validate_sequence
 from warscribe.schema.action import Action, ActionType, ActionResult
 
 __all__ = [
+    "BatchValidationResult",
     "EditionPlugin",
     "EditionRegistry",
     "GamePhase",
     "PhaseDefinition",
+    "PhaseSequenceValidator",
+    "PhaseTable",
+    "Rule",
+    "RuleTable",
+    "ValidationCache",
     "ValidationResult",
     "Action",
     "ActionType",
@@ -28,6 +39,7 @@ __all__ = [
     "get_edition_registry",
     "register_edition",
     "get_edition",
+    "validate_sequence",
 ]
 
 
@@ -36,10 +48,16 @@ _registry: Optional[EditionRegistry] = None
 
 
 def get_edition_registry() -> EditionRegistry:
-    """Get the global edition registry."""
+    """
+    Get the global edition registry.
+
+    Created on first use with the built-in and installed editions
+    discovered, but not yet loaded.
+    """
     global _registry
     if _registry is None:
         _registry = EditionRegistry()
+        _registry.discover()
     return _registry
 
 
@@ -0,0 +1,197 @@
+"""
+Content-addressed validation cache.
+
+``ValidationCache`` sits in front of a plugin's ``validate_action`` and
+``validate_actions``. Results are keyed by a hash of the action's content
+together with the plugin's ``edition_code`` and ``plugin_version``, so an
+action that comes back unchanged (through a re-import, merge or
+re-export) is not validated again, while a rules change invalidates
+every entry.
+
+The action's ``id`` and ``timestamp`` are left out of the key: they do
+not affect validation, and identical actions recorded at different times
+share one entry. Validation that depends on ``game_state`` is never
+cached.
+
+Hashing an action's content costs more than validating it, so the hash
+is only computed once per action object: an action seen before is found
+by identity and reuses its key while its fields still equal a copy taken
+when it was hashed. Units inside it are compared by identity only, so
+after editing a unit in place (say ``actor.models_remaining``) call
+``clear`` if validation depends on it.
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Any, Optional, Sequence
+
+from warscribe.edition.plugin import (
+    BatchValidationResult,
+    EditionPlugin,
+    ValidationResult,
+)
+from warscribe.schema.action import Action, BaseAction
+
+_WARNING = BatchValidationResult.WARNING
+_INVALID = BatchValidationResult.INVALID
+
+# Fields that never change a validation result.
+_UNKEYED = {"id", "timestamp"}
+
+
+def _snapshot(action: Action) -> dict[str, Any]:
+    """
+    Copy of ``action``'s fields for ``ValidationCache``'s identity check.
+
+    Lists and dicts are copied, one level deep for dicts of lists (dice
+    rolls), so changing them in place makes the copy compare unequal.
+    Units and other models are kept as they are.
+    """
+    fields = action.__dict__.copy()
+    for name, value in fields.items():
+        if isinstance(value, list):
+            fields[name] = value.copy()
+        elif isinstance(value, dict):
+            fields[name] = {
+                k: v.copy() if isinstance(v, list) else v for k, v in value.items()
+            }
+    return fields
+
+
+class ValidationCache:
+    """
+    LRU cache of validation results for one plugin.
+
+    Holds at most ``maxsize`` results, evicting the least recently used.
+    ``hits`` and ``misses`` count lookups since creation or ``clear``.
+    Returned results are copies, so callers may modify them. The last
+    ``maxsize`` or fewer actions hashed are kept alive for the identity
+    check.
+    """
+
+    def __init__(self, plugin: EditionPlugin, maxsize: int = 4096) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        self.plugin = plugin
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        # key -> (batch status code, errors, warnings), least recent first.
+        self._entries: OrderedDict[bytes, tuple[int, tuple, tuple]] = OrderedDict()
+        # id(action) -> (action, copy of its fields, key), for actions hashed.
+        self._seen: dict[int, tuple[Action, dict[str, Any], bytes]] = {}
+        self._prefix = f"{plugin.edition_code}\0{plugin.plugin_version}\0".encode()
+
+    def key(self, action: Action) -> bytes:
+        """Canonical content hash of ``action`` for this plugin."""
+        seen = self._seen.get(id(action))
+        if seen is not None and seen[0] is action and seen[1] == action.__dict__:
+            return seen[2]
+        content = action.model_dump_json(exclude=_UNKEYED).encode()
+        key = hashlib.blake2b(self._prefix + content, digest_size=16).digest()
+        if len(self._seen) >= self.maxsize:
+            self._seen.clear()
+        self._seen[id(action)] = (action, _snapshot(action), key)
+        return key
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, action: object) -> bool:
+        return isinstance(action, BaseAction) and self.key(action) in self._entries
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        self._entries.clear()
+        self._seen.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def _store(self, key: bytes, status: int, errors: tuple, warnings: tuple) -> None:
+        self._entries[key] = (status, errors, warnings)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def validate_action(
+        self, action: Action, game_state: Optional[Any] = None
+    ) -> ValidationResult:
+        """``plugin.validate_action``, answered from the cache when possible."""
+        if game_state is not None:
+            return self.plugin.validate_action(action, game_state)
+        key = self.key(action)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            result = self.plugin.validate_action(action)
+            status = (
+                _INVALID if not result.is_valid else _WARNING if result.warnings else 0
+            )
+            self._store(key, status, tuple(result.errors), tuple(result.warnings))
+            return result
+        self.hits += 1
+        self._entries.move_to_end(key)
+        status, errors, warnings = entry
+        return ValidationResult(status != _INVALID, list(errors), list(warnings))
+
+    def validate_actions(
+        self, actions: Sequence[Action], game_state: Optional[Any] = None
+    ) -> BatchValidationResult:
+        """
+        ``plugin.validate_actions``, answered from the cache when possible.
+
+        The actions that miss are validated together through the plugin's
+        batch path, each distinct one once.
+        """
+        if game_state is not None:
+            return self.plugin.validate_actions(actions, game_state)
+        batch = BatchValidationResult.of_size(len(actions))
+        codes, errors, warnings = batch.status, batch.errors, batch.warnings
+        entries = self._entries
+        seen_get = self._seen.get
+        # Missed keys, in order, with every index that needs their result.
+        missed: dict[bytes, list[int]] = {}
+        hits = 0
+        for index, action in enumerate(actions):
+            # self.key(action), with its identity check inlined.
+            seen = seen_get(id(action))
+            if seen is not None and seen[0] is action and seen[1] == action.__dict__:
+                key = seen[2]
+            else:
+                key = self.key(action)
+            entry = entries.get(key)
+            if entry is None:
+                pending = missed.get(key)
+                if pending is None:
+                    missed[key] = [index]
+                else:
+                    hits += 1
+                    pending.append(index)
+                continue
+            hits += 1
+            entries.move_to_end(key)
+            status, entry_errors, entry_warnings = entry
+            if status:
+                codes[index] = status
+                if entry_errors:
+                    errors[index] = list(entry_errors)
+                if entry_warnings:
+                    warnings[index] = list(entry_warnings)
+        self.hits += hits
+        self.misses += len(missed)
+
+        if missed:
+            fresh = self.plugin.validate_actions(
+                [actions[indices[0]] for indices in missed.values()]
+            )
+            for position, (key, indices) in enumerate(missed.items()):
+                status = fresh.status[position]
+                entry_errors = tuple(fresh.errors.get(position, ()))
+                entry_warnings = tuple(fresh.warnings.get(position, ()))
+                self._store(key, status, entry_errors, entry_warnings)
+                for index in indices:
+                    codes[index] = status
+                    if entry_errors:
+                        errors[index] = list(entry_errors)
+                    if entry_warnings:
+                        warnings[index] = list(entry_warnings)
+        return batch
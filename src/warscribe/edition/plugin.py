@@ -5,10 +5,17 @@ Defines the contract for WARScribe edition plugins.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Optional, Sequence
+from functools import cached_property, wraps
+from threading import local
+from time import perf_counter
+from types import MappingProxyType
+from typing import Any, Callable, ClassVar, Mapping, Optional, Sequence
 
+from warscribe.edition.rules import Rule, RuleTable
+from warscribe.instrumentation import hooks
+from warscribe.instrumentation.metrics import ACTIONS_VALIDATED, VALIDATE_SECONDS
 from warscribe.schema.action import Action, ActionType
 
 
@@ -63,14 +70,203 @@ class ValidationResult:
         self.warnings.append(warning)
 
 
+@dataclass
+class BatchValidationResult:
+    """
+    Result of validating a batch of actions.
+
+    ``status`` holds one code per action (``VALID``, ``WARNING`` or
+    ``INVALID``). Messages are only stored for actions that have any,
+    keyed by their index in the batch.
+    """
+
+    VALID: ClassVar[int] = 0
+    WARNING: ClassVar[int] = 1
+    INVALID: ClassVar[int] = 2
+
+    status: bytearray
+    errors: dict[int, list[str]] = field(default_factory=dict)
+    warnings: dict[int, list[str]] = field(default_factory=dict)
+
+    @classmethod
+    def of_size(cls, size: int) -> "BatchValidationResult":
+        """Create a result for ``size`` actions, all initially valid."""
+        return cls(status=bytearray(size))
+
+    @property
+    def is_valid(self) -> bool:
+        """True if no action in the batch is invalid."""
+        return self.INVALID not in self.status
+
+    def invalid_indices(self) -> list[int]:
+        """Indices of the invalid actions, in order."""
+        return sorted(self.errors)
+
+    def record(self, index: int, result: ValidationResult) -> None:
+        """Store a single action's validation result."""
+        if not result.is_valid:
+            self.status[index] = self.INVALID
+            self.errors[index] = result.errors
+        elif result.warnings:
+            self.status[index] = self.WARNING
+        if result.warnings:
+            self.warnings[index] = result.warnings
+
+    def result(self, index: int) -> ValidationResult:
+        """Expand one action's entry into a ``ValidationResult``."""
+        return ValidationResult(
+            is_valid=self.status[index] != self.INVALID,
+            errors=list(self.errors.get(index, ())),
+            warnings=list(self.warnings.get(index, ())),
+        )
+
+    def __len__(self) -> int:
+        return len(self.status)
+
+
+# One bit per action type, for phase permission masks.
+_ACTION_BITS: dict[ActionType, int] = {
+    action_type: 1 << bit for bit, action_type in enumerate(ActionType)
+}
+
+
+class PhaseTable:
+    """
+    Compiled, read-only view of an edition's phases.
+
+    Built once from ``EditionPlugin.phases``: phases by name and by order,
+    the next phase of each, and a bitmask of allowed action types per
+    phase, so every lookup is a single dict access.
+    """
+
+    __slots__ = ("phases", "by_name", "by_order", "_next", "_allowed")
+
+    def __init__(self, phases: Sequence[PhaseDefinition]) -> None:
+        self.phases: tuple[PhaseDefinition, ...] = tuple(phases)
+        by_name = {phase.name: phase for phase in self.phases}
+        by_order = {phase.order: phase for phase in self.phases}
+        self.by_name: Mapping[str, PhaseDefinition] = MappingProxyType(by_name)
+        self.by_order: Mapping[int, PhaseDefinition] = MappingProxyType(by_order)
+        self._next: dict[str, str] = {}
+        self._allowed: dict[str, int] = {}
+        for phase in self.phases:
+            following = by_order.get(phase.order + 1)
+            if following is not None:
+                self._next[phase.name] = following.name
+            mask = 0
+            for action_type in phase.allowed_actions:
+                mask |= _ACTION_BITS[action_type]
+            self._allowed[phase.name] = mask
+
+    def __reduce__(self) -> tuple[type, tuple]:
+        # Mapping proxies cannot be pickled; rebuild from the phases.
+        return PhaseTable, (self.phases,)
+
+    def get(self, phase_name: str) -> Optional[PhaseDefinition]:
+        """Phase definition by name."""
+        return self.by_name.get(phase_name)
+
+    def order(self, phase_name: str) -> int:
+        """Order index of a phase (-1 if not found)."""
+        phase = self.by_name.get(phase_name)
+        return phase.order if phase else -1
+
+    def next_phase(self, phase_name: str) -> Optional[str]:
+        """Name of the phase after ``phase_name``, if any."""
+        return self._next.get(phase_name)
+
+    def allowed_mask(self, phase_name: str) -> int:
+        """Bitmask of the action types allowed in a phase (0 if unknown)."""
+        return self._allowed.get(phase_name, 0)
+
+    def allows(self, action_type: ActionType, phase_name: str) -> bool:
+        """Check if an action type is allowed in a phase."""
+        mask = self._allowed.get(phase_name, 0)
+        return bool(mask & _ACTION_BITS.get(action_type, 0))
+
+
+# Set while a timed ``validate_action`` runs, so the calls it makes
+# (``super().validate_action``, say) are not timed again.
+_timing = local()
+
+_ValidateAction = Callable[..., ValidationResult]
+_ValidateActions = Callable[..., BatchValidationResult]
+
+
+def _timed_action(validate_action: _ValidateAction) -> _ValidateAction:
+    """Wrap a plugin's ``validate_action`` to time and count each call."""
+
+    @wraps(validate_action)
+    def timed(
+        self: "EditionPlugin", action: Action, game_state: Optional[Any] = None
+    ) -> ValidationResult:
+        metrics = hooks.metrics
+        if metrics is None or getattr(_timing, "active", False):
+            return validate_action(self, action, game_state)
+        _timing.active = True
+        try:
+            start = perf_counter()
+            result = validate_action(self, action, game_state)
+            seconds = perf_counter() - start
+        finally:
+            _timing.active = False
+
+        labels = (
+            ("edition", self.edition_code),
+            ("action_type", action.action_type.value),
+        )
+        metrics.histogram(VALIDATE_SECONDS, labels).observe(seconds)
+        if not result.is_valid:
+            status = "invalid"
+        elif result.warnings:
+            status = "warning"
+        else:
+            status = "valid"
+        metrics.counter(ACTIONS_VALIDATED, (*labels, ("status", status))).inc()
+        return result
+
+    return timed
+
+
+def _timed_actions(validate_actions: _ValidateActions) -> _ValidateActions:
+    """
+    Wrap a plugin's ``validate_actions`` so that, while instrumentation is
+    on, batches go through the timed ``validate_action`` one by one.
+    """
+
+    @wraps(validate_actions)
+    def timed(
+        self: "EditionPlugin",
+        actions: Sequence[Action],
+        game_state: Optional[Any] = None,
+    ) -> BatchValidationResult:
+        if hooks.metrics is None or getattr(_timing, "active", False):
+            return validate_actions(self, actions, game_state)
+        return EditionPlugin.validate_actions(self, actions, game_state)
+
+    return timed
+
+
 class EditionPlugin(ABC):
     """
     Abstract base class for edition plugins.
 
     Each supported edition (e.g., 9th, 10th) implements this interface
     to define its unique rules, phases, and action validation.
+
+    While instrumentation is on (see ``warscribe.instrumentation``),
+    every plugin's ``validate_action`` calls are timed and counted, and
+    its ``validate_actions`` validates one action at a time so each is
+    timed; a faster bulk path must give the same results anyway.
     """
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "validate_action" in cls.__dict__:
+            cls.validate_action = _timed_action(cls.__dict__["validate_action"])
+        if "validate_actions" in cls.__dict__:
+            cls.validate_actions = _timed_actions(cls.__dict__["validate_actions"])
+
     @property
     @abstractmethod
     def edition_name(self) -> str:
@@ -83,6 +279,16 @@ class EditionPlugin(ABC):
         """Short edition identifier (e.g., '10th', '9th')."""
         pass
 
+    @property
+    def plugin_version(self) -> str:
+        """
+        Version of this plugin's rules.
+
+        Bump it whenever validation behaviour changes, so results cached
+        by ``ValidationCache`` under the old rules are not reused.
+        """
+        return "1"
+
     @property
     @abstractmethod
     def phases(self) -> Sequence[PhaseDefinition]:
@@ -93,17 +299,56 @@ class EditionPlugin(ABC):
         """
         pass
 
+    @cached_property
+    def phase_table(self) -> PhaseTable:
+        """
+        Compiled phase table, built from ``phases`` on first use.
+
+        Plugins are expected to have a fixed set of phases; one that
+        changes them later can ``del plugin.phase_table`` to rebuild it.
+        """
+        return PhaseTable(self.phases)
+
+    #: Declarative checks per action model, compiled into ``rule_table``.
+    rules: ClassVar[Mapping[type, Sequence[Rule]]] = {}
+
+    @cached_property
+    def rule_table(self) -> RuleTable:
+        """Compiled ``rules``, built on first use."""
+        return RuleTable(self.rules)
+
+    def apply_rules(
+        self, action: Action, result: ValidationResult, mask: Optional[int] = None
+    ) -> ValidationResult:
+        """
+        Check ``action`` against the edition's ``rules``.
+
+        Returns ``result`` with any warnings added, or a failed result if
+        an error rule is broken.
+        ``mask`` is the result of ``rule_table.check`` if already known.
+        """
+        table = self.rule_table
+        with hooks.check(self.edition_code, "rules"):
+            if mask is None:
+                mask = table.check(action)
+            if not mask:
+                return result
+            failed, messages = table.messages(action, mask)
+        if failed:
+            return ValidationResult(is_valid=False, errors=messages, warnings=[])
+        if result.warnings:
+            result.warnings.extend(messages)
+        else:
+            result.warnings = messages
+        return result
+
     def get_phase(self, phase_name: str) -> Optional[PhaseDefinition]:
         """Get a phase definition by name."""
-        for phase in self.phases:
-            if phase.name == phase_name:
-                return phase
-        return None
+        return self.phase_table.get(phase_name)
 
     def get_phase_order(self, phase_name: str) -> int:
         """Get the order index of a phase (-1 if not found)."""
-        phase = self.get_phase(phase_name)
-        return phase.order if phase else -1
+        return self.phase_table.order(phase_name)
 
     @abstractmethod
     def validate_action(
@@ -114,25 +359,32 @@ class EditionPlugin(ABC):
         """
         pass
 
+    def validate_actions(
+        self, actions: Sequence[Action], game_state: Optional[Any] = None
+    ) -> BatchValidationResult:
+        """
+        Validate a batch of actions.
+
+        The default implementation calls ``validate_action`` for each
+        action; plugins can override it with a faster bulk path.
+        """
+        batch = BatchValidationResult.of_size(len(actions))
+        for index, action in enumerate(actions):
+            batch.record(index, self.validate_action(action, game_state))
+        return batch
+
     def is_action_allowed_in_phase(
         self, action_type: ActionType, phase_name: str
     ) -> bool:
         """Check if an action type is allowed in a given phase."""
-        phase = self.get_phase(phase_name)
-        if not phase:
-            return False
-        return action_type in phase.allowed_actions
+        if hooks.metrics is None:
+            return self.phase_table.allows(action_type, phase_name)
+        with hooks.check(self.edition_code, "phase"):
+            return self.phase_table.allows(action_type, phase_name)
 
     def get_next_phase(self, current_phase: str) -> Optional[str]:
         """Get the next phase after the current one."""
-        current_order = self.get_phase_order(current_phase)
-        if current_order < 0:
-            return None
-
-        for phase in self.phases:
-            if phase.order == current_order + 1:
-                return phase.name
-        return None
+        return self.phase_table.next_phase(current_phase)
 
     def __str__(self) -> str:
         return f"{self.edition_name} ({self.edition_code})"
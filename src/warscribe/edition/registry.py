@@ -2,12 +2,44 @@
 Edition Registry.
 
 Manages discovery and registration of edition plugins.
+
+Installed plugins are discovered through the ``warscribe.editions``
+entry point group: each entry point is named after the edition code and
+refers to a plugin class (or any callable returning a plugin), e.g. in a
+plugin package's ``pyproject.toml``::
+
+    [project.entry-points."warscribe.editions"]
+    9th = "warscribe_ninth:NinthEditionPlugin"
+
+Discovery only lists the codes; a plugin's module is imported the first
+time its edition is requested.
 """
 
-from typing import Optional
+from functools import partial
+from importlib import import_module
+from importlib.metadata import entry_points
+from typing import Callable, Optional, Union
 
 from warscribe.edition.plugin import EditionPlugin
 
+ENTRY_POINT_GROUP = "warscribe.editions"
+
+# Editions shipped with WARScribe-Core, as "module:attribute" references.
+BUILTIN_EDITIONS = {"10th": "warscribe.edition.tenth:TenthEditionPlugin"}
+
+DEFAULT_EDITION = "10th"
+
+# A plugin class, or any other callable returning a plugin.
+PluginSource = Callable[[], EditionPlugin]
+
+
+def _load_reference(reference: str) -> PluginSource:
+    module, _, attribute = reference.partition(":")
+    target = import_module(module)
+    for name in attribute.split("."):
+        target = getattr(target, name)
+    return target
+
 
 class EditionRegistry:
     """
@@ -18,31 +50,90 @@ class EditionRegistry:
 
     def __init__(self) -> None:
         self._editions: dict[str, EditionPlugin] = {}
+        self._pending: dict[str, Callable[[], PluginSource]] = {}
         self._default: Optional[str] = None
 
     def register(self, plugin: EditionPlugin, set_default: bool = False) -> None:
         """Register an edition plugin."""
         self._editions[plugin.edition_code] = plugin
+        self._pending.pop(plugin.edition_code, None)
         if set_default or self._default is None:
             self._default = plugin.edition_code
 
+    def register_lazy(
+        self,
+        edition_code: str,
+        source: Union[str, Callable[[], PluginSource]],
+        set_default: bool = False,
+    ) -> None:
+        """
+        Register an edition to be loaded on first use.
+
+        ``source`` is a ``"module:attribute"`` reference or a callable
+        returning a plugin class or factory (such as ``EntryPoint.load``).
+        A plugin already registered for the code is kept.
+        """
+        if edition_code in self._editions:
+            return
+        if isinstance(source, str):
+            source = partial(_load_reference, source)
+        self._pending[edition_code] = source
+        if set_default or self._default is None:
+            self._default = edition_code
+
+    def discover(self, group: str = ENTRY_POINT_GROUP) -> None:
+        """
+        List the built-in editions and those installed under ``group``,
+        without importing them. The built-in default edition stays the
+        default unless another one was set explicitly.
+        """
+        for code, reference in BUILTIN_EDITIONS.items():
+            self.register_lazy(code, reference)
+        for entry_point in entry_points(group=group):
+            self.register_lazy(entry_point.name, entry_point.load)
+        if self._default in BUILTIN_EDITIONS or self._default is None:
+            self._default = DEFAULT_EDITION
+
+    def _load(self, edition_code: str) -> Optional[EditionPlugin]:
+        source = self._pending.get(edition_code)
+        if source is None:
+            return None
+        factory = source()
+        plugin = factory()
+        if plugin.edition_code != edition_code:
+            raise ValueError(
+                f"Plugin registered as '{edition_code}' has edition code "
+                f"'{plugin.edition_code}'."
+            )
+        del self._pending[edition_code]
+        self._editions[edition_code] = plugin
+        return plugin
+
     def get(self, edition_code: str) -> Optional[EditionPlugin]:
-        """Get an edition plugin by code."""
-        return self._editions.get(edition_code)
+        """Get an edition plugin by code, loading it on first use."""
+        plugin = self._editions.get(edition_code)
+        if plugin is None:
+            plugin = self._load(edition_code)
+        return plugin
 
     def get_default(self) -> Optional[EditionPlugin]:
         """Get the default edition plugin."""
         if self._default:
-            return self._editions.get(self._default)
+            return self.get(self._default)
         return None
 
     @property
     def available_editions(self) -> list[str]:
-        """List available edition codes."""
-        return list(self._editions.keys())
+        """List available edition codes, loaded or not."""
+        return [*self._editions, *self._pending]
+
+    @property
+    def loaded_editions(self) -> list[str]:
+        """List the edition codes whose plugins have been loaded."""
+        return list(self._editions)
 
     def __len__(self) -> int:
-        return len(self._editions)
+        return len(self._editions) + len(self._pending)
 
     def __contains__(self, edition_code: str) -> bool:
-        return edition_code in self._editions
+        return edition_code in self._editions or edition_code in self._pending
@@ -0,0 +1,164 @@
+"""
+Declarative validation rules.
+
+An edition lists its numeric sanity checks as ``Rule`` entries per action
+model, for example::
+
+    Rule("hits", "<=", "shots", "Hits ({hits}) cannot exceed shots ({shots}).")
+
+meaning "``hits <= shots`` must hold". ``RuleTable`` compiles each model's
+rules once into a generated function that reads the fields it needs into
+locals and evaluates every comparison, returning a bitmask of the rules
+that were broken. Nothing is allocated for an action that passes.
+
+Error rules stop checking at the first one broken, and the result then
+holds only that error; warning rules are all checked. Messages are
+``str.format`` templates over the action's fields, formatted only for
+the rules an action actually breaks.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Literal, Mapping, Sequence, Union
+
+from warscribe.schema.action import BaseAction
+
+_OPERATORS = frozenset({"<", "<=", ">", ">=", "==", "!="})
+
+Checker = Callable[[Any], int]
+
+
+@dataclass(frozen=True)
+class Rule:
+    """
+    One declarative check: ``left op right`` must hold.
+
+    ``left`` is a field of the action model; ``right`` is another field or
+    a numeric constant. ``message`` is formatted with the action's fields.
+    """
+
+    left: str
+    op: str
+    right: Union[str, int, float]
+    message: str
+    severity: Literal["error", "warning"] = "error"
+
+
+class _Fields(dict):
+    """Message format mapping reading fields from an action on demand."""
+
+    def __init__(self, action: Any) -> None:
+        super().__init__()
+        self.action = action
+
+    def __missing__(self, key: str) -> Any:
+        return getattr(self.action, key)
+
+
+def compile_rules(model: type, rules: Sequence[Rule]) -> Checker:
+    """
+    Compile ``rules`` for ``model`` into a checker function.
+
+    The checker returns 0 if every rule holds, otherwise a mask with bit
+    ``i`` set for each broken rule ``rules[i]``. Raises ``ValueError`` for
+    unknown fields, operators or severities.
+    """
+    known = getattr(model, "model_fields", {})
+    names: dict[str, str] = {}
+    lines = ["def check(action):"]
+    body: list[str] = []
+
+    def operand(value: Union[str, int, float]) -> str:
+        if isinstance(value, str):
+            if value not in known:
+                raise ValueError(f"{model.__name__} has no field '{value}'.")
+            if value not in names:
+                names[value] = f"f{len(names)}"
+                lines.append(f"    {names[value]} = action.{value}")
+            return names[value]
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"Rule operands must be fields or numbers: {value!r}.")
+        return repr(value)
+
+    for bit, rule in enumerate(rules):
+        if rule.op not in _OPERATORS:
+            raise ValueError(f"Unknown rule operator '{rule.op}'.")
+        condition = f"{operand(rule.left)} {rule.op} {operand(rule.right)}"
+        if rule.severity == "error":
+            # Warnings found so far are dropped, as in a failure result.
+            body.append(f"    if not ({condition}): return {1 << bit}")
+        elif rule.severity == "warning":
+            body.append(f"    if not ({condition}): mask |= {1 << bit}")
+        else:
+            raise ValueError(f"Unknown rule severity '{rule.severity}'.")
+
+    lines.append("    mask = 0")
+    lines.extend(body)
+    lines.append("    return mask")
+
+    namespace: dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+    return namespace["check"]
+
+
+def _no_rules(action: Any) -> int:
+    return 0
+
+
+class RuleTable:
+    """
+    An edition's rules, compiled per action model.
+
+    Built once from ``EditionPlugin.rules``. ``check`` dispatches on the
+    action's exact type; subclasses of a listed model use its rules.
+    """
+
+    __slots__ = ("rules", "_entries", "_checkers")
+
+    def __init__(self, rules: Mapping[type, Sequence[Rule]]) -> None:
+        self.rules = {model: tuple(model_rules) for model, model_rules in rules.items()}
+        # Per model: the broken-rule list source and its error bits.
+        self._entries: dict[type, tuple[tuple[Rule, ...], int]] = {}
+        self._checkers: dict[type, Checker] = {}
+        for model, model_rules in self.rules.items():
+            errors = sum(
+                1 << bit
+                for bit, rule in enumerate(model_rules)
+                if rule.severity == "error"
+            )
+            self._entries[model] = (model_rules, errors)
+            self._checkers[model] = compile_rules(model, model_rules)
+
+    def __reduce__(self) -> tuple[type, tuple]:
+        # The compiled checkers cannot be pickled; recompile from the rules.
+        return RuleTable, (self.rules,)
+
+    def _resolve(self, model: type) -> Checker:
+        """Checker for a model not seen yet, from its nearest listed base."""
+        for base in model.__mro__[1:]:
+            if base in self.rules:
+                self._entries[model] = self._entries[base]
+                checker = self._checkers[model] = self._checkers[base]
+                return checker
+        self._checkers[model] = _no_rules
+        return _no_rules
+
+    def check(self, action: BaseAction) -> int:
+        """Mask of the rules ``action`` breaks (0 if none or no rules)."""
+        checker = self._checkers.get(type(action))
+        if checker is None:
+            checker = self._resolve(type(action))
+        return checker(action)
+
+    def messages(self, action: BaseAction, mask: int) -> tuple[bool, list[str]]:
+        """
+        Expand a non-zero ``check`` mask: whether an error rule was broken,
+        and the formatted messages of the broken rules.
+        """
+        rules, errors = self._entries[type(action)]
+        fields = _Fields(action)
+        messages = [
+            rule.message.format_map(fields)
+            for bit, rule in enumerate(rules)
+            if mask >> bit & 1
+        ]
+        return bool(mask & errors), messages
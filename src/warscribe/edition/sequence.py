@@ -0,0 +1,206 @@
+"""
+Transcript-level phase sequence validation.
+
+``PhaseSequenceValidator`` walks a transcript's actions once, as a state
+machine over ``(turn, player turn, phase)`` driven by the plugin's phase
+order, and reports:
+
+- turn regressions (an action in an earlier turn),
+- phases out of order within a player's turn,
+- a third player turn in one battle round, and active players that do
+  not alternate,
+- actions in phases the edition does not define,
+- optionally, skipped turns and skipped non-optional phases.
+
+A phase going backwards within the same turn starts the second player's
+turn of that battle round. The player of a player turn is the side of its
+first action's actor (units fight and react in the opponent's turn, so
+later actors say nothing about whose turn it is). Sides come from the
+players' rosters; an actor missing from both is placed by faction, unless
+both players have the same faction.
+
+The validator keeps its state between calls, so ``validate_new`` only
+checks actions appended since the previous call.
+"""
+
+from typing import Optional, Sequence, Union
+from uuid import UUID
+
+from warscribe.edition.plugin import BatchValidationResult, EditionPlugin
+from warscribe.schema.action import Action
+from warscribe.schema.transcript import GameTranscript
+
+
+class PhaseSequenceValidator:
+    """
+    Single-pass, incremental phase sequence checker.
+
+    With ``allow_skips`` (the default) turns or phases without any
+    recorded actions are accepted; without it, jumping over a turn or a
+    non-optional phase is an error.
+    """
+
+    def __init__(self, plugin: EditionPlugin, allow_skips: bool = True) -> None:
+        self.plugin = plugin
+        self.allow_skips = allow_skips
+        self._table = plugin.phase_table
+        self._required = sorted(
+            phase.order for phase in self._table.phases if not phase.is_optional
+        )
+        self._end = max(self._table.by_order, default=-1) + 1
+        self.reset()
+
+    def reset(self, players: Optional[dict[Union[UUID, str], int]] = None) -> None:
+        """
+        Forget all state; ``players`` maps unit ids, and optionally
+        factions for units not listed, to player numbers.
+        """
+        self.players = players or {}
+        self.checked = 0
+        self._source: Optional[list[Action]] = None
+        self._turn = 0
+        self._order = -1
+        self._player_turns = 0
+        self._player = 0
+        self._first_player = 0
+
+    @staticmethod
+    def _players(transcript: GameTranscript) -> dict[Union[UUID, str], int]:
+        players: dict[Union[UUID, str], int] = {}
+        for number, player in ((1, transcript.player1), (2, transcript.player2)):
+            if transcript.player1.faction != transcript.player2.faction:
+                players[player.faction] = number
+            for unit in player.units:
+                players[unit.id] = number
+        return players
+
+    def _name(self, order: int) -> str:
+        name = self._table.by_order[order].name
+        return getattr(name, "value", name)
+
+    def _skipped(self, start: int, end: int) -> list[int]:
+        """Required phase orders strictly between ``start`` and ``end``."""
+        return [order for order in self._required if start < order < end]
+
+    def _check(self, action: Action, errors: list[str]) -> None:
+        order = self._table.order(action.phase)
+        if order < 0:
+            errors.append(f"Unknown phase '{action.phase}'.")
+            return
+        actor = action.actor
+        player = self.players.get(actor.id) or self.players.get(actor.faction, 0)
+
+        if action.turn < self._turn:
+            errors.append(f"Turn went back from {self._turn} to {action.turn}.")
+            return
+
+        if action.turn > self._turn:
+            if self._turn:
+                self._end_player_turn(errors)
+            if not self.allow_skips and action.turn > self._turn + 1:
+                errors.append(f"Turn jumped from {self._turn} to {action.turn}.")
+            if (
+                self._turn
+                and self._first_player
+                and player
+                and player != self._first_player
+            ):
+                errors.append(
+                    f"Turn {action.turn} started by player {player}; "
+                    f"player {self._first_player} goes first."
+                )
+            if not self._first_player:
+                self._first_player = player
+            self._turn = action.turn
+            self._player_turns = 1
+            self._player = player
+            self._start_phase(-1, order, errors)
+            return
+
+        if order >= self._order:
+            self._start_phase(self._order, order, errors)
+            return
+
+        # Phase went back: the second player's turn of this battle round.
+        if self._player_turns >= 2:
+            errors.append(
+                f"Phase '{action.phase}' out of order in turn {action.turn} "
+                f"(after '{self._name(self._order)}')."
+            )
+            return
+        if player and self._player and player == self._player:
+            errors.append(
+                f"Active player did not alternate in turn {action.turn}: "
+                f"player {player} took a second turn."
+            )
+        self._end_player_turn(errors)
+        self._player_turns += 1
+        self._player = player
+        self._start_phase(-1, order, errors)
+
+    def _report_skips(self, start: int, end: int, errors: list[str]) -> None:
+        if self.allow_skips:
+            return
+        for skipped in self._skipped(start, end):
+            errors.append(f"Skipped required phase '{self._name(skipped)}'.")
+
+    def _start_phase(self, previous: int, order: int, errors: list[str]) -> None:
+        self._report_skips(previous, order, errors)
+        self._order = order
+
+    def _end_player_turn(self, errors: list[str]) -> None:
+        self._report_skips(self._order, self._end, errors)
+
+    def feed(self, actions: Sequence[Action]) -> BatchValidationResult:
+        """
+        Check ``actions`` as the continuation of everything fed so far.
+
+        Entries of the result are indexed from the first action given.
+        """
+        batch = BatchValidationResult.of_size(len(actions))
+        for index, action in enumerate(actions):
+            errors: list[str] = []
+            self._check(action, errors)
+            if errors:
+                batch.status[index] = BatchValidationResult.INVALID
+                batch.errors[index] = errors
+        self.checked += len(actions)
+        return batch
+
+    def validate(self, transcript: GameTranscript) -> BatchValidationResult:
+        """Check a whole transcript from the start."""
+        self.reset(self._players(transcript))
+        self._source = transcript.actions
+        return self.feed(transcript.actions)
+
+    def validate_new(self, transcript: GameTranscript) -> BatchValidationResult:
+        """
+        Check only the actions appended since the last call.
+
+        Entries of the result are indexed from the first new action, which
+        is ``transcript.actions[checked]`` before the call; equivalently,
+        entry ``i`` is for ``transcript.actions[len(transcript.actions) -
+        len(result) + i]``. For a different transcript or a replaced action
+        list the whole transcript is checked again, and the result still
+        covers only the actions from ``checked`` on (all of them if there
+        are no longer that many).
+        """
+        actions = transcript.actions
+        start = self.checked
+        if actions is self._source and start <= len(actions):
+            return self.feed(actions[start:])
+        batch = self.validate(transcript)
+        if not 0 < start <= len(actions):
+            return batch
+        return BatchValidationResult(
+            status=batch.status[start:],
+            errors={i - start: e for i, e in batch.errors.items() if i >= start},
+            warnings={i - start: w for i, w in batch.warnings.items() if i >= start},
+        )
+
+
+def validate_sequence(
+    plugin: EditionPlugin, transcript: GameTranscript, allow_skips: bool = True
+) -> BatchValidationResult:
+    """Check the phase sequence of a whole transcript."""
+    return PhaseSequenceValidator(plugin, allow_skips).validate(transcript)
@@ -7,11 +7,14 @@ Implements Warhammer 40,000 10th Edition rules.
 from typing import Any, Optional, Sequence
 
 from warscribe.edition.plugin import (
+    BatchValidationResult,
     EditionPlugin,
     GamePhase,
     PhaseDefinition,
     ValidationResult,
 )
+from warscribe.edition.rules import Rule
+from warscribe.instrumentation import hooks
 from warscribe.schema.action import (
     Action,
     ActionType,
@@ -21,6 +24,46 @@ from warscribe.schema.action import (
     FightAction,
 )
 
+# Dice cascade shared by shooting and fighting: each step can only
+# succeed for dice that passed the step before, barring re-rolls and
+# abilities.
+_CASCADE = [
+    Rule(
+        "wounds",
+        "<=",
+        "hits",
+        "Wounds ({wounds}) exceed hits ({hits}). Verify re-rolls or abilities.",
+        "warning",
+    ),
+    Rule(
+        "saves_failed",
+        "<=",
+        "wounds",
+        "Saves failed ({saves_failed}) exceed wounds ({wounds}).",
+        "warning",
+    ),
+]
+
+_SHOOT_RULES = [
+    Rule("shots", ">=", 1, "Must have at least 1 shot."),
+    Rule("hits", "<=", "shots", "Hits ({hits}) cannot exceed shots ({shots})."),
+    *_CASCADE,
+    Rule(
+        "models_killed",
+        "<=",
+        "saves_failed",
+        "Models killed ({models_killed}) exceeds saves failed "
+        "({saves_failed}). Multi-damage weapon?",
+        "warning",
+    ),
+]
+
+_FIGHT_RULES = [
+    Rule("attacks", ">=", 1, "Must have at least 1 attack."),
+    Rule("hits", "<=", "attacks", "Hits ({hits}) cannot exceed attacks ({attacks})."),
+    *_CASCADE,
+]
+
 
 class TenthEditionPlugin(EditionPlugin):
     """
@@ -32,6 +75,8 @@ class TenthEditionPlugin(EditionPlugin):
     - Command Phase for abilities and stratagems
     """
 
+    rules = {ShootAction: _SHOOT_RULES, FightAction: _FIGHT_RULES}
+
     @property
     def edition_name(self) -> str:
         return "Warhammer 40,000 10th Edition"
@@ -116,27 +161,79 @@ class TenthEditionPlugin(EditionPlugin):
         - Action type allowed in current phase
         - Movement within limits
         - Charge distance calculations
+        - Shooting and fight dice cascade (declared in ``rules``)
         """
         result = ValidationResult.success()
 
         # Check phase allows action type
         if not self.is_action_allowed_in_phase(action.action_type, action.phase):
-            return ValidationResult.failure(
-                f"Action type '{action.action_type.value}' not allowed in "
-                f"'{action.phase}' phase."
-            )
+            return ValidationResult.failure(self._phase_error(action))
+
+        return self._validate_type(action, result)
+
+    def validate_actions(
+        self, actions: Sequence[Action], game_state: Optional[Any] = None
+    ) -> BatchValidationResult:
+        """
+        Validate a batch of actions against 10th Edition rules.
 
-        # Type-specific validation
+        Phase permissions come from the compiled phase table and the
+        declared ``rules`` from the compiled rule table; an action passing
+        both with no hand-written checks needs nothing more. The others
+        share one scratch result instead of allocating one per action.
+
+        A subclass that overrides ``validate_action`` gets the per-action
+        path instead, so both methods always agree.
+        """
+        if type(self).validate_action is not TenthEditionPlugin.validate_action:
+            return super().validate_actions(actions, game_state)
+        batch = BatchValidationResult.of_size(len(actions))
+        allows = self.phase_table.allows
+        check = self.rule_table.check
+        scratch = ValidationResult.success()
+
+        for index, action in enumerate(actions):
+            if not allows(action.action_type, action.phase):
+                batch.status[index] = BatchValidationResult.INVALID
+                batch.errors[index] = [self._phase_error(action)]
+                continue
+
+            if not isinstance(action, (MoveAction, ChargeAction)):
+                mask = check(action)
+                if mask:
+                    batch.record(index, self.apply_rules(action, scratch, mask))
+                    scratch.warnings = []
+                continue
+
+            result = self._validate_type(action, scratch)
+            batch.record(index, result)
+            if scratch.warnings:
+                scratch.warnings = []
+
+        return batch
+
+    @staticmethod
+    def _phase_error(action: Action) -> str:
+        return (
+            f"Action type '{action.action_type.value}' not allowed in "
+            f"'{action.phase}' phase."
+        )
+
+    def _validate_type(
+        self, action: Action, result: ValidationResult
+    ) -> ValidationResult:
+        """Run the checks specific to the action's model."""
         if isinstance(action, MoveAction):
-            result = self._validate_move(action, result)
+            check, name = self._validate_move, "move"
         elif isinstance(action, ChargeAction):
-            result = self._validate_charge(action, result)
-        elif isinstance(action, ShootAction):
-            result = self._validate_shoot(action, result)
-        elif isinstance(action, FightAction):
-            result = self._validate_fight(action, result)
+            check, name = self._validate_charge, "charge"
+        else:
+            return self.apply_rules(action, result)
 
-        return result
+        if hooks.metrics is None:
+            return check(action, result)
+        with hooks.check(self.edition_code, name):
+            return check(action, result)
 
     def _validate_move(
         self, action: MoveAction, result: ValidationResult
@@ -184,84 +281,3 @@ class TenthEditionPlugin(EditionPlugin):
                 )
 
         return result
-
-    def _validate_shoot(
-        self, action: ShootAction, result: ValidationResult
-    ) -> ValidationResult:
-        """Validate a shooting action.
-
-        Issue #6: Action validation working.
-        """
-        # Basic sanity checks
-        if action.shots < 1:
-            return ValidationResult.failure("Must have at least 1 shot.")
-
-        # Hits cannot exceed shots
-        if action.hits > action.shots:
-            return ValidationResult.failure(
-                f"Hits ({action.hits}) cannot exceed shots ({action.shots})."
-            )
-
-        # Wounds cannot exceed hits
-        if action.wounds > action.hits:
-            result.add_warning(
-                f"Wounds ({action.wounds}) exceed hits ({action.hits}). "
-                "Verify re-rolls or abilities."
-            )
-
-        # Saves failed cannot exceed wounds
-        if action.saves_failed > action.wounds:
-            result.add_warning(
-                f"Saves failed ({action.saves_failed}) exceed wounds ({action.wounds})."
-            )
-
-        # Models killed should be reasonable
-        if action.models_killed > action.saves_failed:
-            result.add_warning(
-                f"Models killed ({action.models_killed}) exceeds saves failed "
-                f"({action.saves_failed}). Multi-damage weapon?"
-            )
-
-        return result
-
-    def _validate_fight(
-        self, action: FightAction, result: ValidationResult
-    ) -> ValidationResult:
-        """Validate a fight (melee) action.
-
-        Issue #6: Action validation working.
-        """
-        # Basic sanity checks
-        if action.attacks < 1:
-            return ValidationResult.failure("Must have at least 1 attack.")
-
-        # Hits cannot exceed attacks
-        if action.hits > action.attacks:
-            return ValidationResult.failure(
-                f"Hits ({action.hits}) cannot exceed attacks ({action.attacks})."
-            )
-
-        # Same cascade validation as shooting
-        if action.wounds > action.hits:
-            result.add_warning(
-                f"Wounds ({action.wounds}) exceed hits ({action.hits}). "
-                "Verify re-rolls or abilities."
-            )
-
-        if action.saves_failed > action.wounds:
-            result.add_warning(
-                f"Saves failed ({action.saves_failed}) exceed wounds ({action.wounds})."
-            )
-
-        return result
-
-
-# Register plugin when module is imported
-def _register() -> None:
-    """Register the 10th Edition plugin."""
-    from warscribe.edition import register_edition
-
-    register_edition(TenthEditionPlugin(), set_default=True)
-
-
-_register()
@@ -0,0 +1,70 @@
+"""
+Instrumentation for WARScribe's hot paths.
+
+Off by default: until ``enable`` is called every hook is a single ``None``
+check. Once enabled, WARScribe records into the active ``Metrics``:
+
+- ``warscribe_stage_seconds{stage}``: whole-transcript stages, ``parse``
+  (pydantic validation of JSON), ``decode`` (binary format) and
+  ``trusted_load``
+- ``warscribe_validate_seconds{edition, action_type}``: one action's
+  ``validate_action`` call, dispatch included, for every edition plugin
+- ``warscribe_check_seconds{edition, check}``: the individual checks,
+  ``phase`` and ``rules`` in ``EditionPlugin`` and those a plugin times
+  with ``check`` (``move`` and ``charge`` in 10th Edition)
+- ``warscribe_actions_validated_total{edition, action_type, status}``
+
+Exporters turn snapshots into something to look at::
+
+    from warscribe import instrumentation
+
+    metrics = instrumentation.enable(
+        instrumentation.Metrics(
+            exporters=[instrumentation.PrometheusTextExporter("warscribe.prom")]
+        )
+    )
+    ...
+    metrics.flush()
+"""
+
+from warscribe.instrumentation.exporters import (
+    LogExporter,
+    PrometheusTextExporter,
+    SnapshotExporter,
+    prometheus_text,
+)
+from warscribe.instrumentation.hooks import active, check, disable, enable, stage
+from warscribe.instrumentation.metrics import (
+    ACTIONS_VALIDATED,
+    CHECK_SECONDS,
+    DEFAULT_BUCKETS,
+    STAGE_SECONDS,
+    VALIDATE_SECONDS,
+    Counter,
+    Exporter,
+    Histogram,
+    Metrics,
+    Sample,
+)
+
+__all__ = [
+    "ACTIONS_VALIDATED",
+    "CHECK_SECONDS",
+    "DEFAULT_BUCKETS",
+    "STAGE_SECONDS",
+    "VALIDATE_SECONDS",
+    "Counter",
+    "Exporter",
+    "Histogram",
+    "LogExporter",
+    "Metrics",
+    "PrometheusTextExporter",
+    "Sample",
+    "SnapshotExporter",
+    "active",
+    "check",
+    "disable",
+    "enable",
+    "prometheus_text",
+    "stage",
+]
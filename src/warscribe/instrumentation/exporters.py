@@ -0,0 +1,119 @@
+"""
+Metric exporters.
+
+- ``SnapshotExporter`` keeps the latest snapshot in memory.
+- ``PrometheusTextExporter`` writes the Prometheus text format to a file,
+  for the node exporter's textfile collector.
+- ``LogExporter`` logs one line per metric.
+"""
+
+import logging
+import math
+import os
+from pathlib import Path
+from typing import Optional, Sequence, Union
+
+from warscribe.instrumentation.metrics import Exporter, Labels, Sample
+
+
+class SnapshotExporter(Exporter):
+    """Keeps the most recent snapshot in ``samples``."""
+
+    def __init__(self) -> None:
+        self.samples: list[Sample] = []
+
+    def export(self, samples: Sequence[Sample]) -> None:
+        self.samples = list(samples)
+
+    def get(self, name: str, **labels: str) -> Optional[Sample]:
+        """The sample of metric ``name`` with exactly ``labels``, if any."""
+        wanted = dict(labels)
+        for sample in self.samples:
+            if sample.name == name and dict(sample.labels) == wanted:
+                return sample
+        return None
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(
+            key,
+            value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"),
+        )
+        for key, value in labels
+    )
+    return "{" + pairs + "}"
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if math.isinf(bound) else repr(bound)
+
+
+def prometheus_text(samples: Sequence[Sample]) -> str:
+    """Render ``samples`` in the Prometheus text exposition format."""
+    lines = []
+    typed = set()
+    for sample in samples:
+        if sample.name not in typed:
+            typed.add(sample.name)
+            lines.append(f"# TYPE {sample.name} {sample.kind}")
+        if sample.kind == "counter":
+            lines.append(f"{sample.name}{_format_labels(sample.labels)} {sample.value}")
+            continue
+        for bound, count in sample.buckets:
+            labels = _format_labels((*sample.labels, ("le", _format_bound(bound))))
+            lines.append(f"{sample.name}_bucket{labels} {count}")
+        labels = _format_labels(sample.labels)
+        lines.append(f"{sample.name}_sum{labels} {sample.value}")
+        lines.append(f"{sample.name}_count{labels} {sample.count}")
+    return "\n".join(lines) + "\n"
+
+
+class PrometheusTextExporter(Exporter):
+    """
+    Writes each snapshot to ``path`` in the Prometheus text format.
+
+    The file is replaced atomically, so a collector never reads half of it.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+
+    def export(self, samples: Sequence[Sample]) -> None:
+        temporary = self.path.with_name(self.path.name + ".tmp")
+        temporary.write_text(prometheus_text(samples))
+        os.replace(temporary, self.path)
+
+
+class LogExporter(Exporter):
+    """
+    Logs one line per metric.
+
+    Counters log their value; histograms their count, sum and mean.
+    """
+
+    def __init__(
+        self, logger: Optional[logging.Logger] = None, level: int = logging.INFO
+    ) -> None:
+        self.logger = logger or logging.getLogger("warscribe.metrics")
+        self.level = level
+
+    def export(self, samples: Sequence[Sample]) -> None:
+        if not self.logger.isEnabledFor(self.level):
+            return
+        for sample in samples:
+            name = sample.name + _format_labels(sample.labels)
+            if sample.kind == "counter":
+                self.logger.log(self.level, "%s value=%g", name, sample.value)
+            else:
+                mean = sample.value / sample.count if sample.count else 0.0
+                self.logger.log(
+                    self.level,
+                    "%s count=%d sum=%.6f mean=%.9f",
+                    name,
+                    sample.count,
+                    sample.value,
+                    mean,
+                )
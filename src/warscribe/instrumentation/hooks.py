@@ -0,0 +1,80 @@
+"""
+The global instrumentation switch.
+
+Instrumented code reads ``hooks.metrics`` once per call and does nothing
+more while it is ``None``, which it is until ``enable`` is called.
+"""
+
+from time import perf_counter
+from typing import Optional
+
+from warscribe.instrumentation.metrics import CHECK_SECONDS, STAGE_SECONDS, Metrics
+
+#: The active metrics collection, or ``None`` when instrumentation is off.
+metrics: Optional[Metrics] = None
+
+
+def enable(collection: Optional[Metrics] = None) -> Metrics:
+    """Start collecting into ``collection`` (a new one by default)."""
+    global metrics
+    metrics = collection if collection is not None else Metrics()
+    return metrics
+
+
+def active() -> Optional[Metrics]:
+    """The active collection, or ``None`` when instrumentation is off."""
+    return metrics
+
+
+def disable() -> Optional[Metrics]:
+    """Stop collecting; returns the collection that was active."""
+    global metrics
+    previous, metrics = metrics, None
+    return previous
+
+
+class _Timer:
+    __slots__ = ("histogram", "start")
+
+    def __init__(self, collection: Metrics, name: str, labels: tuple) -> None:
+        self.histogram = collection.histogram(name, labels)
+
+    def __enter__(self) -> None:
+        self.start = perf_counter()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.histogram.observe(perf_counter() - self.start)
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *exc_info: object) -> None:
+        pass
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def stage(name: str) -> "_Timer | _NullTimer":
+    """
+    Context manager timing a pipeline stage (``"parse"``, ``"decode"``...)
+    into ``warscribe_stage_seconds``; does nothing while disabled.
+    """
+    if metrics is None:
+        return _NULL_TIMER
+    return _Timer(metrics, STAGE_SECONDS, (("stage", name),))
+
+
+def check(edition: str, name: str) -> "_Timer | _NullTimer":
+    """
+    Context manager timing one validation check (``"phase"``, ``"rules"``...)
+    of an edition into ``warscribe_check_seconds``; does nothing while
+    disabled.
+    """
+    if metrics is None:
+        return _NULL_TIMER
+    return _Timer(metrics, CHECK_SECONDS, (("edition", edition), ("check", name)))
@@ -0,0 +1,172 @@
+"""
+Counters and histograms.
+
+A ``Metrics`` collection holds named counters and histograms, each with a
+fixed set of labels (such as the edition code and action type). Updates
+are plain attribute arithmetic and are not locked; collect from one
+thread, or one collection per process, as the corpus pipeline does.
+"""
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Literal, Sequence
+
+# Label pairs, in the order they are exported.
+Labels = tuple[tuple[str, str], ...]
+
+# Metric names used by WARScribe's own hooks.
+STAGE_SECONDS = "warscribe_stage_seconds"
+VALIDATE_SECONDS = "warscribe_validate_seconds"
+CHECK_SECONDS = "warscribe_check_seconds"
+ACTIONS_VALIDATED = "warscribe_actions_validated_total"
+
+# Upper bounds of the default histogram buckets, from 1 µs to 1 s.
+DEFAULT_BUCKETS = (
+    1e-6,
+    2.5e-6,
+    5e-6,
+    1e-5,
+    2.5e-5,
+    5e-5,
+    1e-4,
+    2.5e-4,
+    5e-4,
+    1e-3,
+    1e-2,
+    0.1,
+    1.0,
+)
+
+
+class Counter:
+    """A monotonically increasing count."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+
+class Histogram:
+    """
+    Distribution of observed values over fixed buckets.
+
+    ``counts[i]`` is the number of values at most ``bounds[i]`` and above
+    the previous bound; the last entry counts values above every bound.
+    """
+
+    __slots__ = ("bounds", "counts", "count", "sum")
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        if list(bounds) != sorted(set(bounds)):
+            raise ValueError("Histogram bounds must be increasing.")
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+
+@dataclass(frozen=True)
+class Sample:
+    """
+    Exported state of one counter or histogram.
+
+    For a counter ``value`` is its count; for a histogram it is the sum
+    of the observations, ``count`` their number and ``buckets`` the
+    cumulative count at each upper bound (``inf`` last).
+    """
+
+    name: str
+    kind: Literal["counter", "histogram"]
+    labels: Labels
+    value: float
+    count: int = 0
+    buckets: tuple[tuple[float, int], ...] = ()
+
+
+class Metrics:
+    """
+    A collection of counters and histograms, keyed by name and labels.
+
+    ``exporters`` receive a snapshot on each ``flush``.
+    """
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        exporters: Sequence["Exporter"] = (),
+    ) -> None:
+        self.buckets = tuple(buckets)
+        self.exporters = list(exporters)
+        self._counters: dict[tuple[str, Labels], Counter] = {}
+        self._histograms: dict[tuple[str, Labels], Histogram] = {}
+
+    def counter(self, name: str, labels: Labels = ()) -> Counter:
+        """The counter ``name`` with ``labels``, created on first use."""
+        counter = self._counters.get((name, labels))
+        if counter is None:
+            counter = self._counters[name, labels] = Counter()
+        return counter
+
+    def histogram(self, name: str, labels: Labels = ()) -> Histogram:
+        """The histogram ``name`` with ``labels``, created on first use."""
+        histogram = self._histograms.get((name, labels))
+        if histogram is None:
+            histogram = self._histograms[name, labels] = Histogram(self.buckets)
+        return histogram
+
+    def snapshot(self) -> list[Sample]:
+        """Current values of every metric, sorted by name and labels."""
+        samples = [
+            Sample(name, "counter", labels, counter.value)
+            for (name, labels), counter in self._counters.items()
+        ]
+        for (name, labels), histogram in self._histograms.items():
+            cumulative = 0
+            buckets = []
+            for bound, count in zip(
+                (*histogram.bounds, float("inf")), histogram.counts
+            ):
+                cumulative += count
+                buckets.append((bound, cumulative))
+            samples.append(
+                Sample(
+                    name,
+                    "histogram",
+                    labels,
+                    histogram.sum,
+                    histogram.count,
+                    tuple(buckets),
+                )
+            )
+        samples.sort(key=lambda sample: (sample.name, sample.labels))
+        return samples
+
+    def flush(self) -> list[Sample]:
+        """Send a snapshot to every exporter; returns the snapshot."""
+        samples = self.snapshot()
+        for exporter in self.exporters:
+            exporter.export(samples)
+        return samples
+
+    def reset(self) -> None:
+        """Drop every metric."""
+        self._counters.clear()
+        self._histograms.clear()
+
+
+class Exporter(ABC):
+    """Destination for metric snapshots."""
+
+    @abstractmethod
+    def export(self, samples: Sequence[Sample]) -> None:
+        """Handle one snapshot, as returned by ``Metrics.snapshot``."""
@@ -1,15 +1,26 @@
-"""Schema subpackage for WARScribe-Core."""
-
-from warscribe.schema.action import (
-    Action,
-    ActionType,
-    ChargeAction,
-    FightAction,
-    MoveAction,
-    ShootAction,
-)
-from warscribe.schema.transcript import GameTranscript
-from warscribe.schema.unit import UnitReference
+"""
+Schema subpackage for WARScribe-Core.
+
+Names are imported from their modules on first access, so importing one
+schema module does not build the models of the others.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from warscribe.schema.action import (
+        Action,
+        ActionType,
+        ChargeAction,
+        FightAction,
+        MoveAction,
+        ShootAction,
+        TaggedAction,
+    )
+    from warscribe.schema.lazy import LazyTranscript
+    from warscribe.schema.transcript import GameTranscript
+    from warscribe.schema.unit import UnitReference
 
 __all__ = [
     "Action",
@@ -17,7 +28,45 @@ __all__ = [
     "ChargeAction",
     "FightAction",
     "GameTranscript",
+    "LazyTranscript",
     "MoveAction",
     "ShootAction",
+    "TaggedAction",
     "UnitReference",
 ]
+
+# Module defining each lazily imported name.
+_LAZY = {
+    "Action": "warscribe.schema.action",
+    "ActionType": "warscribe.schema.action",
+    "ChargeAction": "warscribe.schema.action",
+    "FightAction": "warscribe.schema.action",
+    "MoveAction": "warscribe.schema.action",
+    "ShootAction": "warscribe.schema.action",
+    "TaggedAction": "warscribe.schema.action",
+    "LazyTranscript": "warscribe.schema.lazy",
+    "GameTranscript": "warscribe.schema.transcript",
+    "UnitReference": "warscribe.schema.unit",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is not None:
+        value = getattr(import_module(module), name)
+    else:
+        # Submodules, as ``import_module`` would find them.
+        try:
+            value = import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as exc:
+            if exc.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY})
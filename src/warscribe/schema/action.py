@@ -10,10 +10,10 @@ Core action types per ROADMAP v0.1.0:
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional, Union
+from typing import Annotated, Any, Optional, Union
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Discriminator, Field, Tag
 
 from warscribe.schema.unit import UnitReference
 
@@ -192,3 +192,51 @@ class FightAction(BaseAction):
 
 # Union type for all actions
 Action = Union[MoveAction, ShootAction, ChargeAction, FightAction]
+
+
+# Dedicated model for each action type that has one. Every other type
+# (advance, stratagem, ...) decodes through the untagged ``Action`` union,
+# exactly as before tagged decoding was introduced.
+ACTION_MODELS: dict[ActionType, type[BaseAction]] = {
+    ActionType.MOVE: MoveAction,
+    ActionType.SHOOT: ShootAction,
+    ActionType.CHARGE: ChargeAction,
+    ActionType.FIGHT: FightAction,
+}
+
+_UNTYPED_TAG = "untyped"
+
+_ACTION_TAGS: dict[str, str] = {
+    action_type.value: (
+        action_type.value if action_type in ACTION_MODELS else _UNTYPED_TAG
+    )
+    for action_type in ActionType
+}
+
+_MODEL_TAGS: dict[type, str] = {
+    model: action_type.value for action_type, model in ACTION_MODELS.items()
+}
+
+
+def _action_tag(value: Any) -> str:
+    """Select the union member for raw action data or a built action."""
+    if isinstance(value, dict):
+        action_type = value.get("action_type")
+        if isinstance(action_type, ActionType):
+            action_type = action_type.value
+        return _ACTION_TAGS.get(action_type, _UNTYPED_TAG)
+    return _MODEL_TAGS.get(type(value), _UNTYPED_TAG)
+
+
+# Tagged union used for decoding: one model is validated per action, chosen
+# from ``action_type``, instead of pydantic trying every member in turn.
+TaggedAction = Annotated[
+    Union[
+        Annotated[MoveAction, Tag(ActionType.MOVE.value)],
+        Annotated[ShootAction, Tag(ActionType.SHOOT.value)],
+        Annotated[ChargeAction, Tag(ActionType.CHARGE.value)],
+        Annotated[FightAction, Tag(ActionType.FIGHT.value)],
+        Annotated[Action, Tag(_UNTYPED_TAG)],
+    ],
+    Discriminator(_action_tag),
+]
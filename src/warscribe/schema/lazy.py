@@ -0,0 +1,202 @@
+"""
+Lazy transcript view for WARScribe.
+
+``LazyTranscript`` validates a transcript's metadata immediately but keeps
+each action as its raw JSON text, decoding it into an ``Action`` model only
+on first access. Reading players, factions, VP or the winner therefore
+never pays for the actions at all.
+"""
+
+import re
+from typing import Any, Iterator, Optional, Sequence, Union, overload
+
+from pydantic import TypeAdapter
+
+from warscribe.schema.action import Action, TaggedAction
+from warscribe.schema.transcript import GameTranscript
+
+_action_adapter: TypeAdapter[Action] = TypeAdapter(TaggedAction)
+
+# Layout written by ``GameTranscript.to_json`` (indent=2): actions are the
+# only top-level array of objects, so its elements open and close at
+# exactly four spaces of indentation and the array closes at two.
+_ACTIONS_KEY = '\n  "actions": ['
+_ACTION_OPEN = "\n    {"
+_ACTION_CLOSE = "\n    }"
+_ACTIONS_CLOSE = "\n  ]"
+
+# Generic fallback: JSON strings and structural characters.
+_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|[{}\[\]]')
+_COLON = re.compile(r"\s*:")
+_TURN = re.compile(r'"turn"\s*:\s*(\d+)')
+
+
+def _find_actions(json_str: str) -> Optional[tuple[int, int]]:
+    """Return the span of the ``actions`` array, brackets included."""
+    start = json_str.find(_ACTIONS_KEY)
+    if start >= 0:
+        start += len(_ACTIONS_KEY) - 1
+        if json_str.startswith("[]", start):
+            return start, start + 2
+        # Only scalar fields follow the actions, so search from the end.
+        end = json_str.rfind(_ACTIONS_CLOSE, start)
+        if end >= 0 and "[" not in json_str[end + len(_ACTIONS_CLOSE) :]:
+            return start, end + len(_ACTIONS_CLOSE)
+
+    depth = 0
+    key = False
+    start = -1
+    for match in _TOKEN.finditer(json_str):
+        token = match.group()
+        if token in "{[":
+            if key and token == "[":
+                start = match.start()
+                key = False
+            depth += 1
+        elif token in "}]":
+            depth -= 1
+            if start >= 0 and depth == 1:
+                return start, match.end()
+        elif depth == 1 and start < 0:
+            key = token == '"actions"' and bool(_COLON.match(json_str, match.end()))
+    return None
+
+
+def _split_actions(source: str, start: int, end: int) -> list[tuple[int, int]]:
+    """Offsets of each action within ``source[start:end]``, the array text."""
+    spans = []
+    pos = start
+    while source.startswith(_ACTION_OPEN, pos + 1, end):
+        begin = pos + len(_ACTION_OPEN)
+        close = source.find(_ACTION_CLOSE, begin, end)
+        if close < 0:
+            break
+        pos = close + len(_ACTION_CLOSE)
+        spans.append((begin, pos))
+    if spans and pos + len(_ACTIONS_CLOSE) == end:
+        return spans
+    spans.clear()
+
+    depth = 0
+    for match in _TOKEN.finditer(source, start, end):
+        token = match.group()
+        if token in "{[":
+            if depth == 1:
+                pos = match.start()
+            depth += 1
+        elif token in "}]":
+            depth -= 1
+            if depth == 1:
+                spans.append((pos, match.end()))
+    return spans
+
+
+class LazyActionList(Sequence[Action]):
+    """Read-only action sequence that decodes each action on first access."""
+
+    def __init__(self, source: str = "[]", start: int = 0, end: int = 2) -> None:
+        self._source = source
+        self._start = start
+        self._end = end
+        self._spans: Optional[list[tuple[int, int]]] = None
+        self._decoded: dict[int, Action] = {}
+        self._turns: Optional[list[int]] = None
+
+    @property
+    def spans(self) -> list[tuple[int, int]]:
+        """Offsets of each action's raw JSON within the source document."""
+        if self._spans is None:
+            self._spans = _split_actions(self._source, self._start, self._end)
+        return self._spans
+
+    def __len__(self) -> int:
+        return len(self.spans)
+
+    def _decode(self, index: int) -> Action:
+        action = self._decoded.get(index)
+        if action is None:
+            begin, end = self.spans[index]
+            action = self._decoded[index] = _action_adapter.validate_json(
+                self._source[begin:end]
+            )
+        return action
+
+    @overload
+    def __getitem__(self, index: int) -> Action: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Action]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Action, list[Action]]:
+        if isinstance(index, slice):
+            return [self._decode(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("action index out of range")
+        return self._decode(index)
+
+    def __iter__(self) -> Iterator[Action]:
+        for i in range(len(self)):
+            yield self._decode(i)
+
+    @property
+    def decoded_count(self) -> int:
+        """Number of actions decoded so far."""
+        return len(self._decoded)
+
+    def turns(self) -> list[int]:
+        """Turn number of every action, read without decoding it."""
+        if self._turns is None:
+            self._turns = []
+            for begin, end in self.spans:
+                match = _TURN.search(self._source, begin, end)
+                self._turns.append(int(match.group(1)) if match else 0)
+        return self._turns
+
+
+class LazyTranscript:
+    """
+    Read-only view of a serialized ``GameTranscript``.
+
+    Metadata is validated up front and available as attributes
+    (``player1``, ``winner``, ``player1_vp``, ...). ``actions`` is a
+    ``LazyActionList``; use ``materialize`` for a full ``GameTranscript``.
+    """
+
+    def __init__(self, header: GameTranscript, actions: LazyActionList) -> None:
+        self.header = header
+        self.actions = actions
+
+    @classmethod
+    def from_json(cls, json_str: str) -> "LazyTranscript":
+        """Parse a JSON transcript, deferring decoding of its actions."""
+        span = _find_actions(json_str)
+        if span is None:
+            return cls(GameTranscript.from_json(json_str), LazyActionList())
+        start, end = span
+        header = GameTranscript.from_json(json_str[:start] + "[]" + json_str[end:])
+        return cls(header, LazyActionList(json_str, start, end))
+
+    def __getattr__(self, name: str) -> Any:
+        if name in GameTranscript.model_fields:
+            return getattr(self.header, name)
+        raise AttributeError(name)
+
+    def get_actions_for_turn(self, turn: int) -> list[Action]:
+        """Get all actions for a specific turn, decoding only those."""
+        return [
+            self.actions[i]
+            for i, action_turn in enumerate(self.actions.turns())
+            if action_turn == turn
+        ]
+
+    def materialize(self) -> GameTranscript:
+        """Decode every action and return a full ``GameTranscript``."""
+        fields = {
+            name: getattr(self.header, name) for name in GameTranscript.model_fields
+        }
+        fields["actions"] = list(self.actions)
+        return GameTranscript.model_construct(
+            _fields_set=self.header.model_fields_set, **fields
+        )
@@ -6,14 +6,25 @@ including all actions and metadata.
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Iterable, Optional
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
-
-from warscribe.schema.action import Action
+from pydantic import BaseModel, Field, PrivateAttr
+
+from warscribe.instrumentation import hooks
+from warscribe.schema.action import (
+    Action,
+    ActionType,
+    ChargeAction,
+    FightAction,
+    ShootAction,
+    TaggedAction,
+)
 from warscribe.schema.unit import UnitReference
 
+if TYPE_CHECKING:
+    from warscribe.edition.plugin import BatchValidationResult, EditionPlugin
+
 
 class Player(BaseModel):
     """A player in a game."""
@@ -27,6 +38,84 @@ class Player(BaseModel):
     points_total: int = Field(0, ge=0)
 
 
+class _ActionIndex:
+    """
+    Secondary indexes over a transcript's actions.
+
+    Maps turn, actor id, target id and action type to the matching actions
+    in chronological order. The index is derived entirely from the action
+    list, so it never takes part in transcript equality.
+
+    Actions appended to the list are indexed incrementally. Any change
+    that moves the first or last indexed action (removing, inserting,
+    replacing the list, ...) rebuilds the index; replacing an action in
+    the middle of the list in place is not detected, so assign a new list
+    instead.
+    """
+
+    __slots__ = (
+        "source",
+        "count",
+        "first",
+        "last",
+        "by_turn",
+        "by_actor",
+        "by_target",
+        "by_type",
+    )
+
+    def __init__(self) -> None:
+        self.reset(None)
+
+    def reset(self, source: Optional[list[Action]]) -> None:
+        self.source = source
+        self.count = 0
+        self.first: Optional[Action] = None
+        self.last: Optional[Action] = None
+        self.by_turn: dict[int, list[Action]] = {}
+        self.by_actor: dict[UUID, list[Action]] = {}
+        self.by_target: dict[UUID, list[Action]] = {}
+        self.by_type: dict[ActionType, list[Action]] = {}
+
+    def sync(self, actions: list[Action]) -> "_ActionIndex":
+        """Index any actions appended since the last sync."""
+        count = self.count
+        if (
+            actions is not self.source
+            or count > len(actions)
+            or (
+                count
+                and (
+                    actions[0] is not self.first or actions[count - 1] is not self.last
+                )
+            )
+        ):
+            self.reset(actions)
+            count = 0
+        if count < len(actions):
+            for action in actions[count:]:
+                self.add(action)
+            self.count = len(actions)
+            self.first = actions[0]
+            self.last = actions[-1]
+        return self
+
+    def add(self, action: Action) -> None:
+        self.by_turn.setdefault(action.turn, []).append(action)
+        self.by_actor.setdefault(action.actor.id, []).append(action)
+        self.by_type.setdefault(action.action_type, []).append(action)
+        if isinstance(action, (ShootAction, FightAction)):
+            self.by_target.setdefault(action.target.id, []).append(action)
+        elif isinstance(action, ChargeAction):
+            for target_id in {target.id for target in action.targets}:
+                self.by_target.setdefault(target_id, []).append(action)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _ActionIndex)
+
+    __hash__ = None  # type: ignore[assignment]
+
+
 class GameTranscript(BaseModel):
     """
     A complete game transcript.
@@ -52,7 +141,7 @@ class GameTranscript(BaseModel):
     active_player: int = Field(1, ge=1, le=2)
 
     # Actions (chronological)
-    actions: list[Action] = Field(default_factory=list)
+    actions: list[TaggedAction] = Field(default_factory=list)
 
     # Scoring
     player1_vp: int = Field(0, ge=0)
@@ -71,17 +160,54 @@ class GameTranscript(BaseModel):
     # Notes
     notes: Optional[str] = None
 
+    # Lookup indexes, kept in step with ``actions``
+    _index: _ActionIndex = PrivateAttr(default_factory=_ActionIndex)
+
+    def _indexed(self) -> _ActionIndex:
+        return self._index.sync(self.actions)
+
     def add_action(self, action: Action) -> None:
         """Add an action to the transcript."""
         self.actions.append(action)
+        self._indexed()
+
+    def add_actions(
+        self,
+        actions: Iterable[Action],
+        plugin: Optional["EditionPlugin"] = None,
+    ) -> Optional["BatchValidationResult"]:
+        """
+        Add a batch of actions to the transcript.
+
+        If an edition plugin is given, the batch is validated with
+        ``plugin.validate_actions`` first and only appended if no action
+        is invalid. Returns the batch result, or None without a plugin.
+        """
+        batch = list(actions)
+        result = None
+        if plugin is not None:
+            result = plugin.validate_actions(batch)
+            if not result.is_valid:
+                return result
+        self.actions.extend(batch)
+        self._indexed()
+        return result
 
     def get_actions_for_turn(self, turn: int) -> list[Action]:
         """Get all actions for a specific turn."""
-        return [a for a in self.actions if a.turn == turn]
+        return list(self._indexed().by_turn.get(turn, ()))
 
     def get_actions_by_unit(self, unit_id: UUID) -> list[Action]:
         """Get all actions by a specific unit."""
-        return [a for a in self.actions if a.actor.id == unit_id]
+        return list(self._indexed().by_actor.get(unit_id, ()))
+
+    def get_actions_targeting(self, unit_id: UUID) -> list[Action]:
+        """Get all actions targeting a specific unit."""
+        return list(self._indexed().by_target.get(unit_id, ()))
+
+    def get_actions_by_type(self, action_type: ActionType) -> list[Action]:
+        """Get all actions of a specific type."""
+        return list(self._indexed().by_type.get(ActionType(action_type), ()))
 
     def to_json(self) -> str:
         """Serialize to JSON string."""
@@ -90,4 +216,24 @@ class GameTranscript(BaseModel):
     @classmethod
     def from_json(cls, json_str: str) -> "GameTranscript":
         """Deserialize from JSON string."""
-        return cls.model_validate_json(json_str)
+        with hooks.stage("parse"):
+            return cls.model_validate_json(json_str)
+
+    def to_trusted_json(self) -> str:
+        """Serialize for reloading with ``from_trusted_json``."""
+        from warscribe.schema.trusted import dump_trusted
+
+        return dump_trusted(self)
+
+    @classmethod
+    def from_trusted_json(cls, data: str) -> "GameTranscript":
+        """
+        Deserialize output of ``to_trusted_json`` without re-validation.
+
+        Only for transcripts our own pipeline wrote. Raises ``ValueError``
+        if the version marker, schema fingerprint or checksum does not
+        match; use ``from_json`` for anything else.
+        """
+        from warscribe.schema.trusted import load_trusted
+
+        return load_trusted(cls, data)
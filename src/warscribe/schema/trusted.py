@@ -0,0 +1,200 @@
+"""
+Trusted (unvalidated) transcript loading.
+
+Transcripts written by our own pipeline have already passed validation.
+``dump_trusted`` writes them behind a marker line carrying a format
+version, a schema fingerprint and a CRC32 of the body; ``load_trusted``
+checks that marker and then builds the models directly from the parsed
+JSON, converting only the types JSON cannot represent (UUIDs, datetimes,
+enums, tuples) and skipping every field constraint. Identical unit
+references are decoded once, but every occurrence gets its own
+``UnitReference``, as with ``from_json``.
+
+Input without a matching marker is rejected, so foreign or hand-edited
+JSON has to go through ``GameTranscript.from_json`` instead.
+"""
+
+import json
+import zlib
+from datetime import datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, TypeVar
+from uuid import UUID, SafeUUID
+
+from pydantic import BaseModel
+from pydantic_core import from_json
+
+from warscribe.instrumentation import hooks
+from warscribe.schema.action import (
+    ActionResult,
+    ActionType,
+    BaseAction,
+    ChargeAction,
+    FightAction,
+    MoveAction,
+    RelativeDistance,
+    ShootAction,
+)
+from warscribe.schema.unit import UnitReference
+
+if TYPE_CHECKING:
+    from warscribe.schema.transcript import GameTranscript
+
+TRUSTED_VERSION = 1
+_MARKER = "#warscribe-trusted"
+
+_M = TypeVar("_M", bound=BaseModel)
+
+_new = object.__new__
+_setattr = object.__setattr__
+_set_fields_set = BaseModel.__dict__["__pydantic_fields_set__"].__set__
+_set_extra = BaseModel.__dict__["__pydantic_extra__"].__set__
+_set_private = BaseModel.__dict__["__pydantic_private__"].__set__
+_UUID_SAFETY = SafeUUID.unknown
+
+
+def construct(cls: type[_M], values: dict[str, Any]) -> _M:
+    """
+    Build a model from already-valid values, skipping validation.
+
+    ``values`` must hold every field, already converted to its final type,
+    and becomes the instance ``__dict__``. Only for models without private
+    attributes; use ``model_construct`` for those.
+    """
+    obj = _new(cls)
+    _setattr(obj, "__dict__", values)
+    _set_fields_set(obj, set(values))
+    _set_extra(obj, None)
+    _set_private(obj, None)
+    return obj
+
+
+def uuid_from_int(value: int) -> UUID:
+    """Build a UUID from its 128-bit integer value without re-checking it."""
+    uuid = _new(UUID)
+    _setattr(uuid, "int", value)
+    _setattr(uuid, "is_safe", _UUID_SAFETY)
+    return uuid
+
+
+def uuid_from_bytes(raw: bytes) -> UUID:
+    """Build a UUID from 16 raw bytes without re-checking them."""
+    return uuid_from_int(int.from_bytes(raw, "big"))
+
+
+def _uuid(value: str) -> UUID:
+    return uuid_from_int(int(value.replace("-", ""), 16))
+
+
+def _datetime(value: str) -> datetime:
+    # fromisoformat only accepts a trailing "Z" from Python 3.11
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+def _position(value: Any) -> Any:
+    return None if value is None else tuple(value)
+
+
+_ACTION_TYPES = {member.value: member for member in ActionType}
+_ACTION_RESULTS = {member.value: member for member in ActionResult}
+
+# Each action model has one required field no other model has.
+_ACTION_KEYS: tuple[tuple[str, type[BaseAction]], ...] = (
+    ("distance_inches", MoveAction),
+    ("shots", ShootAction),
+    ("targets", ChargeAction),
+    ("attacks", FightAction),
+)
+
+
+class _Builder:
+    """Builds models from one parsed trusted transcript."""
+
+    def __init__(self) -> None:
+        # Decoded field values of each distinct unit reference.
+        self.units: dict[tuple, dict[str, Any]] = {}
+
+    def unit(self, data: dict[str, Any]) -> UnitReference:
+        key = tuple(data.values())
+        values = self.units.get(key)
+        if values is None:
+            data["id"] = _uuid(data["id"])
+            values = self.units[key] = data
+        # Units are mutable, so occurrences must not share an instance.
+        return construct(UnitReference, values.copy())
+
+    def action(self, data: dict[str, Any]) -> BaseAction:
+        data["id"] = _uuid(data["id"])
+        data["action_type"] = _ACTION_TYPES[data["action_type"]]
+        data["timestamp"] = _datetime(data["timestamp"])
+        data["actor"] = self.unit(data["actor"])
+        data["result"] = _ACTION_RESULTS[data["result"]]
+        for key, cls in _ACTION_KEYS:
+            if key in data:
+                break
+        else:
+            raise ValueError("Trusted transcript contains an unknown action model.")
+
+        if cls is MoveAction:
+            data["start_position"] = _position(data["start_position"])
+            data["end_position"] = _position(data["end_position"])
+            relative = data["relative_distances"]
+            for i, item in enumerate(relative):
+                item["target_unit_id"] = _uuid(item["target_unit_id"])
+                relative[i] = construct(RelativeDistance, item)
+        elif cls is ChargeAction:
+            data["targets"] = [self.unit(u) for u in data["targets"]]
+            data["charge_roll"] = tuple(data["charge_roll"])
+        else:
+            data["target"] = self.unit(data["target"])
+        return construct(cls, data)
+
+
+@lru_cache(maxsize=None)
+def schema_fingerprint() -> str:
+    """Short fingerprint of the transcript schema, part of the marker."""
+    from warscribe.schema.transcript import GameTranscript
+
+    schema = json.dumps(GameTranscript.model_json_schema(), sort_keys=True)
+    return f"{zlib.crc32(schema.encode()):08x}"
+
+
+def dump_trusted(transcript: "GameTranscript") -> str:
+    """Serialize a validated transcript for ``load_trusted``."""
+    body = transcript.model_dump_json()
+    checksum = zlib.crc32(body.encode())
+    return (
+        f"{_MARKER} v{TRUSTED_VERSION} schema={schema_fingerprint()} "
+        f"crc32={checksum:08x}\n{body}"
+    )
+
+
+def load_trusted(cls: type["GameTranscript"], data: str) -> "GameTranscript":
+    """Load a transcript written by ``dump_trusted`` without validation."""
+    marker, _, body = data.partition("\n")
+    expected = f"{_MARKER} v{TRUSTED_VERSION} schema={schema_fingerprint()} crc32="
+    if not marker.startswith(_MARKER):
+        raise ValueError("Not a trusted transcript; use GameTranscript.from_json.")
+    if not marker.startswith(expected):
+        raise ValueError(
+            "Trusted transcript was written by a different format or schema "
+            "version; use GameTranscript.from_json."
+        )
+    if marker[len(expected) :] != f"{zlib.crc32(body.encode()):08x}":
+        raise ValueError("Trusted transcript checksum mismatch.")
+
+    with hooks.stage("trusted_load"):
+        builder = _Builder()
+        fields = from_json(body)
+        fields["id"] = _uuid(fields["id"])
+        for key in ("player1", "player2"):
+            player = fields[key]
+            player["units"] = [builder.unit(u) for u in player["units"]]
+            fields[key] = construct(cls.model_fields[key].annotation, player)
+        fields["actions"] = [builder.action(a) for a in fields["actions"]]
+        fields["started_at"] = _datetime(fields["started_at"])
+        if fields["ended_at"] is not None:
+            fields["ended_at"] = _datetime(fields["ended_at"])
+        return cls.model_construct(**fields)
@@ -0,0 +1,54 @@
+"""
+Serialization formats for WARScribe transcripts.
+
+Alternatives to the single indented JSON document produced by
+``GameTranscript.to_json`` for large games and archives, and a parser
+for the bracket text notation.
+"""
+
+from warscribe.serialization.archive import (
+    ArchiveEntry,
+    ArchiveWriter,
+    GameArchive,
+    write_archive,
+)
+from warscribe.serialization.binary import decode_transcript, encode_transcript
+from warscribe.serialization.journal import GameRecorder
+from warscribe.serialization.ndjson import (
+    TranscriptFooter,
+    TranscriptHeader,
+    TranscriptReader,
+    TranscriptWriter,
+    iter_ndjson_actions,
+    read_ndjson,
+    write_ndjson,
+)
+from warscribe.serialization.notation import (
+    NotationError,
+    NotationReader,
+    SymbolTable,
+    iter_notation_actions,
+    parse_notation,
+)
+
+__all__ = [
+    "ArchiveEntry",
+    "ArchiveWriter",
+    "GameArchive",
+    "GameRecorder",
+    "NotationError",
+    "NotationReader",
+    "SymbolTable",
+    "TranscriptFooter",
+    "TranscriptHeader",
+    "TranscriptReader",
+    "TranscriptWriter",
+    "decode_transcript",
+    "encode_transcript",
+    "iter_ndjson_actions",
+    "iter_notation_actions",
+    "parse_notation",
+    "read_ndjson",
+    "write_archive",
+    "write_ndjson",
+]
@@ -0,0 +1,339 @@
+"""
+Multi-game transcript archive.
+
+Packs many transcripts into one file that is read through ``mmap``, so
+opening an archive and fetching any game never scans the file.
+
+Layout (little-endian)::
+
+    header   magic "WSCA", format version (u8), padding
+    games    binary transcripts (see ``binary``), back to back
+    entries  one fixed-size row per game: id, offset, length and metadata
+    slots    open-addressing hash table: game id -> entry position
+    strings  count, then (length, UTF-8 bytes) per metadata string
+    footer   entries, slots and strings offsets, game count, slot count,
+             magic "WSCA"
+
+Game ``n`` is found by reading row ``n`` of the entry table. A game id is
+found by probing the hash table from slot ``crc32(id) % slots``; the table
+is kept at most half full. Per-game metadata (edition, factions, winner,
+VP, turn, action count) is read from the entry row without decoding the
+game. Only metadata strings live in the archive string table, so it stays
+small however many games there are.
+"""
+
+import mmap
+import struct
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO, Iterable, Iterator, Optional, Union
+from uuid import UUID
+
+from warscribe.schema.transcript import GameTranscript
+from warscribe.serialization.binary import decode_transcript, encode_transcript
+
+ARCHIVE_MAGIC = b"WSCA"
+ARCHIVE_VERSION = 1
+
+_HEADER = struct.Struct("<4sBxxx")
+_U32 = struct.Struct("<I")
+# id, offset, length, edition, player1 faction, player2 faction, winner,
+# player1 VP, player2 VP, current turn, action count
+_ENTRY = struct.Struct("<16sQIIIIBiiiI")
+# game id, entry position + 1 (0 = empty)
+_SLOT = struct.Struct("<16sI")
+# entries offset, slots offset, strings offset, game count, slot count, magic
+_FOOTER = struct.Struct("<QQQII4s")
+
+
+@dataclass(frozen=True)
+class ArchiveEntry:
+    """Metadata for one game in an archive, readable without decoding it."""
+
+    id: UUID
+    offset: int
+    length: int
+    edition: str
+    player1_faction: str
+    player2_faction: str
+    winner: Optional[int]
+    player1_vp: int
+    player2_vp: int
+    current_turn: int
+    action_count: int
+
+
+def _slot_count(games: int) -> int:
+    count = 8
+    while count < 2 * games:
+        count *= 2
+    return count
+
+
+class ArchiveWriter:
+    """
+    Writes transcripts into a new archive.
+
+    Call ``add`` once per game and ``close`` (or leave the ``with`` block)
+    to write the index; an archive without its index cannot be opened.
+    If the ``with`` block raises, the partial file is deleted instead.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self._path = Path(path)
+        self._stream: Optional[BinaryIO] = open(path, "wb")
+        self._stream.write(_HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION))
+        self._offset = _HEADER.size
+        self._entries = bytearray()
+        self._ids: dict[bytes, int] = {}
+        self._strings: dict[str, int] = {}
+
+    def _string(self, value: str) -> int:
+        index = self._strings.get(value)
+        if index is None:
+            index = self._strings[value] = len(self._strings)
+        return index
+
+    def add(self, transcript: GameTranscript) -> int:
+        """Append a game and return its position in the archive."""
+        if self._stream is None:
+            raise ValueError("Archive writer is closed.")
+        raw_id = transcript.id.bytes
+        if raw_id in self._ids:
+            raise ValueError(f"Game {transcript.id} is already in the archive.")
+        data = encode_transcript(transcript)
+        self._stream.write(data)
+
+        position = self._ids[raw_id] = len(self._ids)
+        self._entries += _ENTRY.pack(
+            raw_id,
+            self._offset,
+            len(data),
+            self._string(transcript.edition),
+            self._string(transcript.player1.faction),
+            self._string(transcript.player2.faction),
+            transcript.winner or 0,
+            transcript.player1_vp,
+            transcript.player2_vp,
+            transcript.current_turn,
+            len(transcript.actions),
+        )
+        self._offset += len(data)
+        return position
+
+    def close(self) -> None:
+        """Write the index and footer and close the file."""
+        if self._stream is None:
+            return
+        count = _slot_count(len(self._ids))
+        slots = [b""] * count
+        for raw_id, position in self._ids.items():
+            slot = zlib.crc32(raw_id) % count
+            while slots[slot]:
+                slot = (slot + 1) % count
+            slots[slot] = _SLOT.pack(raw_id, position + 1)
+        empty = _SLOT.pack(bytes(16), 0)
+
+        strings = bytearray(_U32.pack(len(self._strings)))
+        for value in self._strings:
+            raw = value.encode()
+            strings += _U32.pack(len(raw))
+            strings += raw
+
+        entries_offset = self._offset
+        slots_offset = entries_offset + len(self._entries)
+        strings_offset = slots_offset + count * _SLOT.size
+        self._stream.write(self._entries)
+        self._stream.write(b"".join(slot or empty for slot in slots))
+        self._stream.write(strings)
+        self._stream.write(
+            _FOOTER.pack(
+                entries_offset,
+                slots_offset,
+                strings_offset,
+                len(self._ids),
+                count,
+                ARCHIVE_MAGIC,
+            )
+        )
+        self._stream.close()
+        self._stream = None
+
+    def discard(self) -> None:
+        """Close the file without an index and delete it."""
+        if self._stream is None:
+            return
+        self._stream.close()
+        self._stream = None
+        self._path.unlink(missing_ok=True)
+
+    def __enter__(self) -> "ArchiveWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        if exc_type is not None:
+            self.discard()
+        else:
+            self.close()
+
+
+class GameArchive:
+    """
+    Random-access reader for an archive written by ``ArchiveWriter``.
+
+    ``archive[n]`` decodes game ``n``, ``archive.get(game_id)`` looks a game
+    up by id and ``archive.entry(n)`` returns its metadata only.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._read_index()
+        except (struct.error, UnicodeDecodeError, ValueError):
+            self._map.close()
+            raise
+
+    def _read_index(self) -> None:
+        buf = self._map
+        if len(buf) < _HEADER.size + _FOOTER.size:
+            raise ValueError("File is too short to be a transcript archive.")
+        magic, version = _HEADER.unpack_from(buf)
+        if magic != ARCHIVE_MAGIC:
+            raise ValueError("Not a WARScribe transcript archive.")
+        if version != ARCHIVE_VERSION:
+            raise ValueError(f"Unsupported archive version {version}.")
+        (
+            self._entries_offset,
+            self._slots_offset,
+            strings_offset,
+            self._count,
+            self._slot_count,
+            magic,
+        ) = _FOOTER.unpack_from(buf, len(buf) - _FOOTER.size)
+        if magic != ARCHIVE_MAGIC:
+            raise ValueError("Transcript archive is incomplete or corrupt.")
+
+        self._strings: list[str] = []
+        pos = strings_offset
+        (n_strings,) = _U32.unpack_from(buf, pos)
+        pos += _U32.size
+        for _ in range(n_strings):
+            (length,) = _U32.unpack_from(buf, pos)
+            pos += _U32.size
+            self._strings.append(buf[pos : pos + length].decode())
+            pos += length
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _position(self, index: int) -> int:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("archive index out of range")
+        return index
+
+    def entry(self, index: int) -> ArchiveEntry:
+        """Metadata for game ``index``."""
+        (
+            raw_id,
+            offset,
+            length,
+            edition,
+            faction1,
+            faction2,
+            winner,
+            player1_vp,
+            player2_vp,
+            current_turn,
+            action_count,
+        ) = _ENTRY.unpack_from(
+            self._map, self._entries_offset + self._position(index) * _ENTRY.size
+        )
+        return ArchiveEntry(
+            id=UUID(bytes=raw_id),
+            offset=offset,
+            length=length,
+            edition=self._strings[edition],
+            player1_faction=self._strings[faction1],
+            player2_faction=self._strings[faction2],
+            winner=winner or None,
+            player1_vp=player1_vp,
+            player2_vp=player2_vp,
+            current_turn=current_turn,
+            action_count=action_count,
+        )
+
+    def entries(self) -> Iterator[ArchiveEntry]:
+        """Metadata for every game, in archive order."""
+        for index in range(self._count):
+            yield self.entry(index)
+
+    def find(self, game_id: UUID) -> Optional[int]:
+        """Position of the game with ``game_id``, or None."""
+        raw_id = game_id.bytes
+        slot = zlib.crc32(raw_id) % self._slot_count
+        while True:
+            stored, position = _SLOT.unpack_from(
+                self._map, self._slots_offset + slot * _SLOT.size
+            )
+            if position == 0:
+                return None
+            if stored == raw_id:
+                return position - 1
+            slot = (slot + 1) % self._slot_count
+
+    def __contains__(self, game_id: object) -> bool:
+        return isinstance(game_id, UUID) and self.find(game_id) is not None
+
+    def read_bytes(self, index: int) -> bytes:
+        """The encoded binary transcript of game ``index``."""
+        entry = self.entry(index)
+        return self._map[entry.offset : entry.offset + entry.length]
+
+    def __getitem__(self, index: int) -> GameTranscript:
+        return decode_transcript(self.read_bytes(index))
+
+    def __iter__(self) -> Iterator[GameTranscript]:
+        for index in range(self._count):
+            yield self[index]
+
+    def get(self, game_id: UUID) -> GameTranscript:
+        """Decode the game with ``game_id``."""
+        index = self.find(game_id)
+        if index is None:
+            raise KeyError(game_id)
+        return self[index]
+
+    def close(self) -> None:
+        """Release the memory map."""
+        self._map.close()
+
+    def __enter__(self) -> "GameArchive":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+def write_archive(path: Union[str, Path], transcripts: Iterable[GameTranscript]) -> int:
+    """Write ``transcripts`` to a new archive and return the game count."""
+    with ArchiveWriter(path) as writer:
+        count = 0
+        for transcript in transcripts:
+            writer.add(transcript)
+            count += 1
+    return count
@@ -0,0 +1,243 @@
+"""
+Journaled game recorder for live events.
+
+``GameRecorder`` wraps a ``GameTranscript`` and persists it as a snapshot
+plus an append-only journal:
+
+- ``snapshot-<generation>.json`` is a trusted-JSON snapshot of the whole
+  transcript, written atomically.
+- ``journal-<generation>.ndjson`` holds one NDJSON record per change made
+  since that snapshot: action records, and footer records for state
+  updates (turn, VP, winner, ...).
+
+Recording an action appends a single line, so its cost does not grow with
+the length of the game. The journal is fsynced every ``sync_every``
+records and compacted into a new snapshot every ``compact_every`` actions.
+After a crash, ``GameRecorder.recover`` loads the newest snapshot and
+replays its journal, discarding a torn final line if there is one.
+"""
+
+import os
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Optional, TextIO, Union
+
+from pydantic import TypeAdapter, ValidationError
+
+from warscribe.schema.action import Action
+from warscribe.schema.transcript import GameTranscript
+from warscribe.serialization.ndjson import (
+    ActionRecord,
+    Record,
+    TranscriptFooter,
+)
+
+_SNAPSHOT = "snapshot-{:08d}.json"
+_JOURNAL = "journal-{:08d}.ndjson"
+
+_record_adapter: TypeAdapter[Record] = TypeAdapter(Record)
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Persist a rename or new file in ``directory`` (POSIX only)."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _generation(path: Path) -> int:
+    return int(path.stem.split("-", 1)[1])
+
+
+class GameRecorder:
+    """
+    Crash-safe, append-only recorder around a ``GameTranscript``.
+
+    Create one with ``start`` for a new game or ``recover`` to resume a
+    game after a restart or crash. Use as a context manager, or call
+    ``close`` at the end of the game to leave a single compact snapshot.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        transcript: GameTranscript,
+        generation: int,
+        sync_every: int = 16,
+        compact_every: int = 1000,
+    ) -> None:
+        self.directory = directory
+        self.transcript = transcript
+        self.sync_every = sync_every
+        self.compact_every = compact_every
+        self._generation = generation
+        self._pending = 0
+        self._since_compaction = 0
+        self._journal: Optional[TextIO] = self._open_journal()
+
+    @classmethod
+    def start(
+        cls,
+        directory: Union[str, Path],
+        transcript: GameTranscript,
+        **options: Any,
+    ) -> "GameRecorder":
+        """Start recording a new game into an empty directory."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        if any(directory.glob("snapshot-*.json")):
+            raise FileExistsError(f"A game is already recorded in {directory}.")
+        cls._write_snapshot(directory, transcript, 0)
+        return cls(directory, transcript, 0, **options)
+
+    @classmethod
+    def recover(cls, directory: Union[str, Path], **options: Any) -> "GameRecorder":
+        """Resume a recorded game from its newest snapshot and journal."""
+        directory = Path(directory)
+        snapshots = sorted(directory.glob("snapshot-*.json"), key=_generation)
+        if not snapshots:
+            raise FileNotFoundError(f"No recorded game in {directory}.")
+        snapshot = snapshots[-1]
+        generation = _generation(snapshot)
+        transcript = GameTranscript.from_trusted_json(snapshot.read_text("utf-8"))
+
+        journal = directory / _JOURNAL.format(generation)
+        if journal.exists():
+            cls._replay(journal, transcript)
+        cls._remove_older(directory, generation)
+        return cls(directory, transcript, generation, **options)
+
+    @staticmethod
+    def _write_snapshot(
+        directory: Path, transcript: GameTranscript, generation: int
+    ) -> None:
+        path = directory / _SNAPSHOT.format(generation)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(transcript.to_trusted_json())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        _fsync_directory(directory)
+
+    @staticmethod
+    def _replay(journal: Path, transcript: GameTranscript) -> None:
+        good = 0
+        with open(journal, "rb") as f:
+            lines = f.readlines()
+        for number, line in enumerate(lines, start=1):
+            try:
+                if not line.endswith(b"\n"):
+                    raise ValueError("Incomplete journal record.")
+                record = _record_adapter.validate_json(line)
+            except (ValidationError, ValueError):
+                if number == len(lines):
+                    # Torn write from a crash: drop it and keep going.
+                    with open(journal, "r+b") as f:
+                        f.truncate(good)
+                    return
+                raise ValueError(f"{journal.name}:{number}: corrupt record.")
+            if isinstance(record, ActionRecord):
+                transcript.add_action(record.action)
+            elif isinstance(record, TranscriptFooter):
+                for name, value in record:
+                    if name != "record":
+                        setattr(transcript, name, value)
+            else:
+                raise ValueError(f"{journal.name}:{number}: unexpected header.")
+            good += len(line)
+
+    @staticmethod
+    def _remove_older(directory: Path, generation: int) -> None:
+        for pattern in ("snapshot-*.json", "journal-*.ndjson"):
+            for path in directory.glob(pattern):
+                if _generation(path) < generation:
+                    path.unlink()
+        for path in directory.glob("snapshot-*.tmp"):
+            path.unlink()
+
+    def _open_journal(self) -> TextIO:
+        path = self.directory / _JOURNAL.format(self._generation)
+        journal = open(path, "a", encoding="utf-8")
+        _fsync_directory(self.directory)
+        return journal
+
+    def _append(self, record: Record) -> None:
+        if self._journal is None:
+            raise ValueError("Recorder is closed.")
+        self._journal.write(record.model_dump_json() + "\n")
+        self._pending += 1
+        if self._pending >= self.sync_every:
+            self.flush()
+
+    def add_action(self, action: Action) -> None:
+        """Record an action."""
+        self._append(ActionRecord(action=action))
+        self.transcript.add_action(action)
+        self._since_compaction += 1
+        if self._since_compaction >= self.compact_every:
+            self.compact()
+
+    def update(self, **fields: Any) -> None:
+        """
+        Record a change to the game state.
+
+        Accepts the footer fields: ``current_turn``, ``active_player``,
+        ``player1_vp``, ``player2_vp``, ``winner``, ``conceded`` and
+        ``ended_at``.
+        """
+        unknown = set(fields) - set(TranscriptFooter.model_fields) - {"record"}
+        if unknown or "record" in fields:
+            raise ValueError(f"Cannot record fields: {sorted(unknown)}.")
+        current = TranscriptFooter.from_transcript(self.transcript).model_dump()
+        footer = TranscriptFooter.model_validate({**current, **fields})
+        self._append(footer)
+        for name in fields:
+            setattr(self.transcript, name, getattr(footer, name))
+
+    def flush(self) -> None:
+        """Force all recorded changes to disk."""
+        if self._journal is None:
+            return
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+        self._pending = 0
+
+    def compact(self) -> None:
+        """Fold the journal into a new snapshot and start a fresh journal."""
+        if self._journal is None:
+            raise ValueError("Recorder is closed.")
+        self.flush()
+        self._write_snapshot(self.directory, self.transcript, self._generation + 1)
+        self._journal.close()
+        self._generation += 1
+        self._journal = self._open_journal()
+        self._remove_older(self.directory, self._generation)
+        self._since_compaction = 0
+
+    def close(self) -> None:
+        """Compact to a single snapshot and stop recording."""
+        if self._journal is None:
+            return
+        self.compact()
+        self._journal.close()
+        self._journal = None
+        (self.directory / _JOURNAL.format(self._generation)).unlink()
+
+    def __enter__(self) -> "GameRecorder":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.flush()
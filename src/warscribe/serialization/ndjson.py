@@ -0,0 +1,236 @@
+"""
+Line-delimited (NDJSON) transcript format.
+
+A transcript is written as one JSON record per line:
+
+- a ``header`` record with the game metadata and players,
+- one ``action`` record per action, in chronological order,
+- a ``footer`` record with the final game state, VP and winner.
+
+Games that are still in progress simply have no footer yet. Records are
+read and written one at a time, so a game never has to be held in memory
+as a single string.
+"""
+
+import warnings
+from datetime import datetime
+from types import TracebackType
+from typing import Annotated, Iterator, Literal, Optional, TextIO, Union
+from uuid import UUID
+
+from pydantic import BaseModel, Field, TypeAdapter
+
+from warscribe.schema.action import Action, TaggedAction
+from warscribe.schema.transcript import GameTranscript, Player
+
+NDJSON_VERSION = 1
+
+
+class TranscriptHeader(BaseModel):
+    """First record of an NDJSON transcript: game metadata."""
+
+    record: Literal["header"] = "header"
+    format_version: int = NDJSON_VERSION
+
+    id: UUID
+    edition: str
+    points_limit: int
+    mission: str
+    deployment: str
+    player1: Player
+    player2: Player
+    started_at: datetime
+    notes: Optional[str] = None
+
+    @classmethod
+    def from_transcript(cls, transcript: GameTranscript) -> "TranscriptHeader":
+        """Build the header record for a transcript."""
+        return cls(**{name: getattr(transcript, name) for name in _HEADER_FIELDS})
+
+
+class ActionRecord(BaseModel):
+    """A single action record."""
+
+    record: Literal["action"] = "action"
+    action: TaggedAction
+
+
+class TranscriptFooter(BaseModel):
+    """Last record of an NDJSON transcript: final state and result."""
+
+    record: Literal["footer"] = "footer"
+
+    current_turn: int = Field(1, ge=1)
+    active_player: int = Field(1, ge=1, le=2)
+    player1_vp: int = Field(0, ge=0)
+    player2_vp: int = Field(0, ge=0)
+    winner: Optional[int] = Field(None, ge=1, le=2)
+    conceded: bool = False
+    ended_at: Optional[datetime] = None
+
+    @classmethod
+    def from_transcript(cls, transcript: GameTranscript) -> "TranscriptFooter":
+        """Build the footer record for a transcript."""
+        return cls(**{name: getattr(transcript, name) for name in _FOOTER_FIELDS})
+
+
+_HEADER_FIELDS = tuple(
+    name
+    for name in TranscriptHeader.model_fields
+    if name in GameTranscript.model_fields
+)
+_FOOTER_FIELDS = tuple(
+    name
+    for name in TranscriptFooter.model_fields
+    if name in GameTranscript.model_fields
+)
+
+Record = Annotated[
+    Union[TranscriptHeader, ActionRecord, TranscriptFooter],
+    Field(discriminator="record"),
+]
+
+_record_adapter: TypeAdapter[Record] = TypeAdapter(Record)
+
+
+class TranscriptReader:
+    """
+    Incremental NDJSON transcript reader.
+
+    The header is read when the reader is created; actions are then
+    validated and yielded one at a time by iterating the reader. Once
+    iteration finishes, ``footer`` holds the footer record (or ``None``
+    for a game still in progress).
+    """
+
+    def __init__(self, stream: TextIO) -> None:
+        self._lines = enumerate(stream, start=1)
+        self._line_no = 0
+        self._consumed = False
+        self.footer: Optional[TranscriptFooter] = None
+
+        record = self._next_record()
+        if not isinstance(record, TranscriptHeader):
+            raise ValueError(f"Line {self._line_no}: expected a header record.")
+        if record.format_version > NDJSON_VERSION:
+            raise ValueError(
+                f"Unsupported NDJSON format version {record.format_version}."
+            )
+        self.header: TranscriptHeader = record
+
+    def _next_record(self) -> Optional[Record]:
+        for self._line_no, line in self._lines:
+            if line.strip():
+                return _record_adapter.validate_json(line)
+        return None
+
+    def __iter__(self) -> Iterator[Action]:
+        if self._consumed:
+            raise ValueError("Transcript actions have already been read.")
+        self._consumed = True
+
+        while (record := self._next_record()) is not None:
+            if isinstance(record, ActionRecord):
+                yield record.action
+            elif isinstance(record, TranscriptFooter):
+                self.footer = record
+                break
+            else:
+                raise ValueError(f"Line {self._line_no}: unexpected header record.")
+
+        trailing = self._next_record()
+        if trailing is not None:
+            raise ValueError(f"Line {self._line_no}: record after footer.")
+
+    def read_transcript(self) -> GameTranscript:
+        """Read the remaining records into a ``GameTranscript``."""
+        actions = list(self)
+        fields = self.header.model_dump(exclude={"record", "format_version"})
+        if self.footer is not None:
+            fields.update(self.footer.model_dump(exclude={"record"}))
+        return GameTranscript(**fields, actions=actions)
+
+
+class TranscriptWriter:
+    """
+    Incremental NDJSON transcript writer.
+
+    Writes the header on creation; each ``write_action`` call then appends
+    a single line. ``finish`` writes the footer from the final transcript
+    state and closes; ``close`` without a transcript leaves the game in
+    progress. Used as a context manager, the writer closes automatically
+    and warns if a block that exits cleanly never wrote the footer.
+
+    To continue a game already on disk, open the file in append mode and
+    pass ``write_header=False``.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO,
+        transcript: GameTranscript,
+        write_header: bool = True,
+    ) -> None:
+        self._stream = stream
+        self._closed = False
+        if write_header:
+            self._write(TranscriptHeader.from_transcript(transcript))
+
+    def _write(self, record: BaseModel) -> None:
+        if self._closed:
+            raise ValueError("Transcript writer is closed.")
+        self._stream.write(record.model_dump_json())
+        self._stream.write("\n")
+
+    def write_action(self, action: Action) -> None:
+        """Append one action record."""
+        self._write(ActionRecord(action=action))
+
+    def finish(self, transcript: GameTranscript) -> None:
+        """Write the footer from the final transcript state and close."""
+        self.close(transcript)
+
+    def close(self, transcript: Optional[GameTranscript] = None) -> None:
+        """Write the footer (if a final transcript is given) and close."""
+        if self._closed:
+            return
+        if transcript is not None:
+            self._write(TranscriptFooter.from_transcript(transcript))
+        self._stream.flush()
+        self._closed = True
+
+    def __enter__(self) -> "TranscriptWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        if exc_type is None and not self._closed:
+            warnings.warn(
+                "Transcript writer closed without a footer; call "
+                "finish(transcript) to record the result, or close() to "
+                "leave the game in progress.",
+                stacklevel=2,
+            )
+        self.close()
+
+
+def write_ndjson(transcript: GameTranscript, stream: TextIO) -> None:
+    """Write a complete transcript as NDJSON."""
+    writer = TranscriptWriter(stream, transcript)
+    for action in transcript.actions:
+        writer.write_action(action)
+    writer.finish(transcript)
+
+
+def read_ndjson(stream: TextIO) -> GameTranscript:
+    """Read a complete NDJSON transcript."""
+    return TranscriptReader(stream).read_transcript()
+
+
+def iter_ndjson_actions(stream: TextIO) -> Iterator[Action]:
+    """Yield validated actions from an NDJSON transcript one at a time."""
+    yield from TranscriptReader(stream)
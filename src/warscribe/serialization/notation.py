@@ -0,0 +1,429 @@
+"""
+Bracket text notation (see ``docs/notation.md``).
+
+A game is written one line at a time::
+
+    === Turn 1 ===
+    [MOVE: CPT-01 -> Zone-A, Distance: 6"]
+    [SHOOT: TNK-02 -> Enemy-01, Result: 3 wounds]
+    [CHARGE: TAC-03 -> OBJ-1, Roll: 4+5, Success]
+
+``NotationReader`` parses such lines incrementally, from a stream or one
+``parse_line`` call at a time, and yields typed action models. Unit IDs
+(``CPT-01``) are resolved through the game's ``SymbolTable``, so every
+mention of an ID refers to the same ``UnitReference``. Lines that cannot
+be parsed raise ``NotationError`` with their line and column.
+
+The phase of each action follows from its type. Values the notation
+leaves out get neutral defaults: an earlier step of the dice cascade
+defaults to the next one given (``Result: 3 wounds`` implies 3 hits and
+3 shots) and a move's destination is kept in its ``notes``. Values are
+checked against the schema's constraints as they are read (at least one
+shot or attack, dice from 1 to 6, ...), so every action built is valid;
+a charge must give its ``Roll``.
+"""
+
+from typing import Any, Callable, Iterable, Iterator, Mapping, Optional
+
+from warscribe.schema.action import (
+    Action,
+    ActionResult,
+    ActionType,
+    BaseAction,
+    ChargeAction,
+    FightAction,
+    MoveAction,
+    ShootAction,
+)
+from warscribe.schema.trusted import construct
+from warscribe.schema.unit import UnitReference
+
+_new_id = BaseAction.model_fields["id"].default_factory
+_now = BaseAction.model_fields["timestamp"].default_factory
+
+# Action keyword -> (type, phase).
+_ACTIONS = {
+    "MOVE": (ActionType.MOVE, "movement"),
+    "SHOOT": (ActionType.SHOOT, "shooting"),
+    "CHARGE": (ActionType.CHARGE, "charge"),
+    "FIGHT": (ActionType.FIGHT, "fight"),
+}
+
+# Faces of a D6, as written in a ``Roll`` clause.
+_D6 = frozenset("123456")
+
+_RESULTS = {result.value: result for result in ActionResult}
+
+# Stat named in a numeric ``Result: <n> <stat>`` clause.
+_RESULT_STATS = {
+    "hit": "hits",
+    "hits": "hits",
+    "wound": "wounds",
+    "wounds": "wounds",
+    "damage": "damage_dealt",
+    "kill": "models_killed",
+    "kills": "models_killed",
+    "killed": "models_killed",
+}
+
+# ``Key: value`` clauses of shooting and fighting.
+_STRIKE_KEYS = {
+    "hits": "hits",
+    "wounds": "wounds",
+    "saves failed": "saves_failed",
+    "damage": "damage_dealt",
+    "killed": "models_killed",
+    "kills": "models_killed",
+}
+
+
+class NotationError(ValueError):
+    """A line that is not valid notation; ``line`` and ``column`` are 1-based."""
+
+    def __init__(self, message: str, line: int, column: int) -> None:
+        super().__init__(f"Line {line}, column {column}: {message}")
+        self.reason = message
+        self.line = line
+        self.column = column
+
+
+class SymbolTable:
+    """
+    The unit IDs of one game and the units they refer to.
+
+    An ID not registered beforehand is added on first use as a unit named
+    after it, of ``default_faction``; with ``default_faction=None``
+    unknown IDs are errors.
+    """
+
+    def __init__(
+        self,
+        units: Optional[Mapping[str, UnitReference]] = None,
+        default_faction: Optional[str] = "Unknown",
+    ) -> None:
+        self.units: dict[str, UnitReference] = dict(units or {})
+        self.default_faction = default_faction
+
+    def register(self, unit_id: str, unit: UnitReference) -> None:
+        """Map ``unit_id`` to ``unit``."""
+        self.units[unit_id] = unit
+
+    def resolve(self, unit_id: str) -> Optional[UnitReference]:
+        """The unit for ``unit_id``, or ``None`` if unknown."""
+        unit = self.units.get(unit_id)
+        if unit is None and self.default_faction is not None:
+            unit = self.units[unit_id] = UnitReference(
+                name=unit_id, faction=self.default_faction
+            )
+        return unit
+
+    def __contains__(self, unit_id: str) -> bool:
+        return unit_id in self.units
+
+    def __len__(self) -> int:
+        return len(self.units)
+
+
+def _column(text: str, start: int) -> int:
+    """1-based column of the first non-blank character from ``start``."""
+    if start >= len(text):
+        return start + 1
+    return len(text) - len(text[start:].lstrip()) + 1
+
+
+class NotationReader:
+    """
+    Incremental parser for one game in bracket notation.
+
+    ``parse_line`` takes the next line and returns its action, or ``None``
+    for blank lines and turn headers; iterating ``read(stream)`` does the
+    same over a whole file. ``turn`` and ``line`` hold the current turn and
+    the number of lines read.
+    """
+
+    def __init__(self, symbols: Optional[SymbolTable] = None) -> None:
+        self.symbols = symbols if symbols is not None else SymbolTable()
+        self.turn = 0
+        self.line = 0
+        self._builders: dict[ActionType, Callable[..., Action]] = {
+            ActionType.MOVE: self._move,
+            ActionType.SHOOT: self._shoot,
+            ActionType.CHARGE: self._charge,
+            ActionType.FIGHT: self._fight,
+        }
+
+    def _error(self, message: str, column: int) -> NotationError:
+        return NotationError(message, self.line, column)
+
+    def read(self, stream: Iterable[str]) -> Iterator[Action]:
+        """Parse every line of ``stream``, yielding the actions."""
+        parse_line = self.parse_line
+        for line in stream:
+            action = parse_line(line)
+            if action is not None:
+                yield action
+
+    def parse_line(self, line: str) -> Optional[Action]:
+        """Parse the next line; returns its action, if it has one."""
+        self.line += 1
+        text = line.rstrip()
+        if not text:
+            return None
+        if text[0] == "[":
+            return self._action(text, 0)
+        start = len(text) - len(text.lstrip())
+        if text.startswith("[", start):
+            return self._action(text, start)
+        if text.startswith("===", start):
+            self._turn_header(text, start)
+            return None
+        raise self._error("Expected '[ACTION: ...]' or '=== Turn N ==='.", start + 1)
+
+    def _turn_header(self, text: str, start: int) -> None:
+        if not text.endswith("===") or len(text) - start < 6:
+            raise self._error("Turn header must end with '==='.", len(text) + 1)
+        inner = text[start + 3 : -3]
+        words = inner.split()
+        if not words or words[0].lower() != "turn":
+            raise self._error("Expected 'Turn' in header.", _column(text, start + 3))
+        number_at = text.index(words[0], start + 3) + len(words[0])
+        if len(words) != 2 or not words[1].isdigit() or int(words[1]) < 1:
+            raise self._error(
+                "Turn number must be a positive integer.", _column(text, number_at)
+            )
+        self.turn = int(words[1])
+
+    def _unit(self, text: str, start: int, end: int) -> UnitReference:
+        unit_id = text[start:end].strip()
+        column = _column(text, start)
+        if not unit_id:
+            raise self._error("Expected a unit ID.", column)
+        unit = self.symbols.resolve(unit_id)
+        if unit is None:
+            raise self._error(f"Unknown unit ID '{unit_id}'.", column)
+        return unit
+
+    def _action(self, text: str, start: int) -> Action:
+        if text[-1] != "]":
+            raise self._error("Expected ']' at the end of the action.", len(text) + 1)
+        end = len(text) - 1
+        colon = text.find(":", start, end)
+        if colon < 0:
+            raise self._error("Expected ':' after the action type.", end + 1)
+        keyword = text[start + 1 : colon].strip()
+        entry = _ACTIONS.get(keyword.upper())
+        if entry is None:
+            raise self._error(
+                f"Unknown action type '{keyword}'.", _column(text, start + 1)
+            )
+        if not self.turn:
+            raise self._error(
+                "Action before the first '=== Turn N ===' header.", start + 1
+            )
+        arrow = text.find("->", colon, end)
+        if arrow < 0:
+            raise self._error(
+                "Expected '<unit> -> <target>'.", _column(text, colon + 1)
+            )
+        comma = text.find(",", arrow, end)
+        target_end = end if comma < 0 else comma
+
+        action_type, phase = entry
+        values = {
+            "id": _new_id(),
+            "action_type": action_type,
+            "turn": self.turn,
+            "phase": phase,
+            "timestamp": _now(),
+            "actor": self._unit(text, colon + 1, arrow),
+            "result": ActionResult.PENDING,
+            "notes": None,
+        }
+        clauses = self._clauses(text, comma, end) if comma >= 0 else []
+        return self._builders[action_type](values, clauses, text, arrow + 2, target_end)
+
+    def _clauses(self, text: str, comma: int, end: int) -> list[tuple[str, str, int]]:
+        """``(key, value, column)`` of each clause; bare words have no value."""
+        clauses = []
+        while comma >= 0:
+            start = comma + 1
+            comma = text.find(",", start, end)
+            clause = text[start : end if comma < 0 else comma]
+            column = _column(text, start)
+            key, colon, value = clause.partition(":")
+            key = key.strip().lower()
+            if not key:
+                raise self._error("Empty clause.", column)
+            if colon:
+                value = value.strip()
+                if not value:
+                    raise self._error(f"Missing value for '{key}'.", column)
+            clauses.append((key, value, column))
+        return clauses
+
+    def _result(self, key: str, values: dict[str, Any]) -> bool:
+        """Apply a bare result word such as ``Success``; False if it is not one."""
+        result = _RESULTS.get(key)
+        if result is None:
+            return False
+        values["result"] = result
+        return True
+
+    def _integer(self, value: str, column: int, minimum: int = 0) -> int:
+        # isdigit alone also accepts characters such as '²' that int() rejects.
+        if not (value.isascii() and value.isdigit()):
+            raise self._error(f"Expected a whole number, got '{value}'.", column)
+        number = int(value)
+        if number < minimum:
+            raise self._error(f"Expected at least {minimum}, got {number}.", column)
+        return number
+
+    def _inches(self, value: str, column: int) -> float:
+        try:
+            distance = float(value.rstrip('"').rstrip())
+        except ValueError:
+            distance = -1.0
+        if not distance >= 0:
+            raise self._error(f"Expected a distance in inches, got '{value}'.", column)
+        return distance
+
+    def _unknown(self, key: str, column: int, action: str) -> NotationError:
+        return self._error(f"Unknown clause '{key}' for {action}.", column)
+
+    def _move(
+        self, values: dict, clauses: list, text: str, start: int, end: int
+    ) -> MoveAction:
+        destination = text[start:end].strip()
+        if not destination:
+            raise self._error("Expected a destination.", _column(text, start))
+        values["notes"] = destination
+        values["distance_inches"] = 0.0
+        values["start_position"] = None
+        values["end_position"] = None
+        values["is_advance"] = False
+        values["is_fall_back"] = False
+        for key, value, column in clauses:
+            if key == "distance" and value:
+                values["distance_inches"] = self._inches(value, column)
+            elif key == "advance" and not value:
+                values["is_advance"] = True
+            elif key == "fall back" and not value:
+                values["is_fall_back"] = True
+            elif key in ("note", "notes") and value:
+                values["notes"] = f"{destination}; {value}"
+            elif value or not self._result(key, values):
+                raise self._unknown(key, column, "MOVE")
+        values["terrain_crossed"] = []
+        values["relative_distances"] = []
+        return construct(MoveAction, values)
+
+    def _charge(
+        self, values: dict, clauses: list, text: str, start: int, end: int
+    ) -> ChargeAction:
+        values["targets"] = [self._unit(text, start, end)]
+        roll = None
+        needed = None
+        for key, value, column in clauses:
+            if key == "roll" and value:
+                dice = value.replace("+", " ").split()
+                if len(dice) != 2 or not all(die in _D6 for die in dice):
+                    raise self._error(
+                        f"Expected a 2D6 roll such as '4+5', got '{value}'.", column
+                    )
+                roll = (int(dice[0]), int(dice[1]))
+            elif key == "distance" and value:
+                needed = self._inches(value, column)
+            elif key in ("note", "notes") and value:
+                values["notes"] = value
+            elif value or not self._result(key, values):
+                raise self._unknown(key, column, "CHARGE")
+        if roll is None:
+            raise self._error("CHARGE needs a 'Roll: X+Y' clause.", len(text))
+        result = values["result"]
+        if result is ActionResult.PENDING and needed is not None:
+            made = sum(roll) >= needed
+            values["result"] = ActionResult.SUCCESS if made else ActionResult.FAILED
+        values["charge_roll"] = roll
+        values["distance_needed"] = needed or 0.0
+        values["made_charge"] = values["result"] is ActionResult.SUCCESS
+        return construct(ChargeAction, values)
+
+    def _strike(
+        self,
+        values: dict,
+        clauses: list,
+        text: str,
+        start: int,
+        end: int,
+        count_key: str,
+        action: str,
+    ) -> None:
+        """Fill the fields shared by shooting and fighting."""
+        values["target"] = self._unit(text, start, end)
+        stats: dict[str, int] = {}
+        weapon = "Unknown"
+        for key, value, column in clauses:
+            field = _STRIKE_KEYS.get(key)
+            if field is not None and value:
+                stats[field] = self._integer(value, column)
+            elif key == count_key and value:
+                stats[count_key] = self._integer(value, column, minimum=1)
+            elif key == "weapon" and value:
+                weapon = value
+            elif key == "result" and value:
+                if self._result(value.lower(), values):
+                    continue
+                amount, _, stat = value.partition(" ")
+                field = _RESULT_STATS.get(stat.strip().lower())
+                if field is None:
+                    raise self._error(
+                        f"Expected a result such as '3 wounds', got '{value}'.", column
+                    )
+                stats[field] = self._integer(amount, column)
+                if values["result"] is ActionResult.PENDING:
+                    values["result"] = (
+                        ActionResult.SUCCESS if stats[field] else ActionResult.FAILED
+                    )
+            elif key in ("note", "notes") and value:
+                values["notes"] = value
+            elif value or not self._result(key, values):
+                raise self._unknown(key, column, action)
+
+        # Earlier cascade steps default to the next one given.
+        saves_failed = stats.get("saves_failed", 0)
+        wounds = stats.get("wounds", saves_failed)
+        hits = stats.get("hits", wounds)
+        values["weapon_name"] = weapon
+        values["weapon_profile"] = {}
+        values[count_key] = stats.get(count_key, max(hits, 1))
+        values["modifiers"] = []
+        values["dice_rolls"] = {}
+        values["hits"] = hits
+        values["wounds"] = wounds
+        values["saves_failed"] = saves_failed
+        values["damage_dealt"] = stats.get("damage_dealt", 0)
+        values["models_killed"] = stats.get("models_killed", 0)
+
+    def _shoot(
+        self, values: dict, clauses: list, text: str, start: int, end: int
+    ) -> ShootAction:
+        self._strike(values, clauses, text, start, end, "shots", "SHOOT")
+        return construct(ShootAction, values)
+
+    def _fight(
+        self, values: dict, clauses: list, text: str, start: int, end: int
+    ) -> FightAction:
+        self._strike(values, clauses, text, start, end, "attacks", "FIGHT")
+        return construct(FightAction, values)
+
+
+def iter_notation_actions(
+    stream: Iterable[str], symbols: Optional[SymbolTable] = None
+) -> Iterator[Action]:
+    """Yield the actions of a game in bracket notation, line by line."""
+    return NotationReader(symbols).read(stream)
+
+
+def parse_notation(text: str, symbols: Optional[SymbolTable] = None) -> list[Action]:
+    """Parse a whole game in bracket notation."""
+    return list(NotationReader(symbols).read(text.splitlines()))
@@ -0,0 +1,16 @@
+"""
+Game state for WARScribe.
+
+Board state derived from transcripts: unit wounds, models and positions
+at any point in a game.
+"""
+
+from warscribe.state.reducer import GameReplay, GameState, UnitState
+from warscribe.state.spatial import SpatialIndex
+
+__all__ = [
+    "GameReplay",
+    "GameState",
+    "SpatialIndex",
+    "UnitState",
+]
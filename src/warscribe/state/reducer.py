@@ -0,0 +1,231 @@
+"""
+Game state derived from a transcript.
+
+``GameReplay`` folds a transcript's actions into a ``GameState``: each
+unit's wounds, models, position and last charge. Units start from the
+player rosters and from the first ``UnitReference`` that mentions them;
+after that only the actions change them:
+
+- moves set the actor's position to ``end_position`` when recorded,
+- shooting and fighting remove ``models_killed`` and ``damage_dealt``
+  from the target (never below zero),
+- successful charges record the turn on the charging unit.
+
+The replay keeps a snapshot at the start of every turn/phase segment, so
+``state_at(turn, phase)`` is a lookup and ``state_after(index)`` costs one
+snapshot plus the actions since it. Actions appended to the transcript
+later are folded in on the next query.
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass, replace
+from types import MappingProxyType
+from typing import Mapping, Optional
+from uuid import UUID
+
+from warscribe.schema.action import (
+    Action,
+    ChargeAction,
+    FightAction,
+    MoveAction,
+    ShootAction,
+)
+from warscribe.schema.transcript import GameTranscript
+from warscribe.schema.unit import UnitReference
+
+
+@dataclass(frozen=True)
+class UnitState:
+    """State of one unit at a point in the game."""
+
+    id: UUID
+    name: str
+    faction: str
+    player: int = 0
+    wounds_remaining: Optional[int] = None
+    models_remaining: Optional[int] = None
+    position: Optional[tuple[float, float]] = None
+    charged_turn: Optional[int] = None
+
+    @classmethod
+    def from_reference(cls, unit: UnitReference, player: int = 0) -> "UnitState":
+        """Initial state from a unit reference."""
+        position = None
+        if unit.position_x is not None and unit.position_y is not None:
+            position = (unit.position_x, unit.position_y)
+        return cls(
+            id=unit.id,
+            name=unit.name,
+            faction=unit.faction,
+            player=player,
+            wounds_remaining=unit.wounds_remaining,
+            models_remaining=unit.models_remaining,
+            position=position,
+        )
+
+    @property
+    def destroyed(self) -> bool:
+        """True once no models or wounds remain."""
+        return self.models_remaining == 0 or self.wounds_remaining == 0
+
+
+@dataclass(frozen=True)
+class GameState:
+    """
+    State of a game after ``applied`` actions.
+
+    ``turn`` and ``phase`` are those of the last applied action (turn 1
+    and no phase before any action).
+    """
+
+    turn: int
+    phase: Optional[str]
+    applied: int
+    units: Mapping[UUID, UnitState]
+
+    def unit(self, unit_id: UUID) -> UnitState:
+        """State of one unit."""
+        return self.units[unit_id]
+
+    def units_for(self, player: int) -> list[UnitState]:
+        """States of one player's units."""
+        return [unit for unit in self.units.values() if unit.player == player]
+
+
+class _Reducer:
+    """Mutable state that actions are folded into."""
+
+    def __init__(self, players: dict[str, int], state: GameState) -> None:
+        self.players = players
+        self.units = dict(state.units)
+        self.turn = state.turn
+        self.phase = state.phase
+        self.applied = state.applied
+
+    @classmethod
+    def start(cls, transcript: GameTranscript) -> "_Reducer":
+        """Reducer at the start of the game, with the rosters placed."""
+        players: dict[str, int] = {}
+        if transcript.player1.faction != transcript.player2.faction:
+            players[transcript.player1.faction] = 1
+            players[transcript.player2.faction] = 2
+        units = {}
+        for number, player in ((1, transcript.player1), (2, transcript.player2)):
+            for unit in player.units:
+                units[unit.id] = UnitState.from_reference(unit, number)
+        return cls(players, GameState(turn=1, phase=None, applied=0, units=units))
+
+    def unit(self, unit: UnitReference) -> UnitState:
+        state = self.units.get(unit.id)
+        if state is None:
+            player = self.players.get(unit.faction, 0)
+            state = self.units[unit.id] = UnitState.from_reference(unit, player)
+        return state
+
+    def damage(self, target: UnitReference, models: int, wounds: int) -> None:
+        state = self.unit(target)
+        changes: dict = {}
+        if models and state.models_remaining is not None:
+            changes["models_remaining"] = max(state.models_remaining - models, 0)
+        if wounds and state.wounds_remaining is not None:
+            changes["wounds_remaining"] = max(state.wounds_remaining - wounds, 0)
+        if changes:
+            self.units[state.id] = replace(state, **changes)
+
+    def apply(self, action: Action) -> None:
+        actor = self.unit(action.actor)
+        if isinstance(action, MoveAction):
+            if action.end_position is not None:
+                self.units[actor.id] = replace(actor, position=action.end_position)
+        elif isinstance(action, (ShootAction, FightAction)):
+            self.damage(action.target, action.models_killed, action.damage_dealt)
+        elif isinstance(action, ChargeAction):
+            for target in action.targets:
+                self.unit(target)
+            if action.made_charge:
+                self.units[actor.id] = replace(actor, charged_turn=action.turn)
+        self.turn = action.turn
+        self.phase = action.phase
+        self.applied += 1
+
+    def state(self) -> GameState:
+        return GameState(
+            turn=self.turn,
+            phase=self.phase,
+            applied=self.applied,
+            units=MappingProxyType(dict(self.units)),
+        )
+
+
+class GameReplay:
+    """
+    Incremental, seekable replay of a transcript.
+
+    ``snapshots`` holds the state at the start of each turn/phase segment,
+    in order; ``segments`` maps ``(turn, phase)`` to the first of them.
+    """
+
+    def __init__(self, transcript: GameTranscript) -> None:
+        self.transcript = transcript
+        self._reset()
+
+    def _reset(self) -> None:
+        self._source = self.transcript.actions
+        self._reducer = _Reducer.start(self.transcript)
+        self.snapshots: list[GameState] = []
+        self._starts: list[int] = []
+        self._turns: dict[int, GameState] = {}
+        self.segments: dict[tuple[int, str], GameState] = {}
+
+    def sync(self) -> "GameReplay":
+        """Fold in any actions appended since the last sync."""
+        actions = self.transcript.actions
+        if actions is not self._source or self._reducer.applied > len(actions):
+            self._reset()
+        reducer = self._reducer
+        for action in actions[reducer.applied :]:
+            if (action.turn, action.phase) != (reducer.turn, reducer.phase):
+                snapshot = reducer.state()
+                self.snapshots.append(snapshot)
+                self._starts.append(snapshot.applied)
+                self.segments.setdefault((action.turn, action.phase), snapshot)
+                self._turns.setdefault(action.turn, snapshot)
+            reducer.apply(action)
+        return self
+
+    @property
+    def current(self) -> GameState:
+        """State after every action so far."""
+        return self.sync()._reducer.state()
+
+    def state_after(self, index: int) -> GameState:
+        """State after applying actions ``0..index``."""
+        self.sync()
+        count = index + 1
+        if not 0 < count <= self._reducer.applied:
+            raise IndexError("action index out of range")
+        # The first segment starts at 0, so there is always a snapshot.
+        snapshot = self.snapshots[bisect_right(self._starts, count) - 1]
+        if snapshot.applied == count:
+            return snapshot
+
+        reducer = _Reducer(self._reducer.players, snapshot)
+        for action in self.transcript.actions[snapshot.applied : count]:
+            reducer.apply(action)
+        return reducer.state()
+
+    def state_at(self, turn: int, phase: Optional[str] = None) -> GameState:
+        """
+        State at the start of ``turn`` (or of its ``phase``), before any
+        of that segment's actions.
+        """
+        self.sync()
+        if phase is not None:
+            try:
+                return self.segments[turn, phase]
+            except KeyError:
+                raise KeyError(f"No actions in turn {turn}, phase '{phase}'.") from None
+        try:
+            return self._turns[turn]
+        except KeyError:
+            raise KeyError(f"No actions in turn {turn}.") from None
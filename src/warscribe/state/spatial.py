@@ -0,0 +1,201 @@
+"""
+Spatial index over unit positions.
+
+``SpatialIndex`` buckets units into a uniform grid of square cells laid
+over the table, so proximity queries only look at the cells a query
+circle overlaps instead of at every unit. It is built from a
+``GameState`` (for example ``GameReplay.state_at(turn)``) and kept up to
+date incrementally by feeding it moves.
+
+Units are treated as points at their recorded position; distances are
+centre to centre, in inches. Units without a position, and destroyed
+units, are not indexed.
+"""
+
+import math
+from dataclasses import replace
+from typing import Iterable, Optional
+from uuid import UUID
+
+from warscribe.schema.action import Action, MoveAction
+from warscribe.state.reducer import GameState, UnitState
+
+# Standard Strike Force table, in inches.
+TABLE_WIDTH = 60.0
+TABLE_HEIGHT = 44.0
+# 10th Edition engagement range, in inches.
+ENGAGEMENT_RANGE = 1.0
+
+
+class SpatialIndex:
+    """
+    Uniform-grid index answering within-distance, nearest-enemy and
+    engagement queries.
+    """
+
+    def __init__(
+        self,
+        units: Iterable[UnitState] = (),
+        width: float = TABLE_WIDTH,
+        height: float = TABLE_HEIGHT,
+        cell_size: float = 6.0,
+    ) -> None:
+        self.cell_size = cell_size
+        self._columns = max(1, math.ceil(width / cell_size))
+        self._rows = max(1, math.ceil(height / cell_size))
+        self._cells: dict[tuple[int, int], set[UUID]] = {}
+        self._cell_of: dict[UUID, tuple[int, int]] = {}
+        self.units: dict[UUID, UnitState] = {}
+        for unit in units:
+            self.add(unit)
+
+    @classmethod
+    def from_state(cls, state: GameState, **options: float) -> "SpatialIndex":
+        """Index every positioned, surviving unit of ``state``."""
+        return cls(state.units.values(), **options)
+
+    def _cell(self, x: float, y: float) -> tuple[int, int]:
+        # Positions off the table fall into the edge cells.
+        column = min(max(int(x // self.cell_size), 0), self._columns - 1)
+        row = min(max(int(y // self.cell_size), 0), self._rows - 1)
+        return column, row
+
+    def add(self, unit: UnitState) -> None:
+        """Index ``unit``, replacing any earlier entry for it."""
+        self.remove(unit.id)
+        if unit.position is None or unit.destroyed:
+            return
+        cell = self._cell(*unit.position)
+        self._cells.setdefault(cell, set()).add(unit.id)
+        self._cell_of[unit.id] = cell
+        self.units[unit.id] = unit
+
+    def remove(self, unit_id: UUID) -> None:
+        """Drop a unit from the index, if present."""
+        cell = self._cell_of.pop(unit_id, None)
+        if cell is None:
+            return
+        members = self._cells[cell]
+        members.discard(unit_id)
+        if not members:
+            del self._cells[cell]
+        del self.units[unit_id]
+
+    def move(self, unit_id: UUID, position: tuple[float, float]) -> None:
+        """Move an indexed unit."""
+        self.add(replace(self.units[unit_id], position=position))
+
+    def apply(self, action: Action) -> None:
+        """Follow a move; other actions do not change positions."""
+        if (
+            isinstance(action, MoveAction)
+            and action.end_position is not None
+            and action.actor.id in self.units
+        ):
+            self.move(action.actor.id, action.end_position)
+
+    def __len__(self) -> int:
+        return len(self.units)
+
+    def __contains__(self, unit_id: object) -> bool:
+        return unit_id in self.units
+
+    def _candidates(self, x: float, y: float, radius: float) -> Iterable[UUID]:
+        first_column, first_row = self._cell(x - radius, y - radius)
+        last_column, last_row = self._cell(x + radius, y + radius)
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                yield from self._cells.get((column, row), ())
+
+    def within(
+        self,
+        position: tuple[float, float],
+        radius: float,
+        player: Optional[int] = None,
+    ) -> list[tuple[UnitState, float]]:
+        """
+        Units within ``radius`` of ``position``, nearest first, with their
+        distance. ``player`` restricts the result to one side.
+        """
+        x, y = position
+        found = []
+        for unit_id in self._candidates(x, y, radius):
+            unit = self.units[unit_id]
+            if player is not None and unit.player != player:
+                continue
+            ux, uy = unit.position
+            distance = math.hypot(ux - x, uy - y)
+            if distance <= radius:
+                found.append((unit, distance))
+        found.sort(key=lambda item: item[1])
+        return found
+
+    def within_unit(
+        self, unit_id: UUID, radius: float, enemies_only: bool = False
+    ) -> list[tuple[UnitState, float]]:
+        """Other units within ``radius`` of an indexed unit."""
+        unit = self.units[unit_id]
+        found = []
+        for other, distance in self.within(unit.position, radius):
+            if other.id == unit_id or (enemies_only and not _enemies(unit, other)):
+                continue
+            found.append((other, distance))
+        return found
+
+    def nearest_enemy(self, unit_id: UUID) -> Optional[tuple[UnitState, float]]:
+        """Closest enemy of an indexed unit, searching outwards ring by ring."""
+        unit = self.units[unit_id]
+        x, y = unit.position
+        column, row = self._cell(x, y)
+        best: Optional[tuple[UnitState, float]] = None
+        for ring in range(max(self._columns, self._rows)):
+            # Units in this ring or beyond are at least this far away.
+            if best is not None and best[1] <= (ring - 1) * self.cell_size:
+                break
+            for cell in _ring(column, row, ring):
+                for other_id in self._cells.get(cell, ()):
+                    other = self.units[other_id]
+                    if not _enemies(unit, other):
+                        continue
+                    ox, oy = other.position
+                    distance = math.hypot(ox - x, oy - y)
+                    if best is None or distance < best[1]:
+                        best = (other, distance)
+        return best
+
+    def in_engagement(
+        self, unit_id: UUID, engagement_range: float = ENGAGEMENT_RANGE
+    ) -> list[tuple[UnitState, float]]:
+        """Enemy units within engagement range of an indexed unit."""
+        return self.within_unit(unit_id, engagement_range, enemies_only=True)
+
+    def engagements(
+        self, engagement_range: float = ENGAGEMENT_RANGE
+    ) -> list[tuple[UnitState, UnitState]]:
+        """Every pair of opposing units within engagement range."""
+        pairs = []
+        for unit in self.units.values():
+            for other, _ in self.in_engagement(unit.id, engagement_range):
+                # Each pair is found from both sides; keep one.
+                if unit.id.int < other.id.int:
+                    pairs.append((unit, other))
+        return pairs
+
+
+def _enemies(unit: UnitState, other: UnitState) -> bool:
+    if unit.player and other.player:
+        return unit.player != other.player
+    return unit.faction != other.faction
+
+
+def _ring(column: int, row: int, ring: int) -> Iterable[tuple[int, int]]:
+    """Cells at Chebyshev distance ``ring`` from ``(column, row)``."""
+    if ring == 0:
+        yield column, row
+        return
+    for dc in range(-ring, ring + 1):
+        yield column + dc, row - ring
+        yield column + dc, row + ring
+    for dr in range(-ring + 1, ring):
+        yield column - ring, row + dr
+        yield column + ring, row + dr
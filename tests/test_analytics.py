@@ -0,0 +1,106 @@
+"""Tests for dice analytics."""
+
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from warscribe.analytics.dice import DiceTable  # noqa: E402
+from warscribe.schema.action import FightAction, MoveAction, ShootAction  # noqa: E402
+from warscribe.schema.transcript import GameTranscript, Player  # noqa: E402
+from warscribe.schema.unit import UnitReference  # noqa: E402
+
+
+@pytest.fixture
+def transcript():
+    marines = UnitReference(name="Intercessors", faction="Space Marines")
+    orks = UnitReference(name="Boyz", faction="Orks")
+    transcript = GameTranscript(
+        player1=Player(name="A", faction="Space Marines", units=[marines]),
+        player2=Player(name="B", faction="Orks", units=[orks]),
+    )
+    transcript.add_action(
+        MoveAction(turn=1, phase="movement", actor=marines, distance_inches=6)
+    )
+    transcript.add_action(
+        ShootAction(
+            turn=1,
+            phase="shooting",
+            actor=marines,
+            target=orks,
+            weapon_name="Bolt Rifle",
+            shots=4,
+            dice_rolls={"hit": [1, 3, 5, 6], "wound": [4, 4], "save": []},
+        )
+    )
+    transcript.add_action(
+        FightAction(
+            turn=2,
+            phase="fight",
+            actor=orks,
+            target=marines,
+            weapon_name="Choppa",
+            attacks=3,
+            dice_rolls={"hit": [2, 3, 3], "wound": [7]},
+        )
+    )
+    return transcript
+
+
+class TestDiceTable:
+    """Tests for DiceTable."""
+
+    def test_flatten(self, transcript):
+        """Dice should be flattened with aligned keys."""
+        table = DiceTable.from_transcript(transcript)
+
+        assert len(table) == 10
+        assert table.values.tolist() == [1, 3, 5, 6, 4, 4, 2, 3, 3, 7]
+        assert [table.steps[s] for s in table.step] == ["hit"] * 4 + ["wound"] * 2 + [
+            "hit"
+        ] * 3 + ["wound"]
+        assert table.turn.tolist() == [1] * 6 + [2] * 4
+        assert table.player.tolist() == [1] * 6 + [2] * 4
+        assert table.weapons == ["Bolt Rifle", "Choppa"]
+
+    def test_histogram_and_success_rate(self, transcript):
+        """Aggregations should ignore out-of-range faces in histograms."""
+        table = DiceTable.from_transcript(transcript)
+        hits = table.select(step="hit")
+
+        assert hits.histogram().tolist() == [1, 1, 3, 0, 1, 1]
+        assert table.histogram().sum() == 9
+        assert hits.success_rate(3) == pytest.approx(5 / 7)
+        assert hits.histogram(normalize=True).sum() == pytest.approx(1.0)
+
+    def test_grouped(self, transcript):
+        """Per-player and per-step aggregations should be vectorized."""
+        table = DiceTable.from_transcript(transcript)
+
+        per_player = table.select(step="hit").grouped_histogram("player")
+        assert per_player[1].tolist() == [1, 0, 1, 0, 1, 1]
+        assert per_player[2].tolist() == [0, 1, 2, 0, 0, 0]
+        assert set(per_player) == {1, 2}
+
+        rates = table.grouped_success_rate("step", 4)
+        assert rates == {"hit": pytest.approx(2 / 7), "wound": 1.0}
+
+        with pytest.raises(ValueError, match="group by"):
+            table.grouped_histogram("colour")
+
+    def test_corpus_and_empty(self, transcript):
+        """Tables should span games and handle no dice at all."""
+        other = GameTranscript(
+            player1=Player(name="C", faction="Necrons"),
+            player2=Player(name="D", faction="Orks"),
+        )
+        table = DiceTable.from_transcripts([transcript, other, transcript])
+
+        assert len(table) == 20
+        assert table.grouped_histogram("game").keys() == {str(transcript.id)}
+        empty = DiceTable.from_transcript(other)
+        assert len(empty) == 0
+        assert empty.histogram().tolist() == [0] * 6
+        assert math.isnan(empty.success_rate(3))
+        assert len(table.select(faction="Tau")) == 0
@@ -0,0 +1,123 @@
+"""Tests for the multi-game transcript archive."""
+
+from uuid import uuid4
+
+import pytest
+
+from warscribe.schema.action import MoveAction
+from warscribe.schema.transcript import GameTranscript, Player
+from warscribe.schema.unit import UnitReference
+from warscribe.serialization.archive import ArchiveWriter, GameArchive, write_archive
+
+FACTIONS = ["Space Marines", "Orks", "Necrons"]
+
+
+def make_game(i):
+    unit = UnitReference(name="Squad", faction=FACTIONS[i % 3])
+    transcript = GameTranscript(
+        player1=Player(name="A", faction=FACTIONS[i % 3], units=[unit]),
+        player2=Player(name="B", faction=FACTIONS[(i + 1) % 3]),
+        winner=i % 3 or None,
+        player1_vp=i,
+        current_turn=i % 5 + 1,
+    )
+    for turn in range(1, i % 4 + 1):
+        transcript.add_action(
+            MoveAction(turn=turn, phase="movement", actor=unit, distance_inches=6)
+        )
+    return transcript
+
+
+@pytest.fixture
+def games():
+    return [make_game(i) for i in range(40)]
+
+
+@pytest.fixture
+def archive_path(tmp_path, games):
+    path = tmp_path / "corpus.wsca"
+    assert write_archive(path, games) == 40
+    return path
+
+
+class TestGameArchive:
+    """Tests for ArchiveWriter and GameArchive."""
+
+    def test_random_access(self, archive_path, games):
+        """Any game should be readable by position."""
+        with GameArchive(archive_path) as archive:
+            assert len(archive) == 40
+            assert archive[17] == games[17]
+            assert archive[-1] == games[-1]
+            assert list(archive) == games
+            with pytest.raises(IndexError):
+                archive[40]
+
+    def test_lookup_by_id(self, archive_path, games):
+        """Games should be found by id through the hash index."""
+        with GameArchive(archive_path) as archive:
+            for i, game in enumerate(games):
+                assert archive.find(game.id) == i
+            assert archive.get(games[5].id) == games[5]
+            assert games[0].id in archive
+            assert uuid4() not in archive
+            with pytest.raises(KeyError):
+                archive.get(uuid4())
+
+    def test_metadata_entries(self, archive_path, games):
+        """Entries should expose metadata without decoding games."""
+        with GameArchive(archive_path) as archive:
+            entry = archive.entry(4)
+            assert entry.id == games[4].id
+            assert entry.edition == "10th"
+            assert entry.player1_faction == "Orks"
+            assert entry.player2_faction == "Necrons"
+            assert entry.winner == 1
+            assert entry.player1_vp == 4
+            assert entry.current_turn == 5
+            assert entry.action_count == 0
+            assert archive.entry(3).winner is None
+            assert archive.entry(3).action_count == 3
+            assert [e.id for e in archive.entries()] == [g.id for g in games]
+
+    def test_empty_archive(self, tmp_path):
+        """An archive with no games should open."""
+        path = tmp_path / "empty.wsca"
+        write_archive(path, [])
+
+        with GameArchive(path) as archive:
+            assert len(archive) == 0
+            assert archive.find(uuid4()) is None
+
+    def test_duplicate_game_rejected(self, tmp_path, games):
+        """A game id may only appear once."""
+        with ArchiveWriter(tmp_path / "dup.wsca") as writer:
+            writer.add(games[0])
+            with pytest.raises(ValueError, match="already"):
+                writer.add(games[0])
+
+    def test_failed_write_discarded(self, tmp_path, games):
+        """An exception in the with block should not leave an archive."""
+        path = tmp_path / "failed.wsca"
+        with pytest.raises(RuntimeError):
+            with ArchiveWriter(path) as writer:
+                writer.add(games[0])
+                raise RuntimeError("source failed")
+
+        assert not path.exists()
+
+    def test_incomplete_archive_rejected(self, archive_path):
+        """An archive without its footer should not open."""
+        data = archive_path.read_bytes()
+        archive_path.write_bytes(data[:-10])
+
+        with pytest.raises(ValueError, match="incomplete"):
+            GameArchive(archive_path)
+
+    def test_not_an_archive(self, tmp_path):
+        """Other files should be rejected."""
+        path = tmp_path / "other.bin"
+        path.write_bytes(b"x" * 100)
+
+        with pytest.raises(ValueError, match="Not a WARScribe"):
+            GameArchive(path)
@@ -0,0 +1,236 @@
+"""Tests for the compact binary transcript format."""
+
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from warscribe.schema.action import (
+    ActionResult,
+    ActionType,
+    ChargeAction,
+    FightAction,
+    MoveAction,
+    RelativeDistance,
+    ShootAction,
+)
+from warscribe.schema.transcript import GameTranscript, Player
+from warscribe.schema.unit import UnitReference
+from warscribe.serialization.binary import decode_transcript, encode_transcript
+
+
+@pytest.fixture
+def marines():
+    return UnitReference(
+        name="Intercessors",
+        faction="Space Marines",
+        wounds_remaining=10,
+        models_remaining=5,
+        position_x=12.5,
+        position_y=0.0,
+    )
+
+
+@pytest.fixture
+def orks():
+    return UnitReference(name="Boyz", faction="Orks")
+
+
+@pytest.fixture
+def transcript(marines, orks):
+    transcript = GameTranscript(
+        player1=Player(
+            name="Alice", faction="Space Marines", units=[marines], points_total=995
+        ),
+        player2=Player(name="Bob", faction="Orks", subfaction="Goffs", units=[orks]),
+        mission="Scorched Earth",
+        notes="Round 3",
+        started_at=datetime(2026, 3, 1, 10, 0, tzinfo=timezone(timedelta(hours=2))),
+    )
+    transcript.add_action(
+        MoveAction(
+            turn=1,
+            phase="movement",
+            actor=marines,
+            distance_inches=6.25,
+            start_position=(1.0, 2.0),
+            end_position=(3.5, 7.0),
+            is_advance=True,
+            terrain_crossed=["ruins"],
+            relative_distances=[
+                RelativeDistance(
+                    target_unit_id=orks.id,
+                    target_unit_name="Boyz",
+                    delta_inches=-3.0,
+                    final_distance=9.0,
+                ),
+                RelativeDistance(target_unit_id=uuid4(), delta_inches=1.5),
+            ],
+            notes="Through the ruins",
+        )
+    )
+    transcript.add_action(
+        MoveAction(
+            action_type=ActionType.FALL_BACK,
+            turn=1,
+            phase="movement",
+            actor=orks,
+            distance_inches=3,
+            is_fall_back=True,
+        )
+    )
+    transcript.add_action(
+        ShootAction(
+            turn=1,
+            phase="shooting",
+            actor=marines,
+            target=orks,
+            weapon_name="Bolt Rifle",
+            weapon_profile={"S": "4", "AP": "-1"},
+            shots=3,
+            modifiers=["heavy"],
+            dice_rolls={"hit": [4, 6, 1], "damage": [-1, 300]},
+            hits=2,
+            wounds=2,
+            saves_failed=1,
+            damage_dealt=1,
+            models_killed=1,
+            result=ActionResult.SUCCESS,
+        )
+    )
+    transcript.add_action(
+        ChargeAction(
+            turn=1,
+            phase="charge",
+            actor=marines,
+            targets=[orks, marines],
+            charge_roll=(4, 5),
+            distance_needed=7.5,
+            made_charge=True,
+        )
+    )
+    transcript.add_action(
+        FightAction(
+            turn=1,
+            phase="fight",
+            actor=marines,
+            target=orks,
+            weapon_name="Chainsword",
+            attacks=4,
+            dice_rolls={"hit": [2**40]},
+            hits=3,
+        )
+    )
+    transcript.player1_vp = 45
+    transcript.winner = 1
+    transcript.ended_at = datetime(2026, 3, 1, 13, 0)
+    return transcript
+
+
+class TestBinaryFormat:
+    """Tests for binary encoding and decoding."""
+
+    def test_roundtrip_is_lossless(self, transcript):
+        """Every field should survive a round-trip."""
+        restored = decode_transcript(encode_transcript(transcript))
+
+        assert restored == transcript
+        assert restored.model_dump() == transcript.model_dump()
+        assert restored.to_json() == transcript.to_json()
+
+    def test_roundtrip_preserves_models(self, transcript):
+        """Actions should decode to their original model classes."""
+        restored = decode_transcript(encode_transcript(transcript))
+
+        assert [type(a) for a in restored.actions] == [
+            type(a) for a in transcript.actions
+        ]
+        assert restored.actions[1].action_type == ActionType.FALL_BACK
+
+    def test_empty_transcript(self):
+        """A transcript with no actions should round-trip."""
+        transcript = GameTranscript(
+            player1=Player(name="A", faction="F1"),
+            player2=Player(name="B", faction="F2"),
+        )
+
+        assert decode_transcript(encode_transcript(transcript)) == transcript
+
+    def test_units_are_interned(self, transcript, marines, orks):
+        """Repeated units should not grow the encoding by their full size."""
+        small = encode_transcript(transcript)
+        for _ in range(50):
+            transcript.add_action(
+                MoveAction(turn=2, phase="movement", actor=marines, distance_inches=1)
+            )
+        large = encode_transcript(transcript)
+
+        per_action = (len(large) - len(small)) / 50
+        assert per_action < len(marines.model_dump_json())
+
+    def test_units_are_not_shared(self, transcript):
+        """Like ``from_json``, each occurrence of a unit is its own instance."""
+        restored = decode_transcript(encode_transcript(transcript))
+        actor = restored.actions[0].actor
+        others = [
+            unit
+            for unit in (
+                *restored.player1.units,
+                *restored.player2.units,
+                *(action.actor for action in restored.actions[1:]),
+            )
+            if unit.id == actor.id
+        ]
+        assert others
+
+        actor.wounds_remaining = 3
+
+        assert all(unit.wounds_remaining != 3 for unit in others)
+
+    def test_smaller_than_json(self, transcript):
+        """The binary form should be much smaller than indented JSON."""
+        assert len(encode_transcript(transcript)) * 3 < len(transcript.to_json())
+
+    def test_checksum_mismatch_rejected(self, transcript):
+        """Corrupted payloads should be rejected."""
+        data = bytearray(encode_transcript(transcript))
+        data[-1] ^= 0xFF
+
+        with pytest.raises(ValueError, match="checksum"):
+            decode_transcript(bytes(data))
+
+    def test_foreign_data_rejected(self):
+        """Data without the magic header should be rejected."""
+        with pytest.raises(ValueError, match="Not a WARScribe"):
+            decode_transcript(b'{"actions": []}')
+
+    def test_model_fields_covered(self):
+        """The format must be updated whenever a model gains a field."""
+        assert set(MoveAction.model_fields) == {
+            "id",
+            "action_type",
+            "turn",
+            "phase",
+            "timestamp",
+            "actor",
+            "result",
+            "notes",
+            "distance_inches",
+            "start_position",
+            "end_position",
+            "is_advance",
+            "is_fall_back",
+            "terrain_crossed",
+            "relative_distances",
+        }
+        assert set(ShootAction.model_fields) - set(FightAction.model_fields) == {
+            "shots"
+        }
+        assert set(FightAction.model_fields) - set(ShootAction.model_fields) == {
+            "attacks"
+        }
+        assert len(ShootAction.model_fields) == 19
+        assert len(ChargeAction.model_fields) == 12
+        assert len(UnitReference.model_fields) == 7
+        assert len(Player.model_fields) == 5
+        assert len(GameTranscript.model_fields) == 17
@@ -0,0 +1,141 @@
+"""Tests for vectorized relative distances."""
+
+import math
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from warscribe.analytics.distances import compute_relative_distances  # noqa: E402
+from warscribe.schema.action import MoveAction  # noqa: E402
+from warscribe.schema.unit import UnitReference  # noqa: E402
+from warscribe.state.reducer import UnitState  # noqa: E402
+
+
+def unit(name, faction, x, y):
+    return UnitReference(name=name, faction=faction, position_x=x, position_y=y)
+
+
+@pytest.fixture
+def marines():
+    return [unit(f"Marines {i}", "Space Marines", 5.0 * i, 0.0) for i in range(3)]
+
+
+@pytest.fixture
+def orks():
+    return [unit(f"Boyz {i}", "Orks", 5.0 * i, 20.0) for i in range(4)]
+
+
+def sides(marines, orks):
+    return {u.id: 1 for u in marines} | {u.id: 2 for u in orks}
+
+
+def move(actor, start, end):
+    return MoveAction(
+        turn=1,
+        phase="movement",
+        actor=actor,
+        distance_inches=math.dist(start, end),
+        start_position=start,
+        end_position=end,
+    )
+
+
+class TestRelativeDistances:
+    """Tests for compute_relative_distances."""
+
+    def test_matches_scalar_computation(self, marines, orks):
+        """Broadcast results should match per-pair distances."""
+        moves = [
+            move(m, (m.position_x, m.position_y), (m.position_x + 1, 6.0))
+            for m in marines
+        ]
+
+        results = compute_relative_distances(
+            moves, marines + orks, players=sides(marines, orks)
+        )
+
+        for mv, distances in zip(moves, results):
+            assert mv.relative_distances == distances
+            assert [d.target_unit_id for d in distances] == [o.id for o in orks]
+            for d, ork in zip(distances, orks):
+                target = (ork.position_x, ork.position_y)
+                final = math.dist(mv.end_position, target)
+                assert d.final_distance == pytest.approx(final)
+                assert d.delta_inches == pytest.approx(
+                    final - math.dist(mv.start_position, target)
+                )
+                assert d.delta_inches < 0
+                assert d.target_unit_name == ork.name
+
+    def test_all_units_and_skips(self, marines, orks):
+        """Allies can be included; unplaced moves and units are skipped."""
+        no_position = MoveAction(
+            turn=1, phase="movement", actor=marines[0], distance_inches=3
+        )
+        moves = [move(marines[0], (0.0, 0.0), (0.0, 3.0)), no_position]
+        unplaced = UnitReference(name="Reserves", faction="Orks")
+
+        results = compute_relative_distances(
+            moves, marines + [unplaced], enemies_only=False, populate=False
+        )
+
+        assert [d.target_unit_id for d in results[0]] == [m.id for m in marines[1:]]
+        assert results[1] == []
+        assert moves[0].relative_distances == []
+
+    def test_unit_states(self, marines):
+        """Positions can come from replayed unit states."""
+        mover = UnitState(
+            id=marines[0].id,
+            name="Marines 0",
+            faction="Space Marines",
+            position=(0.0, 0.0),
+        )
+        target = UnitState(
+            id=UnitReference(name="t", faction="Orks").id,
+            name="Target",
+            faction="Orks",
+            position=(0.0, 10.0),
+        )
+
+        (distances,) = compute_relative_distances(
+            [move(marines[0], (0.0, 0.0), (0.0, 4.0))],
+            [mover, target],
+            enemies_only=False,
+        )
+
+        assert [(d.delta_inches, d.final_distance) for d in distances] == [(-4.0, 6.0)]
+
+    def test_mirror_match(self, marines):
+        """Enemies are decided by player, even when factions match."""
+        enemies = [
+            unit(f"Marines {i}", "Space Marines", 5.0 * i, 20.0) for i in range(2)
+        ]
+        states = [
+            UnitState.from_reference(u, player)
+            for player, units in ((1, marines), (2, enemies))
+            for u in units
+        ]
+        mv = move(marines[0], (0.0, 0.0), (0.0, 3.0))
+
+        (from_states,) = compute_relative_distances([mv], states, populate=False)
+        (from_mapping,) = compute_relative_distances(
+            [mv], marines + enemies, players=sides(marines, enemies)
+        )
+
+        assert [d.target_unit_id for d in from_states] == [u.id for u in enemies]
+        assert from_mapping == from_states
+
+    def test_unknown_player(self, marines, orks):
+        """Without a player for every unit, enemies cannot be told apart."""
+        mv = move(marines[0], (0.0, 0.0), (0.0, 3.0))
+
+        with pytest.raises(ValueError, match="player"):
+            compute_relative_distances([mv], orks)
+        with pytest.raises(ValueError, match="player"):
+            compute_relative_distances([mv], orks, players={u.id: 2 for u in orks})
+
+    def test_empty(self):
+        """No moves or references gives empty results."""
+        assert compute_relative_distances([], []) == []
@@ -1,15 +1,26 @@
 """Tests for edition abstraction layer."""
 
+import pickle
+
 import pytest
 
 from warscribe.edition import (
+    BatchValidationResult,
+    EditionPlugin,
     EditionRegistry,
     GamePhase,
     PhaseDefinition,
+    PhaseTable,
     ValidationResult,
 )
 from warscribe.edition.tenth import TenthEditionPlugin
-from warscribe.schema.action import ActionType, MoveAction, ChargeAction
+from warscribe.schema.action import (
+    ActionType,
+    MoveAction,
+    ChargeAction,
+    ShootAction,
+)
+from warscribe.schema.transcript import GameTranscript, Player
 from warscribe.schema.unit import UnitReference
 
 
@@ -72,6 +83,64 @@ class TestEditionRegistry:
 
         assert "10th" in registry.available_editions
 
+    def test_lazy_registration(self):
+        registry = EditionRegistry()
+        loads = []
+
+        def source():
+            loads.append(1)
+            return TenthEditionPlugin
+
+        registry.register_lazy("10th", source)
+
+        assert "10th" in registry
+        assert registry.loaded_editions == []
+        plugin = registry.get("10th")
+        assert isinstance(plugin, TenthEditionPlugin)
+        assert registry.get("10th") is plugin
+        assert loads == [1]
+
+    def test_lazy_reference(self):
+        registry = EditionRegistry()
+        registry.register_lazy("10th", "warscribe.edition.tenth:TenthEditionPlugin")
+
+        assert registry.get_default().edition_code == "10th"
+        assert registry.get("9th") is None
+
+    def test_lazy_code_mismatch(self):
+        registry = EditionRegistry()
+        registry.register_lazy("9th", lambda: TenthEditionPlugin)
+
+        with pytest.raises(ValueError, match="edition code '10th'"):
+            registry.get("9th")
+        assert "9th" in registry
+
+    def test_discover_entry_points(self, monkeypatch):
+        from importlib.metadata import EntryPoint
+
+        from warscribe.edition import registry as registry_module
+
+        found = [
+            EntryPoint(
+                name="homebrew",
+                value="warscribe.edition.tenth:TenthEditionPlugin",
+                group=registry_module.ENTRY_POINT_GROUP,
+            )
+        ]
+        monkeypatch.setattr(
+            registry_module,
+            "entry_points",
+            lambda group: found if group == registry_module.ENTRY_POINT_GROUP else [],
+        )
+        registry = EditionRegistry()
+        registry.discover()
+
+        assert registry.available_editions == ["10th", "homebrew"]
+        assert registry.loaded_editions == []
+        assert registry.get_default().edition_code == "10th"
+        with pytest.raises(ValueError):
+            registry.get("homebrew")
+
 
 class TestTenthEditionPlugin:
     """Tests for 10th Edition plugin."""
@@ -161,3 +230,205 @@ class TestTenthEditionPlugin:
         result = plugin.validate_action(action)
         assert result.is_valid  # Still valid but should have warning
         assert len(result.warnings) > 0
+
+
+class MinimalPlugin(EditionPlugin):
+    """Third-party style plugin relying on the base class defaults."""
+
+    edition_name = "Minimal Edition"
+    edition_code = "min"
+    phases = [
+        PhaseDefinition(
+            name="movement",
+            display_name="Movement",
+            order=0,
+            allowed_actions=[ActionType.MOVE],
+        )
+    ]
+
+    def validate_action(self, action, game_state=None):
+        if not self.is_action_allowed_in_phase(action.action_type, action.phase):
+            return ValidationResult.failure("Not allowed.")
+        return ValidationResult.success()
+
+
+class TestBatchValidation:
+    """Tests for bulk action validation."""
+
+    @pytest.fixture
+    def unit_ref(self):
+        return UnitReference(name="Space Marines", faction="Imperium")
+
+    @pytest.fixture
+    def batch(self, unit_ref):
+        target = UnitReference(name="Orks", faction="Orks")
+        return [
+            MoveAction(
+                turn=1, phase=GamePhase.MOVEMENT, actor=unit_ref, distance_inches=6
+            ),
+            MoveAction(
+                turn=1, phase=GamePhase.SHOOTING, actor=unit_ref, distance_inches=6
+            ),
+            MoveAction(
+                turn=1, phase=GamePhase.MOVEMENT, actor=unit_ref, distance_inches=30
+            ),
+            ShootAction(
+                turn=1,
+                phase=GamePhase.SHOOTING,
+                actor=unit_ref,
+                target=target,
+                weapon_name="Bolter",
+                shots=2,
+                hits=3,
+            ),
+            ChargeAction(
+                turn=1,
+                phase=GamePhase.CHARGE,
+                actor=unit_ref,
+                targets=[target],
+                charge_roll=(2, 3),
+                distance_needed=8.0,
+                made_charge=True,
+            ),
+        ]
+
+    def test_matches_single_validation(self, batch):
+        """Batch results should match validate_action for every action."""
+        plugin = TenthEditionPlugin()
+
+        result = plugin.validate_actions(batch)
+
+        assert len(result) == len(batch)
+        for index, action in enumerate(batch):
+            assert result.result(index) == plugin.validate_action(action)
+
+    def test_overridden_validate_action(self, batch):
+        """Batches of a subclass should use its validate_action override."""
+
+        class NoLongMoves(TenthEditionPlugin):
+            def validate_action(self, action, game_state=None):
+                result = super().validate_action(action, game_state)
+                if isinstance(action, MoveAction) and action.distance_inches > 24:
+                    return ValidationResult.failure("Too far.")
+                return result
+
+        plugin = NoLongMoves()
+
+        result = plugin.validate_actions(batch)
+
+        assert result.errors[2] == ["Too far."]
+        for index, action in enumerate(batch):
+            assert result.result(index) == plugin.validate_action(action)
+
+    def test_compact_status(self, batch):
+        """Status codes should summarize each action."""
+        result = TenthEditionPlugin().validate_actions(batch)
+
+        assert list(result.status) == [
+            BatchValidationResult.VALID,
+            BatchValidationResult.INVALID,
+            BatchValidationResult.WARNING,
+            BatchValidationResult.INVALID,
+            BatchValidationResult.WARNING,
+        ]
+        assert not result.is_valid
+        assert result.invalid_indices() == [1, 3]
+        assert set(result.warnings) == {2, 4}
+
+    def test_default_implementation(self, unit_ref):
+        """Plugins without a bulk path should fall back to validate_action."""
+        actions = [
+            MoveAction(turn=1, phase="movement", actor=unit_ref, distance_inches=6),
+            MoveAction(turn=1, phase="fight", actor=unit_ref, distance_inches=6),
+        ]
+
+        result = MinimalPlugin().validate_actions(actions)
+
+        assert list(result.status) == [
+            BatchValidationResult.VALID,
+            BatchValidationResult.INVALID,
+        ]
+        assert result.errors == {1: ["Not allowed."]}
+
+    def test_add_actions_validates_batch(self, batch):
+        """An invalid batch should not be added to the transcript."""
+        transcript = GameTranscript(
+            player1=Player(name="A", faction="F1"),
+            player2=Player(name="B", faction="F2"),
+        )
+        plugin = TenthEditionPlugin()
+
+        rejected = transcript.add_actions(batch, plugin)
+        assert not rejected.is_valid
+        assert transcript.actions == []
+
+        accepted = transcript.add_actions([batch[0], batch[2], batch[4]], plugin)
+        assert accepted.is_valid
+        assert len(transcript.actions) == 3
+        assert len(transcript.get_actions_for_turn(1)) == 3
+
+    def test_add_actions_without_plugin(self, batch):
+        """Without a plugin, add_actions appends everything."""
+        transcript = GameTranscript(
+            player1=Player(name="A", faction="F1"),
+            player2=Player(name="B", faction="F2"),
+        )
+
+        assert transcript.add_actions(batch) is None
+        assert transcript.actions == batch
+
+
+class TestPhaseTable:
+    """Tests for the compiled phase table."""
+
+    def test_built_once(self):
+        """The table should be compiled once per plugin."""
+        plugin = TenthEditionPlugin()
+
+        table = plugin.phase_table
+
+        assert isinstance(table, PhaseTable)
+        assert plugin.phase_table is table
+        assert table.by_order[2].name == GamePhase.SHOOTING
+        assert table.get("shooting") is table.by_name[GamePhase.SHOOTING]
+        with pytest.raises(TypeError):
+            table.by_name["extra"] = table.phases[0]
+
+    def test_used_plugin_pickles(self):
+        """A plugin holding its compiled table should survive pickling."""
+        plugin = TenthEditionPlugin()
+        table = plugin.phase_table
+
+        restored = pickle.loads(pickle.dumps(plugin))
+
+        assert restored.phase_table.phases == table.phases
+        assert restored.phase_table.allowed_mask("movement") == (
+            table.allowed_mask("movement")
+        )
+        assert restored.get_next_phase(GamePhase.MOVEMENT) == GamePhase.SHOOTING
+
+    def test_matches_phase_definitions(self):
+        """Lookups should agree with a scan of the phase definitions."""
+        plugin = TenthEditionPlugin()
+        table = plugin.phase_table
+
+        for phase in plugin.phases:
+            assert table.order(phase.name) == phase.order
+            for action_type in ActionType:
+                assert table.allows(action_type, phase.name) == (
+                    action_type in phase.allowed_actions
+                )
+        assert table.order("psychic") == -1
+        assert not table.allows(ActionType.MOVE, "psychic")
+        assert table.allowed_mask("psychic") == 0
+        assert plugin.get_next_phase(GamePhase.MORALE) is None
+        assert plugin.get_next_phase("unknown") is None
+
+    def test_third_party_plugin(self):
+        """Plugins defining only ``phases`` should get the table for free."""
+        plugin = MinimalPlugin()
+
+        assert plugin.get_phase("movement").order == 0
+        assert plugin.is_action_allowed_in_phase(ActionType.MOVE, "movement")
+        assert not plugin.is_action_allowed_in_phase(ActionType.SHOOT, "movement")
+        assert plugin.get_next_phase("movement") is None
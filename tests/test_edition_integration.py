@@ -184,20 +184,11 @@ class TestEditionRegistration:
 
     def test_registry_contains_tenth(self):
         """10th Edition should be registered."""
-        # Force registration
-        from warscribe.edition.tenth import _register
-
-        _register()
-
         registry = get_edition_registry()
         assert "10th" in registry.available_editions
 
     def test_default_edition_is_tenth(self):
         """10th Edition should be the default."""
-        from warscribe.edition.tenth import _register
-
-        _register()
-
         registry = get_edition_registry()
         default = registry.get_default()
         assert default is not None
@@ -0,0 +1,61 @@
+"""Tests for lazy package imports."""
+
+import subprocess
+import sys
+
+import pytest
+
+import warscribe
+import warscribe.schema
+
+
+def imported_after(statement: str) -> set[str]:
+    """Modules loaded by a fresh interpreter running ``statement``."""
+    code = f"import sys; {statement}; print('\\n'.join(sys.modules))"
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    return set(output.split())
+
+
+class TestLazyImports:
+    """Import-time guards for the top-level package."""
+
+    def test_import_warscribe_is_light(self):
+        """``import warscribe`` must not load pydantic or the schema models."""
+        modules = imported_after("import warscribe")
+
+        assert "pydantic" not in modules
+        assert not {m for m in modules if m.startswith("warscribe.")}
+
+    def test_schema_module_alone(self):
+        """Importing one schema module does not build the others."""
+        modules = imported_after("import warscribe.schema.unit")
+
+        assert "warscribe.schema.action" not in modules
+        assert "warscribe.schema.transcript" not in modules
+
+    @pytest.mark.parametrize("package", [warscribe, warscribe.schema])
+    def test_public_names_resolve(self, package):
+        for name in package.__all__:
+            assert getattr(package, name) is not None
+            assert name in dir(package)
+
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "import warscribe; warscribe.schema.action",
+            "import warscribe; warscribe.edition.get_edition",
+            "import warscribe; warscribe.serialization.binary",
+            "import warscribe.schema; warscribe.schema.trusted.construct",
+        ],
+    )
+    def test_subpackages_resolve(self, statement):
+        """Subpackages are reachable as attributes, as with eager imports."""
+        subprocess.run([sys.executable, "-c", statement], check=True)
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError):
+            getattr(warscribe, "NotAName")
+        with pytest.raises(AttributeError):
+            getattr(warscribe.schema, "not_a_module")
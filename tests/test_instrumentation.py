@@ -0,0 +1,244 @@
+"""Tests for instrumentation hooks and exporters."""
+
+import logging
+
+import pytest
+
+from warscribe import instrumentation
+from warscribe.edition import EditionPlugin, PhaseDefinition, ValidationResult
+from warscribe.edition.tenth import TenthEditionPlugin
+from warscribe.instrumentation import (
+    ACTIONS_VALIDATED,
+    CHECK_SECONDS,
+    STAGE_SECONDS,
+    VALIDATE_SECONDS,
+    Exporter,
+    Histogram,
+    LogExporter,
+    Metrics,
+    PrometheusTextExporter,
+    SnapshotExporter,
+)
+from warscribe.schema.action import ActionType, ChargeAction, MoveAction, ShootAction
+from warscribe.schema.transcript import GameTranscript, Player
+from warscribe.schema.unit import UnitReference
+from warscribe.serialization.binary import decode_transcript, encode_transcript
+
+MARINES = UnitReference(name="Intercessors", faction="Space Marines")
+ORKS = UnitReference(name="Boyz", faction="Orks")
+
+
+def make_actions():
+    return [
+        MoveAction(turn=1, phase="movement", actor=MARINES, distance_inches=6),
+        ShootAction(
+            turn=1,
+            phase="shooting",
+            actor=MARINES,
+            target=ORKS,
+            weapon_name="Bolt Rifle",
+            shots=2,
+            hits=3,
+        ),
+        ChargeAction(
+            turn=1,
+            phase="charge",
+            actor=MARINES,
+            targets=[ORKS],
+            charge_roll=(1, 1),
+            distance_needed=9,
+            made_charge=True,
+        ),
+        # Moving in the shooting phase is not allowed.
+        MoveAction(turn=1, phase="shooting", actor=MARINES, distance_inches=6),
+    ]
+
+
+@pytest.fixture
+def metrics():
+    exporter = SnapshotExporter()
+    collection = instrumentation.enable(Metrics(exporters=[exporter]))
+    yield collection
+    instrumentation.disable()
+
+
+def test_disabled_by_default():
+    assert instrumentation.active() is None
+    TenthEditionPlugin().validate_actions(make_actions())
+    with instrumentation.stage("parse"):
+        pass
+
+
+def test_enable_disable():
+    collection = instrumentation.enable()
+    assert instrumentation.active() is collection
+    assert instrumentation.disable() is collection
+    assert instrumentation.active() is None
+
+
+def test_validate_action_is_counted(metrics):
+    plugin = TenthEditionPlugin()
+    results = [plugin.validate_action(action) for action in make_actions()]
+    assert [result.is_valid for result in results] == [True, False, True, False]
+
+    exporter = metrics.exporters[0]
+    metrics.flush()
+    edition = {"edition": "10th"}
+    move = exporter.get(VALIDATE_SECONDS, **edition, action_type="move")
+    assert move.kind == "histogram"
+    assert move.count == 2
+    assert move.buckets[-1] == (float("inf"), 2)
+    assert exporter.get(CHECK_SECONDS, **edition, check="phase").count == 4
+    assert exporter.get(CHECK_SECONDS, **edition, check="move").count == 1
+    assert exporter.get(CHECK_SECONDS, **edition, check="charge").count == 1
+    assert exporter.get(CHECK_SECONDS, **edition, check="rules").count == 1
+    counted = {
+        (dict(sample.labels)["action_type"], dict(sample.labels)["status"]): (
+            sample.value
+        )
+        for sample in exporter.samples
+        if sample.name == ACTIONS_VALIDATED
+    }
+    assert counted == {
+        ("move", "valid"): 1,
+        ("move", "invalid"): 1,
+        ("shoot", "invalid"): 1,
+        ("charge", "warning"): 1,
+    }
+
+
+def test_batch_results_unchanged(metrics):
+    plugin = TenthEditionPlugin()
+    actions = make_actions()
+    timed = plugin.validate_actions(actions)
+    instrumentation.disable()
+    plain = plugin.validate_actions(actions)
+    assert timed.status == plain.status
+    assert timed.errors == plain.errors
+    assert timed.warnings == plain.warnings
+    assert (
+        metrics.histogram(
+            VALIDATE_SECONDS, (("edition", "10th"), ("action_type", "move"))
+        ).count
+        == 2
+    )
+
+
+class MovesOnlyPlugin(EditionPlugin):
+    """Minimal edition that only checks phases."""
+
+    edition_name = "Moves only"
+    edition_code = "moves"
+    phases = [
+        PhaseDefinition(
+            name="movement",
+            display_name="Movement",
+            order=0,
+            allowed_actions=[ActionType.MOVE],
+        )
+    ]
+
+    def validate_action(self, action, game_state=None):
+        if not self.is_action_allowed_in_phase(action.action_type, action.phase):
+            return ValidationResult.failure("Wrong phase.")
+        return ValidationResult.success()
+
+
+class CountingPlugin(TenthEditionPlugin):
+    """Subclass whose overrides call the timed 10th Edition methods."""
+
+    def validate_action(self, action, game_state=None):
+        return super().validate_action(action, game_state)
+
+    def validate_actions(self, actions, game_state=None):
+        return super().validate_actions(actions, game_state)
+
+
+def test_every_plugin_is_timed(metrics):
+    batch = MovesOnlyPlugin().validate_actions(make_actions())
+
+    assert list(batch.status) == [0, 2, 2, 2]
+    edition = (("edition", "moves"),)
+    move = metrics.histogram(VALIDATE_SECONDS, (*edition, ("action_type", "move")))
+    assert move.count == 2
+    phase = metrics.histogram(CHECK_SECONDS, (*edition, ("check", "phase")))
+    assert phase.count == 4
+    invalid = (*edition, ("action_type", "shoot"), ("status", "invalid"))
+    assert metrics.counter(ACTIONS_VALIDATED, invalid).value == 1
+
+
+def test_overrides_counted_once(metrics):
+    plugin = CountingPlugin()
+    plugin.validate_action(make_actions()[0])
+    plugin.validate_actions(make_actions())
+
+    labels = (("edition", "10th"), ("action_type", "move"))
+    assert metrics.histogram(VALIDATE_SECONDS, labels).count == 3
+    assert metrics.counter(ACTIONS_VALIDATED, (*labels, ("status", "valid"))).value == 2
+
+
+def test_exporter_is_abstract():
+    class Incomplete(Exporter):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_stages(metrics):
+    transcript = GameTranscript(
+        player1=Player(name="A", faction="Space Marines", units=[MARINES]),
+        player2=Player(name="B", faction="Orks", units=[ORKS]),
+    )
+    transcript.add_actions(make_actions()[:3])
+    GameTranscript.from_json(transcript.to_json())
+    decode_transcript(encode_transcript(transcript))
+    GameTranscript.from_trusted_json(transcript.to_trusted_json())
+    for stage in ("parse", "decode", "trusted_load"):
+        assert metrics.histogram(STAGE_SECONDS, (("stage", stage),)).count == 1
+
+
+def test_histogram_buckets():
+    histogram = Histogram((1.0, 2.0))
+    for value in (0.5, 1.0, 1.5, 3.0):
+        histogram.observe(value)
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.sum == 6.0
+    with pytest.raises(ValueError):
+        Histogram((2.0, 1.0))
+
+
+def test_prometheus_exporter(tmp_path):
+    path = tmp_path / "warscribe.prom"
+    metrics = Metrics(buckets=(0.5,), exporters=[PrometheusTextExporter(path)])
+    metrics.counter("jobs_total", (("edition", "10th"),)).inc(3)
+    metrics.histogram("latency_seconds", (("stage", 'a"b'),)).observe(0.25)
+    metrics.flush()
+    assert path.read_text().splitlines() == [
+        "# TYPE jobs_total counter",
+        'jobs_total{edition="10th"} 3.0',
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{stage="a\\"b",le="0.5"} 1',
+        'latency_seconds_bucket{stage="a\\"b",le="+Inf"} 1',
+        'latency_seconds_sum{stage="a\\"b"} 0.25',
+        'latency_seconds_count{stage="a\\"b"} 1',
+    ]
+
+
+def test_log_exporter(caplog):
+    metrics = Metrics(exporters=[LogExporter()])
+    metrics.counter("jobs_total").inc()
+    metrics.histogram("latency_seconds").observe(0.5)
+    with caplog.at_level(logging.INFO, logger="warscribe.metrics"):
+        metrics.flush()
+    assert caplog.messages == [
+        "jobs_total value=1",
+        "latency_seconds count=1 sum=0.500000 mean=0.500000000",
+    ]
+
+
+def test_reset():
+    metrics = Metrics()
+    metrics.counter("jobs_total").inc()
+    metrics.reset()
+    assert metrics.snapshot() == []
@@ -0,0 +1,137 @@
+"""Tests for the journaled game recorder."""
+
+import pytest
+
+from warscribe.schema.action import MoveAction, ShootAction
+from warscribe.schema.transcript import GameTranscript, Player
+from warscribe.schema.unit import UnitReference
+from warscribe.serialization.journal import GameRecorder
+
+MARINES = UnitReference(name="Intercessors", faction="Space Marines")
+ORKS = UnitReference(name="Boyz", faction="Orks")
+
+
+def new_transcript():
+    return GameTranscript(
+        player1=Player(name="Alice", faction="Space Marines", units=[MARINES]),
+        player2=Player(name="Bob", faction="Orks", units=[ORKS]),
+    )
+
+
+def actions(n):
+    for i in range(n):
+        if i % 2:
+            yield ShootAction(
+                turn=1,
+                phase="shooting",
+                actor=MARINES,
+                target=ORKS,
+                weapon_name="Bolt Rifle",
+                shots=2,
+            )
+        else:
+            yield MoveAction(turn=1, phase="movement", actor=MARINES, distance_inches=6)
+
+
+class TestGameRecorder:
+    """Tests for GameRecorder."""
+
+    def test_recover_replays_journal(self, tmp_path):
+        """An unclosed recorder's changes should be recovered."""
+        recorder = GameRecorder.start(tmp_path, new_transcript())
+        for action in actions(5):
+            recorder.add_action(action)
+        recorder.update(player1_vp=15, current_turn=2)
+        recorder.flush()
+
+        recovered = GameRecorder.recover(tmp_path)
+
+        assert recovered.transcript == recorder.transcript
+        assert recovered.transcript.player1_vp == 15
+        assert recovered.transcript.current_turn == 2
+
+    def test_compaction(self, tmp_path):
+        """Compaction should leave one snapshot and a short journal."""
+        recorder = GameRecorder.start(tmp_path, new_transcript(), compact_every=4)
+        for action in actions(10):
+            recorder.add_action(action)
+        recorder.flush()
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "journal-00000002.ndjson",
+            "snapshot-00000002.json",
+        ]
+        assert GameRecorder.recover(tmp_path).transcript == recorder.transcript
+
+    def test_close_leaves_single_snapshot(self, tmp_path):
+        """Closing should fold everything into a snapshot."""
+        with GameRecorder.start(tmp_path, new_transcript()) as recorder:
+            for action in actions(3):
+                recorder.add_action(action)
+            recorder.update(winner=1)
+
+        assert [p.name for p in tmp_path.iterdir()] == ["snapshot-00000001.json"]
+        transcript = GameRecorder.recover(tmp_path).transcript
+        assert len(transcript.actions) == 3
+        assert transcript.winner == 1
+        with pytest.raises(ValueError, match="closed"):
+            recorder.add_action(next(actions(1)))
+
+    def test_torn_last_record_is_dropped(self, tmp_path):
+        """A partial final line from a crash should be discarded."""
+        recorder = GameRecorder.start(tmp_path, new_transcript())
+        for action in actions(3):
+            recorder.add_action(action)
+        recorder.flush()
+        journal = tmp_path / "journal-00000000.ndjson"
+        with open(journal, "a") as f:
+            f.write('{"record":"action","action":{"tu')
+
+        recovered = GameRecorder.recover(tmp_path)
+        recovered.add_action(next(actions(1)))
+        recovered.flush()
+
+        assert len(recovered.transcript.actions) == 4
+        assert len(GameRecorder.recover(tmp_path).transcript.actions) == 4
+
+    def test_corrupt_middle_record_rejected(self, tmp_path):
+        """Corruption before the last record is not silently skipped."""
+        recorder = GameRecorder.start(tmp_path, new_transcript())
+        for action in actions(2):
+            recorder.add_action(action)
+        recorder.flush()
+        journal = tmp_path / "journal-00000000.ndjson"
+        journal.write_text("garbage\n" + journal.read_text())
+
+        with pytest.raises(ValueError, match=":1: corrupt"):
+            GameRecorder.recover(tmp_path)
+
+    def test_interrupted_compaction(self, tmp_path):
+        """A crash between snapshot and new journal must not lose or repeat."""
+        recorder = GameRecorder.start(tmp_path, new_transcript())
+        for action in actions(3):
+            recorder.add_action(action)
+        recorder.flush()
+        # Snapshot of generation 1 written, old journal not yet removed.
+        GameRecorder._write_snapshot(tmp_path, recorder.transcript, 1)
+
+        recovered = GameRecorder.recover(tmp_path)
+
+        assert len(recovered.transcript.actions) == 3
+        assert not (tmp_path / "journal-00000000.ndjson").exists()
+
+    def test_start_refuses_existing_game(self, tmp_path):
+        """Starting over an existing recording is an error."""
+        GameRecorder.start(tmp_path, new_transcript()).close()
+
+        with pytest.raises(FileExistsError):
+            GameRecorder.start(tmp_path, new_transcript())
+        with pytest.raises(FileNotFoundError):
+            GameRecorder.recover(tmp_path / "missing")
+
+    def test_update_rejects_other_fields(self, tmp_path):
+        """Only footer fields can be recorded as updates."""
+        recorder = GameRecorder.start(tmp_path, new_transcript())
+
+        with pytest.raises(ValueError, match="notes"):
+            recorder.update(notes="x")
@@ -0,0 +1,110 @@
+"""Tests for the lazy transcript view."""
+
+import pytest
+
+from warscribe.schema.action import MoveAction, ShootAction
+from warscribe.schema.lazy import LazyTranscript
+from warscribe.schema.transcript import GameTranscript, Player
+from warscribe.schema.unit import UnitReference
+
+
+@pytest.fixture
+def transcript():
+    marines = UnitReference(name="Intercessors", faction="Space Marines")
+    orks = UnitReference(name="Boyz [mob]", faction="Orks")
+    transcript = GameTranscript(
+        player1=Player(name="Alice", faction="Space Marines", units=[marines]),
+        player2=Player(name="Bob", faction="Orks", units=[orks]),
+        notes='Tricky notes: "actions": [\n  ] "turn": 9',
+    )
+    for turn in range(1, 4):
+        transcript.add_action(
+            MoveAction(
+                turn=turn,
+                phase="movement",
+                actor=marines,
+                distance_inches=6,
+                notes='"turn": 7 }\n    }',
+            )
+        )
+        transcript.add_action(
+            ShootAction(
+                turn=turn,
+                phase="shooting",
+                actor=marines,
+                target=orks,
+                weapon_name="Bolt Rifle",
+                weapon_profile={"turn": "1"},
+                shots=10,
+                dice_rolls={"turn": [1, 2]},
+            )
+        )
+    transcript.winner = 2
+    transcript.player2_vp = 80
+    return transcript
+
+
+class TestLazyTranscript:
+    """Tests for LazyTranscript."""
+
+    @pytest.mark.parametrize("compact", [False, True])
+    def test_metadata_without_decoding_actions(self, transcript, compact):
+        """Metadata should be available before any action is decoded."""
+        data = transcript.model_dump_json() if compact else transcript.to_json()
+
+        lazy = LazyTranscript.from_json(data)
+
+        assert lazy.winner == 2
+        assert lazy.player2_vp == 80
+        assert lazy.player1.faction == "Space Marines"
+        assert lazy.notes == transcript.notes
+        assert len(lazy.actions) == 6
+        assert lazy.actions.decoded_count == 0
+
+    @pytest.mark.parametrize("compact", [False, True])
+    def test_materialize(self, transcript, compact):
+        """Materializing should reproduce the full transcript."""
+        data = transcript.model_dump_json() if compact else transcript.to_json()
+
+        assert LazyTranscript.from_json(data).materialize() == transcript
+
+    def test_actions_decode_on_access_and_cache(self, transcript):
+        """Each action is decoded once, on first access."""
+        lazy = LazyTranscript.from_json(transcript.to_json())
+
+        first = lazy.actions[1]
+        assert isinstance(first, ShootAction)
+        assert lazy.actions.decoded_count == 1
+        assert lazy.actions[1] is first
+        assert lazy.actions[-1] == transcript.actions[-1]
+        assert lazy.actions[0:2] == transcript.actions[0:2]
+        with pytest.raises(IndexError):
+            lazy.actions[6]
+
+    def test_single_turn(self, transcript):
+        """Reading one turn should only decode that turn's actions."""
+        lazy = LazyTranscript.from_json(transcript.to_json())
+
+        actions = lazy.get_actions_for_turn(2)
+
+        assert actions == transcript.get_actions_for_turn(2)
+        assert lazy.actions.decoded_count == 2
+
+    def test_empty_transcript(self):
+        """A transcript without actions should load."""
+        transcript = GameTranscript(
+            player1=Player(name="A", faction="F1"),
+            player2=Player(name="B", faction="F2"),
+        )
+
+        lazy = LazyTranscript.from_json(transcript.to_json())
+
+        assert len(lazy.actions) == 0
+        assert lazy.materialize() == transcript
+
+    def test_unknown_attribute(self, transcript):
+        """Only transcript fields are forwarded to the header."""
+        lazy = LazyTranscript.from_json(transcript.to_json())
+
+        with pytest.raises(AttributeError):
+            lazy.not_a_field
@@ -0,0 +1,165 @@
+"""Tests for the NDJSON transcript format."""
+
+import io
+import json
+
+import pytest
+
+from warscribe.schema.action import MoveAction, ShootAction
+from warscribe.schema.transcript import GameTranscript, Player
+from warscribe.schema.unit import UnitReference
+from warscribe.serialization import (
+    TranscriptReader,
+    TranscriptWriter,
+    iter_ndjson_actions,
+    read_ndjson,
+    write_ndjson,
+)
+
+
+@pytest.fixture
+def transcript():
+    marines = UnitReference(name="Intercessors", faction="Space Marines")
+    orks = UnitReference(name="Boyz", faction="Orks")
+    transcript = GameTranscript(
+        player1=Player(name="Alice", faction="Space Marines"),
+        player2=Player(name="Bob", faction="Orks"),
+        mission="Scorched Earth",
+    )
+    transcript.add_action(
+        MoveAction(turn=1, phase="movement", actor=marines, distance_inches=6)
+    )
+    transcript.add_action(
+        ShootAction(
+            turn=1,
+            phase="shooting",
+            actor=marines,
+            target=orks,
+            weapon_name="Bolt Rifle",
+            shots=10,
+            hits=6,
+        )
+    )
+    transcript.player1_vp = 45
+    transcript.player2_vp = 30
+    transcript.winner = 1
+    return transcript
+
+
+class TestNdjsonFormat:
+    """Tests for NDJSON reading and writing."""
+
+    def test_one_record_per_line(self, transcript):
+        """Header, one line per action, then footer."""
+        buffer = io.StringIO()
+        write_ndjson(transcript, buffer)
+
+        records = [json.loads(line) for line in buffer.getvalue().splitlines()]
+
+        assert [r["record"] for r in records] == [
+            "header",
+            "action",
+            "action",
+            "footer",
+        ]
+        assert records[0]["mission"] == "Scorched Earth"
+        assert records[-1]["winner"] == 1
+
+    def test_roundtrip(self, transcript):
+        """A transcript should round-trip losslessly."""
+        buffer = io.StringIO()
+        write_ndjson(transcript, buffer)
+        buffer.seek(0)
+
+        assert read_ndjson(buffer) == transcript
+
+    def test_iter_actions(self, transcript):
+        """Actions should be yielded as validated models."""
+        buffer = io.StringIO()
+        write_ndjson(transcript, buffer)
+        buffer.seek(0)
+
+        actions = list(iter_ndjson_actions(buffer))
+
+        assert actions == transcript.actions
+        assert isinstance(actions[1], ShootAction)
+
+    def test_reader_exposes_header_and_footer(self, transcript):
+        """Header is available up front, footer after iteration."""
+        buffer = io.StringIO()
+        write_ndjson(transcript, buffer)
+        buffer.seek(0)
+
+        reader = TranscriptReader(buffer)
+        assert reader.header.player1.name == "Alice"
+        assert reader.footer is None
+
+        list(reader)
+        assert reader.footer is not None
+        assert reader.footer.player1_vp == 45
+
+    def test_in_progress_game_has_no_footer(self, transcript):
+        """A game without a footer should read with default results."""
+        buffer = io.StringIO()
+        writer = TranscriptWriter(buffer, transcript)
+        writer.write_action(transcript.actions[0])
+        writer.close()
+        buffer.seek(0)
+
+        restored = read_ndjson(buffer)
+
+        assert len(restored.actions) == 1
+        assert restored.winner is None
+
+    def test_append_to_existing_game(self, transcript):
+        """Writing without a header should continue an existing stream."""
+        buffer = io.StringIO()
+        with TranscriptWriter(buffer, transcript) as writer:
+            writer.write_action(transcript.actions[0])
+            writer.close()
+
+        writer = TranscriptWriter(buffer, transcript, write_header=False)
+        writer.write_action(transcript.actions[1])
+        writer.finish(transcript)
+        buffer.seek(0)
+
+        assert read_ndjson(buffer) == transcript
+
+    def test_context_manager_finish(self, transcript):
+        """Finishing inside the block should write the footer."""
+        buffer = io.StringIO()
+        with TranscriptWriter(buffer, transcript) as writer:
+            for action in transcript.actions:
+                writer.write_action(action)
+            writer.finish(transcript)
+        buffer.seek(0)
+
+        assert read_ndjson(buffer) == transcript
+
+    def test_context_manager_without_footer_warns(self, transcript):
+        """A clean exit that never wrote the footer should warn."""
+        buffer = io.StringIO()
+        with pytest.warns(UserWarning, match="without a footer"):
+            with TranscriptWriter(buffer, transcript) as writer:
+                writer.write_action(transcript.actions[0])
+
+        assert buffer.getvalue().count("\n") == 2
+
+    def test_missing_header_rejected(self, transcript):
+        """A stream must start with a header record."""
+        buffer = io.StringIO()
+        write_ndjson(transcript, buffer)
+        lines = buffer.getvalue().splitlines(keepends=True)
+
+        with pytest.raises(ValueError, match="Line 1"):
+            TranscriptReader(io.StringIO("".join(lines[1:])))
+
+    def test_record_after_footer_rejected(self, transcript):
+        """Nothing may follow the footer."""
+        buffer = io.StringIO()
+        write_ndjson(transcript, buffer)
+        lines = buffer.getvalue().splitlines(keepends=True)
+        buffer = io.StringIO("".join(lines + [lines[1]]))
+
+        with pytest.raises(ValueError, match="after footer"):
+            list(iter_ndjson_actions(buffer))
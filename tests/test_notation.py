@@ -0,0 +1,162 @@
+"""Tests for the bracket text notation parser."""
+
+import io
+
+import pytest
+
+from warscribe.edition.tenth import TenthEditionPlugin
+from warscribe.schema.action import (
+    ActionResult,
+    ChargeAction,
+    FightAction,
+    MoveAction,
+    ShootAction,
+)
+from warscribe.schema.transcript import GameTranscript, Player
+from warscribe.schema.unit import UnitReference
+from warscribe.serialization import (
+    NotationError,
+    NotationReader,
+    SymbolTable,
+    iter_notation_actions,
+    parse_notation,
+)
+
+# The full transcript example from docs/notation.md.
+EXAMPLE = """\
+=== Turn 1 ===
+[MOVE: CPT-01 -> Zone-A]
+[SHOOT: TNK-02 -> Enemy-01, Result: 3 wounds]
+
+=== Turn 2 ===
+[CHARGE: TAC-03 -> OBJ-1, Roll: 3+6, Success]
+"""
+
+
+def test_documented_example():
+    move, shoot, charge = parse_notation(EXAMPLE)
+
+    assert isinstance(move, MoveAction)
+    assert (move.turn, move.phase, move.notes) == (1, "movement", "Zone-A")
+    assert move.actor.name == "CPT-01"
+
+    assert isinstance(shoot, ShootAction)
+    assert shoot.phase == "shooting"
+    assert shoot.target.name == "Enemy-01"
+    assert (shoot.shots, shoot.hits, shoot.wounds) == (3, 3, 3)
+    assert shoot.result == ActionResult.SUCCESS
+
+    assert isinstance(charge, ChargeAction)
+    assert (charge.turn, charge.phase) == (2, "charge")
+    assert charge.made_charge and charge.charge_roll == (3, 6)
+    assert [unit.name for unit in charge.targets] == ["OBJ-1"]
+
+
+def test_symbol_table_shares_units():
+    captain = UnitReference(name="Captain", faction="Space Marines")
+    symbols = SymbolTable({"CPT-01": captain})
+    actions = parse_notation(
+        "=== Turn 1 ===\n"
+        "[MOVE: CPT-01 -> Zone-A]\n"
+        "[SHOOT: CPT-01 -> Enemy-01]\n"
+        "[FIGHT: CPT-01 -> Enemy-01]\n",
+        symbols,
+    )
+    assert all(action.actor is captain for action in actions)
+    assert actions[1].target is actions[2].target
+    assert actions[1].target.faction == "Unknown"
+    assert "Enemy-01" in symbols and len(symbols) == 2
+
+
+def test_clauses():
+    move, charge, fight = parse_notation(
+        "=== Turn 3 ===\n"
+        '  [move: CPT-01 -> Zone-B, Distance: 9.5", Advance, Note: through ruins]\n'
+        '[CHARGE: CPT-01 -> Enemy-HQ, Roll: 4+5, Distance: 8"]\n'
+        "[FIGHT: CPT-01 -> Enemy-HQ, Weapon: Relic Blade, Attacks: 6, Hits: 5,"
+        " Wounds: 4, Saves Failed: 2, Damage: 4, Killed: 2]\n"
+    )
+    assert move.distance_inches == 9.5
+    assert move.is_advance and not move.is_fall_back
+    assert move.notes == "Zone-B; through ruins"
+
+    assert charge.charge_roll == (4, 5)
+    assert charge.distance_needed == 8.0
+    assert charge.made_charge and charge.result == ActionResult.SUCCESS
+
+    assert isinstance(fight, FightAction)
+    assert fight.weapon_name == "Relic Blade"
+    assert (fight.attacks, fight.hits, fight.wounds, fight.saves_failed) == (
+        6,
+        5,
+        4,
+        2,
+    )
+    assert (fight.damage_dealt, fight.models_killed) == (4, 2)
+
+
+def test_actions_are_valid():
+    transcript = GameTranscript(
+        player1=Player(name="A", faction="Unknown"),
+        player2=Player(name="B", faction="Unknown"),
+    )
+    transcript.add_actions(
+        parse_notation(
+            EXAMPLE + "[FIGHT: TAC-03 -> OBJ-1, Attacks: 1, Result: 0 wounds]\n"
+        )
+    )
+    assert GameTranscript.from_json(transcript.to_json()) == transcript
+    assert TenthEditionPlugin().validate_actions(transcript.actions).is_valid
+
+
+def test_incremental():
+    reader = NotationReader()
+    assert reader.parse_line("=== Turn 1 ===") is None
+    assert reader.parse_line("") is None
+    assert isinstance(reader.parse_line("[MOVE: A -> B]\n"), MoveAction)
+    assert (reader.turn, reader.line) == (1, 3)
+    assert len(list(iter_notation_actions(io.StringIO(EXAMPLE)))) == 3
+
+
+@pytest.mark.parametrize(
+    "line, column, message",
+    [
+        ("[SHOTO: A -> B]", 2, "Unknown action type 'SHOTO'"),
+        ("[SHOOT: A -> B", 15, "Expected ']'"),
+        ("[SHOOT A -> B]", 14, "Expected ':'"),
+        ("[SHOOT: A B]", 9, "Expected '<unit> -> <target>'"),
+        ("[SHOOT: A -> , Shots: 2]", 14, "Expected a unit ID"),
+        ("[SHOOT: A -> B, Shots: ten]", 17, "Expected a whole number"),
+        ("[SHOOT: A -> B, Shots: \u00b2]", 17, "Expected a whole number"),
+        ("[SHOOT: A -> B, Shots: 0]", 17, "Expected at least 1"),
+        ("[FIGHT: A -> B, Attacks: 0]", 17, "Expected at least 1"),
+        ("[SHOOT: A -> B, Result: 3 lots]", 17, "Expected a result"),
+        ("[SHOOT: A -> B, Range: 24]", 17, "Unknown clause 'range'"),
+        ("[MOVE: A -> B, Distance: far]", 16, "Expected a distance"),
+        ("[CHARGE: A -> B, Roll: 9]", 18, "Expected a 2D6 roll"),
+        ("[CHARGE: A -> B, Roll: 0+9]", 18, "Expected a 2D6 roll"),
+        ("[CHARGE: A -> B, Success]", 25, "needs a 'Roll: X+Y' clause"),
+        ("[MOVE: A -> B, ]", 16, "Empty clause"),
+        ("=== Turn x ===", 10, "Turn number"),
+        ("=== Round 2 ===", 5, "Expected 'Turn'"),
+        ("  hello", 3, "Expected '[ACTION: ...]'"),
+    ],
+)
+def test_errors(line, column, message):
+    with pytest.raises(NotationError) as info:
+        parse_notation(f"=== Turn 1 ===\n\n{line}\n")
+    assert (info.value.line, info.value.column) == (3, column)
+    assert message in info.value.reason
+    assert str(info.value).startswith(f"Line 3, column {column}: ")
+
+
+def test_action_before_turn():
+    with pytest.raises(NotationError, match="Line 1, column 1: Action before"):
+        parse_notation("[MOVE: A -> B]")
+
+
+def test_unknown_unit_strict():
+    symbols = SymbolTable(default_faction=None)
+    symbols.register("CPT-01", UnitReference(name="Captain", faction="Space Marines"))
+    with pytest.raises(NotationError, match="column 19: Unknown unit ID 'TAC-01'"):
+        parse_notation("=== Turn 1 ===\n[SHOOT: CPT-01 -> TAC-01]", symbols)
@@ -0,0 +1,111 @@
+"""Tests for parallel corpus validation."""
+
+import pytest
+
+from warscribe.corpus.pipeline import validate_corpus, validate_file
+from warscribe.edition.tenth import TenthEditionPlugin
+from warscribe.schema.action import MoveAction, ShootAction
+from warscribe.schema.transcript import GameTranscript, Player
+from warscribe.schema.unit import UnitReference
+from warscribe.serialization.binary import encode_transcript
+
+
+def make_game(bad_actions=0, edition="10th"):
+    marines = UnitReference(name="Intercessors", faction="Space Marines")
+    orks = UnitReference(name="Boyz", faction="Orks")
+    transcript = GameTranscript(
+        edition=edition,
+        player1=Player(name="A", faction="Space Marines", units=[marines]),
+        player2=Player(name="B", faction="Orks", units=[orks]),
+    )
+    transcript.add_action(
+        MoveAction(turn=1, phase="movement", actor=marines, distance_inches=6)
+    )
+    for _ in range(bad_actions):
+        # Shooting in the movement phase is not allowed.
+        transcript.add_action(
+            ShootAction(
+                turn=1,
+                phase="movement",
+                actor=marines,
+                target=orks,
+                weapon_name="Bolt Rifle",
+                shots=2,
+            )
+        )
+    return transcript
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    paths = []
+    for i in range(6):
+        path = tmp_path / f"game{i}.json"
+        path.write_text(make_game(bad_actions=i % 3).to_json())
+        paths.append(path)
+    binary = tmp_path / "game.wscb"
+    binary.write_bytes(encode_transcript(make_game(bad_actions=1)))
+    trusted = tmp_path / "game.trusted"
+    trusted.write_text(make_game().to_trusted_json())
+    return paths + [binary, trusted]
+
+
+class TestValidateCorpus:
+    """Tests for validate_file and validate_corpus."""
+
+    def test_validate_file(self, corpus):
+        """A summary should carry counts and capped messages."""
+        summary = validate_file(corpus[2], max_errors=1)
+
+        assert summary.action_count == 3
+        assert summary.invalid_count == 2
+        assert summary.errors == [
+            (1, "Action type 'shoot' not allowed in 'movement' phase.")
+        ]
+        assert not summary.is_valid
+
+    def test_formats(self, corpus):
+        """Binary and trusted files should be recognised."""
+        binary, trusted = corpus[-2:]
+
+        assert validate_file(binary).invalid_count == 1
+        assert validate_file(trusted).is_valid
+
+    def test_load_errors_are_reported(self, tmp_path):
+        """Unreadable files and unknown editions become summary errors."""
+        broken = tmp_path / "broken.json"
+        broken.write_text("{")
+        unknown = tmp_path / "unknown.json"
+        unknown.write_text(make_game(edition="3rd").to_json())
+
+        assert validate_file(broken).error.startswith("ValidationError")
+        assert validate_file(tmp_path / "missing.json").error
+        assert "No plugin" in validate_file(unknown).error
+        assert validate_file(unknown, TenthEditionPlugin()).is_valid
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_validate_corpus(self, corpus, workers):
+        """Parallel and in-process runs should agree."""
+        summaries = list(validate_corpus(corpus, workers=workers))
+        serial = [validate_file(path) for path in corpus]
+
+        key = lambda s: s.path  # noqa: E731
+        assert sorted(summaries, key=key) == sorted(serial, key=key)
+        assert sum(s.invalid_count for s in summaries) == 7
+
+    def test_spawned_workers_get_used_plugin(self, corpus):
+        """A plugin that has validated already is pickled to spawned workers."""
+        plugin = TenthEditionPlugin()
+        plugin.validate_actions(make_game(bad_actions=2).actions)
+
+        summaries = list(
+            validate_corpus(corpus, plugin=plugin, workers=2, start_method="spawn")
+        )
+
+        key = lambda s: s.path  # noqa: E731
+        serial = [validate_file(path, plugin) for path in corpus]
+        assert sorted(summaries, key=key) == sorted(serial, key=key)
+
+    def test_empty_corpus(self):
+        """No files, no summaries."""
+        assert list(validate_corpus([])) == []
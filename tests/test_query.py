@@ -0,0 +1,143 @@
+"""Tests for corpus queries."""
+
+import pytest
+
+from warscribe.corpus.query import CorpusQuery
+from warscribe.schema.action import (
+    ActionResult,
+    ActionType,
+    ChargeAction,
+    MoveAction,
+    ShootAction,
+)
+from warscribe.schema.lazy import LazyTranscript
+from warscribe.schema.transcript import GameTranscript, Player
+from warscribe.schema.unit import UnitReference
+from warscribe.serialization.archive import GameArchive, write_archive
+
+
+def make_game(faction1, faction2, weapon, edition="10th"):
+    attacker = UnitReference(name="Squad", faction=faction1)
+    defender = UnitReference(name="Mob", faction=faction2)
+    transcript = GameTranscript(
+        edition=edition,
+        player1=Player(name="A", faction=faction1, units=[attacker]),
+        player2=Player(name="B", faction=faction2, units=[defender]),
+    )
+    for turn in (1, 2, 3):
+        transcript.add_action(
+            MoveAction(turn=turn, phase="movement", actor=attacker, distance_inches=6)
+        )
+        transcript.add_action(
+            ShootAction(
+                turn=turn,
+                phase="shooting",
+                actor=attacker,
+                target=defender,
+                weapon_name=weapon,
+                shots=2,
+                result=ActionResult.SUCCESS if turn == 3 else ActionResult.FAILED,
+            )
+        )
+    transcript.add_action(
+        ChargeAction(
+            turn=3,
+            phase="charge",
+            actor=defender,
+            targets=[attacker],
+            charge_roll=(3, 4),
+            distance_needed=7,
+        )
+    )
+    return transcript
+
+
+@pytest.fixture
+def games():
+    return [
+        make_game("Space Marines", "Orks", "Bolt Rifle"),
+        make_game("Space Marines", "Necrons", "Bolt Rifle"),
+        make_game("Orks", "Space Marines", "Shoota"),
+        make_game("Space Marines", "Orks", "Bolt Rifle", edition="9th"),
+    ]
+
+
+SHOOTING_ORKS = CorpusQuery(
+    edition="10th",
+    action_types={"shoot"},
+    weapon_name="Bolt Rifle",
+    target_faction="Orks",
+    min_turn=2,
+)
+
+
+class TestCorpusQuery:
+    """Tests for CorpusQuery."""
+
+    def test_query_transcripts(self, games):
+        """Predicates should combine over metadata and actions."""
+        matches = list(SHOOTING_ORKS.run(games))
+
+        assert [(m.game_id, m.index) for m in matches] == [
+            (games[0].id, 3),
+            (games[0].id, 5),
+        ]
+        assert all(isinstance(m.action, ShootAction) for m in matches)
+
+    @pytest.mark.parametrize("source", ["json", "archive"])
+    def test_sources_agree(self, games, tmp_path, source):
+        """JSON and archive sources should give the same results."""
+        expected = list(SHOOTING_ORKS.run(games))
+        if source == "json":
+            paths = []
+            for i, game in enumerate(games):
+                path = tmp_path / f"{i}.json"
+                path.write_text(game.to_json())
+                paths.append(path)
+            assert list(SHOOTING_ORKS.run(paths)) == expected
+        else:
+            write_archive(tmp_path / "corpus.wsca", games)
+            with GameArchive(tmp_path / "corpus.wsca") as archive:
+                assert list(SHOOTING_ORKS.run(archive)) == expected
+
+    def test_metadata_pushdown_skips_decoding(self, games):
+        """Games that cannot match should not have actions decoded."""
+        lazies = [LazyTranscript.from_json(g.to_json()) for g in games]
+
+        assert CorpusQuery(factions={"Necrons"}, min_turn=3).count(lazies) == 3
+        assert [lazy.actions.decoded_count for lazy in lazies] == [0, 3, 0, 0]
+
+    def test_charge_targets_and_result(self, games):
+        """Target faction should cover charge targets; result should filter."""
+        charges = CorpusQuery(
+            action_types={ActionType.CHARGE}, target_faction="Space Marines"
+        )
+        successes = CorpusQuery(result="success", actor_faction="Orks")
+
+        assert charges.count(games) == 3
+        assert successes.count(games) == 1
+
+    def test_where_and_phases(self, games):
+        """Custom predicates and phase sets should apply."""
+        query = CorpusQuery(
+            phases={"movement"}, max_turn=1, where=lambda a: a.actor.faction == "Orks"
+        )
+
+        assert query.count(games) == 1
+
+    def test_unit_faction_differs_from_player(self, tmp_path):
+        """Actor and target faction match units, not the players' factions."""
+        game = make_game("Space Marines", "Orks", "Bolt Rifle")
+        for action in game.actions:
+            action.actor.faction = "Ultramarines"
+        write_archive(tmp_path / "games.wsca", [game])
+
+        query = CorpusQuery(actor_faction="Ultramarines")
+        expected = CorpusQuery(where=lambda a: a.actor.faction == "Ultramarines").count(
+            [game]
+        )
+        assert expected > 0
+        assert query.count([game]) == expected
+        assert query.count([game.to_json()]) == expected
+        with GameArchive(tmp_path / "games.wsca") as archive:
+            assert query.count(archive) == expected
@@ -0,0 +1,205 @@
+"""Tests for declarative validation rules."""
+
+import json
+import pickle
+
+import pytest
+
+from warscribe.edition import (
+    EditionPlugin,
+    PhaseDefinition,
+    Rule,
+    RuleTable,
+    ValidationResult,
+)
+from warscribe.edition.rules import compile_rules
+from warscribe.edition.tenth import TenthEditionPlugin
+from warscribe.schema.action import ActionType, FightAction, ShootAction
+from warscribe.schema.unit import UnitReference
+
+UNIT = UnitReference(name="Intercessors", faction="Space Marines")
+TARGET = UnitReference(name="Boyz", faction="Orks")
+
+RULES = [
+    Rule("wounds", "<=", "hits", "Wounds ({wounds}) exceed hits ({hits}).", "warning"),
+    Rule("hits", "<=", "shots", "Hits ({hits}) cannot exceed shots ({shots})."),
+    Rule("damage_dealt", "<", 100, "Damage {damage_dealt} is too high.", "warning"),
+]
+
+
+def shoot(**fields):
+    values = {"shots": 4, "hits": 3, "wounds": 2, "saves_failed": 1}
+    values.update(fields)
+    return ShootAction(
+        action_type=ActionType.SHOOT,
+        turn=1,
+        phase="shooting",
+        actor=UNIT,
+        target=TARGET,
+        weapon_name="Bolt rifle",
+        **values,
+    )
+
+
+class TestCompileRules:
+    """Tests for compile_rules."""
+
+    def test_mask(self):
+        check = compile_rules(ShootAction, RULES)
+
+        assert check(shoot()) == 0
+        assert check(shoot(wounds=4, damage_dealt=100)) == 0b101
+
+    def test_error_stops_checking(self):
+        """An error drops the warnings found before it."""
+        check = compile_rules(ShootAction, RULES)
+
+        assert check(shoot(hits=5, wounds=6, damage_dealt=100)) == 0b010
+
+    @pytest.mark.parametrize(
+        "rule",
+        [
+            Rule("hits", "<=", "attacks", "No such field."),
+            Rule("hits", "=>", "shots", "Bad operator."),
+            Rule("hits", "<=", "1; import os", "Not a field."),
+            Rule("hits", "<=", True, "Not a number."),
+            Rule("hits", "<=", "shots", "Bad severity.", "fatal"),
+        ],
+    )
+    def test_invalid_rules(self, rule):
+        with pytest.raises(ValueError):
+            compile_rules(ShootAction, [rule])
+
+
+class TestRuleTable:
+    """Tests for RuleTable."""
+
+    def test_dispatch_by_model(self):
+        table = RuleTable({ShootAction: RULES})
+        fight = FightAction(
+            turn=1,
+            phase="fight",
+            actor=UNIT,
+            target=TARGET,
+            weapon_name="Chainsword",
+            attacks=2,
+            hits=9,
+        )
+
+        assert table.check(fight) == 0
+        assert table.check(shoot(hits=5)) == 0b010
+
+    def test_subclass_uses_base_rules(self):
+        class TaggedShoot(ShootAction):
+            tag: str = ""
+
+        table = RuleTable({ShootAction: RULES})
+        action = TaggedShoot(
+            turn=1,
+            phase="shooting",
+            actor=UNIT,
+            target=TARGET,
+            weapon_name="Bolt rifle",
+            shots=1,
+            hits=2,
+        )
+
+        assert table.check(action) == 0b010
+
+    def test_messages(self):
+        table = RuleTable({ShootAction: RULES})
+        action = shoot(wounds=4, damage_dealt=120)
+        failed, messages = table.messages(action, table.check(action))
+
+        assert not failed
+        assert messages == ["Wounds (4) exceed hits (3).", "Damage 120 is too high."]
+
+
+class RulesOnlyPlugin(EditionPlugin):
+    """Edition with declared rules and no hand-written checks."""
+
+    rules = {ShootAction: RULES}
+
+    @property
+    def edition_name(self):
+        return "Rules only"
+
+    @property
+    def edition_code(self):
+        return "rules"
+
+    @property
+    def phases(self):
+        return [
+            PhaseDefinition(
+                name="shooting",
+                display_name="Shooting",
+                order=0,
+                allowed_actions=[ActionType.SHOOT],
+            )
+        ]
+
+    def validate_action(self, action, game_state=None):
+        return self.apply_rules(action, ValidationResult.success())
+
+
+class TestApplyRules:
+    """Tests for EditionPlugin.apply_rules."""
+
+    def test_new_edition(self):
+        plugin = RulesOnlyPlugin()
+
+        assert plugin.validate_action(shoot()).is_valid
+        warned = plugin.validate_action(shoot(wounds=4))
+        assert warned.is_valid
+        assert warned.warnings == ["Wounds (4) exceed hits (3)."]
+        failed = plugin.validate_action(shoot(hits=5))
+        assert not failed.is_valid
+        assert failed.errors == ["Hits (5) cannot exceed shots (4)."]
+
+    def test_existing_warnings_kept(self):
+        plugin = RulesOnlyPlugin()
+        result = ValidationResult.success()
+        result.add_warning("Earlier.")
+
+        result = plugin.apply_rules(shoot(wounds=4), result)
+
+        assert result.warnings == ["Earlier.", "Wounds (4) exceed hits (3)."]
+
+    def test_results_are_plain_lists(self):
+        result = RulesOnlyPlugin().validate_action(shoot(wounds=4))
+
+        assert type(result.warnings) is list
+        assert json.dumps(result.warnings) == '["Wounds (4) exceed hits (3)."]'
+        assert result.warnings + ["More."] == [
+            "Wounds (4) exceed hits (3).",
+            "More.",
+        ]
+
+    def test_used_plugin_pickles(self):
+        """Compiled rules are rebuilt when a used plugin is unpickled."""
+        plugin = TenthEditionPlugin()
+        actions = [shoot(), shoot(wounds=4), shoot(hits=5)]
+        batch = plugin.validate_actions(actions)
+
+        restored = pickle.loads(pickle.dumps(plugin))
+
+        assert "rule_table" in vars(restored)
+        again = restored.validate_actions(actions)
+        assert again.status == batch.status
+        assert again.errors == batch.errors
+        assert again.warnings == batch.warnings
+
+    def test_tenth_edition_batch(self):
+        plugin = TenthEditionPlugin()
+        actions = [shoot(), shoot(wounds=4, saves_failed=5), shoot(hits=5), shoot()]
+
+        batch = plugin.validate_actions(actions)
+
+        assert list(batch.status) == [0, 1, 2, 0]
+        assert batch.warnings[1] == [
+            "Wounds (4) exceed hits (3). Verify re-rolls or abilities.",
+            "Saves failed (5) exceed wounds (4).",
+        ]
+        assert type(batch.errors[2]) is list
+        assert batch.result(2).errors == ["Hits (5) cannot exceed shots (4)."]
@@ -2,13 +2,18 @@
 Unit tests for WARScribe-Core schema.
 """
 
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
 from warscribe.schema.unit import UnitReference
 from warscribe.schema.action import (
+    ACTION_MODELS,
     ActionType,
     MoveAction,
     ShootAction,
     ChargeAction,
     FightAction,
+    TaggedAction,
 )
 from warscribe.schema.transcript import GameTranscript, Player
 
@@ -446,3 +451,220 @@ class TestActionTypeEnum:
         assert ActionType.STRATAGEM.value == "stratagem"
         assert ActionType.ABILITY.value == "ability"
         assert ActionType.OBJECTIVE.value == "objective"
+
+
+class TestTaggedActionDecoding:
+    """Tests for action_type-tagged action decoding."""
+
+    def test_core_types_decode_to_their_model(self):
+        """Each core action type should decode straight to its model."""
+        adapter = TypeAdapter(TaggedAction)
+        actor = UnitReference(name="Unit", faction="F1")
+        target = UnitReference(name="Target", faction="F2")
+        actions = [
+            MoveAction(turn=1, phase="movement", actor=actor, distance_inches=6),
+            ShootAction(
+                turn=1,
+                phase="shooting",
+                actor=actor,
+                target=target,
+                weapon_name="Bolter",
+                shots=2,
+            ),
+            ChargeAction(
+                turn=1,
+                phase="charge",
+                actor=actor,
+                targets=[target],
+                charge_roll=(3, 4),
+                distance_needed=6,
+            ),
+            FightAction(
+                turn=1,
+                phase="fight",
+                actor=actor,
+                target=target,
+                weapon_name="Chainsword",
+                attacks=3,
+            ),
+        ]
+
+        for action in actions:
+            restored = adapter.validate_json(action.model_dump_json())
+            assert type(restored) is ACTION_MODELS[action.action_type]
+            assert restored == action
+
+    def test_every_action_type_decodes(self):
+        """Types without a dedicated model should still decode."""
+        actor = UnitReference(name="Unit", faction="F1")
+        transcript = GameTranscript(
+            player1=Player(name="A", faction="F1"),
+            player2=Player(name="B", faction="F2"),
+        )
+        for action_type in ActionType:
+            if action_type in ACTION_MODELS and action_type != ActionType.MOVE:
+                continue
+            transcript.add_action(
+                MoveAction(
+                    action_type=action_type,
+                    turn=1,
+                    phase="movement",
+                    actor=actor,
+                    distance_inches=3,
+                )
+            )
+
+        restored = GameTranscript.from_json(transcript.to_json())
+
+        assert restored.actions == transcript.actions
+        assert {a.action_type for a in restored.actions} == (
+            set(ActionType) - set(ACTION_MODELS) | {ActionType.MOVE}
+        )
+
+    def test_tagged_errors_name_one_model(self):
+        """A bad shoot action should only be checked against ShootAction."""
+        actor = UnitReference(name="Unit", faction="F1")
+        payload = {
+            "action_type": "shoot",
+            "turn": 1,
+            "phase": "shooting",
+            "actor": actor.model_dump(mode="json"),
+            "weapon_name": "Bolter",
+            "shots": 2,
+        }
+
+        with pytest.raises(ValidationError) as exc_info:
+            TypeAdapter(TaggedAction).validate_python(payload)
+
+        errors = exc_info.value.errors()
+        assert len(errors) == 1
+        assert errors[0]["loc"] == ("shoot", "target")
+
+
+class TestTranscriptIndexes:
+    """Tests for GameTranscript lookup indexes."""
+
+    def _transcript(self):
+        transcript = GameTranscript(
+            player1=Player(name="A", faction="F1"),
+            player2=Player(name="B", faction="F2"),
+        )
+        marines = UnitReference(name="Marines", faction="F1")
+        orks = UnitReference(name="Orks", faction="F2")
+        grots = UnitReference(name="Grots", faction="F2")
+        transcript.add_action(
+            MoveAction(turn=1, phase="movement", actor=marines, distance_inches=6)
+        )
+        transcript.add_action(
+            ShootAction(
+                turn=1,
+                phase="shooting",
+                actor=marines,
+                target=orks,
+                weapon_name="Bolter",
+                shots=2,
+            )
+        )
+        transcript.add_action(
+            ChargeAction(
+                turn=2,
+                phase="charge",
+                actor=orks,
+                targets=[marines, marines],
+                charge_roll=(4, 4),
+                distance_needed=7,
+            )
+        )
+        transcript.add_action(
+            FightAction(
+                turn=2,
+                phase="fight",
+                actor=grots,
+                target=marines,
+                weapon_name="Choppa",
+                attacks=3,
+            )
+        )
+        return transcript, marines, orks
+
+    def test_lookups(self):
+        """Each index should return matching actions in order."""
+        transcript, marines, orks = self._transcript()
+
+        assert transcript.get_actions_for_turn(2) == transcript.actions[2:]
+        assert transcript.get_actions_by_unit(marines.id) == transcript.actions[:2]
+        assert transcript.get_actions_targeting(orks.id) == [transcript.actions[1]]
+        assert transcript.get_actions_targeting(marines.id) == transcript.actions[2:]
+        assert transcript.get_actions_by_type(ActionType.SHOOT) == [
+            transcript.actions[1]
+        ]
+        assert transcript.get_actions_by_type("fight") == [transcript.actions[3]]
+        assert transcript.get_actions_for_turn(5) == []
+
+    def test_lookups_return_copies(self):
+        """Mutating a result should not corrupt the index."""
+        transcript, marines, _ = self._transcript()
+
+        transcript.get_actions_by_unit(marines.id).clear()
+
+        assert len(transcript.get_actions_by_unit(marines.id)) == 2
+
+    def test_indexes_follow_add_action(self):
+        """Actions appended after a lookup should be indexed."""
+        transcript, marines, _ = self._transcript()
+        assert len(transcript.get_actions_for_turn(3)) == 0
+
+        transcript.add_action(
+            MoveAction(turn=3, phase="movement", actor=marines, distance_inches=6)
+        )
+
+        assert len(transcript.get_actions_for_turn(3)) == 1
+        assert len(transcript.get_actions_by_unit(marines.id)) == 3
+
+    def test_indexes_follow_direct_list_changes(self):
+        """Appending to or replacing ``actions`` directly should be picked up."""
+        transcript, marines, _ = self._transcript()
+        transcript.get_actions_for_turn(1)
+
+        transcript.actions.append(
+            MoveAction(turn=1, phase="movement", actor=marines, distance_inches=1)
+        )
+        assert len(transcript.get_actions_for_turn(1)) == 3
+
+        transcript.actions = transcript.actions[2:4]
+        assert transcript.get_actions_for_turn(1) == []
+
+    def test_indexes_follow_removals(self):
+        """Removing or inserting actions directly should rebuild the index."""
+        transcript, marines, _ = self._transcript()
+        removed = transcript.get_actions_for_turn(1)[0]
+
+        transcript.actions.pop(0)
+        transcript.add_action(
+            MoveAction(turn=3, phase="movement", actor=marines, distance_inches=6)
+        )
+        assert removed not in transcript.get_actions_for_turn(1)
+        assert len(transcript.get_actions_for_turn(3)) == 1
+
+        inserted = MoveAction(
+            turn=2, phase="movement", actor=marines, distance_inches=2
+        )
+        transcript.actions.insert(0, inserted)
+        assert transcript.get_actions_for_turn(2)[0] is inserted
+
+        last = transcript.actions.pop()
+        transcript.actions.append(
+            MoveAction(turn=4, phase="movement", actor=marines, distance_inches=1)
+        )
+        assert last not in transcript.get_actions_for_turn(3)
+        assert len(transcript.get_actions_for_turn(4)) == 1
+
+    def test_indexes_after_deserialization(self):
+        """A deserialized transcript should answer lookups correctly."""
+        transcript, marines, orks = self._transcript()
+
+        restored = GameTranscript.from_json(transcript.to_json())
+
+        assert restored == transcript
+        assert restored.get_actions_by_unit(marines.id) == restored.actions[:2]
+        assert restored.get_actions_targeting(orks.id) == [restored.actions[1]]
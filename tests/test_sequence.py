@@ -0,0 +1,156 @@
+"""Tests for phase sequence validation."""
+
+import pytest
+
+from warscribe.edition.sequence import PhaseSequenceValidator, validate_sequence
+from warscribe.edition.tenth import TenthEditionPlugin
+from warscribe.schema.action import ActionType, BaseAction
+from warscribe.schema.transcript import GameTranscript, Player
+from warscribe.schema.unit import UnitReference
+
+MARINES = UnitReference(name="Intercessors", faction="Space Marines")
+ORKS = UnitReference(name="Boyz", faction="Orks")
+
+
+def action(turn, phase, actor=MARINES):
+    return BaseAction(
+        action_type=ActionType.STRATAGEM, turn=turn, phase=phase, actor=actor
+    )
+
+
+def transcript(*actions):
+    transcript = GameTranscript(
+        player1=Player(name="A", faction="Space Marines"),
+        player2=Player(name="B", faction="Orks"),
+    )
+    transcript.actions.extend(actions)
+    return transcript
+
+
+def errors(result):
+    return {index: result.errors[index] for index in result.invalid_indices()}
+
+
+@pytest.fixture
+def plugin():
+    return TenthEditionPlugin()
+
+
+class TestPhaseSequence:
+    """Tests for PhaseSequenceValidator."""
+
+    def test_valid_battle_round(self, plugin):
+        """Both players' turns in a round, then the next round, are valid."""
+        game = transcript(
+            action(1, "movement"),
+            action(1, "shooting"),
+            action(1, "movement", ORKS),
+            action(1, "fight", ORKS),
+            action(1, "fight", MARINES),
+            action(2, "command"),
+            action(2, "charge", ORKS),
+        )
+
+        assert validate_sequence(plugin, game).is_valid
+
+    def test_turn_regression_and_order(self, plugin):
+        """Going back a turn or a third phase restart are errors."""
+        game = transcript(
+            action(2, "shooting"),
+            action(1, "shooting"),
+            action(2, "movement", ORKS),
+            action(2, "command", MARINES),
+            action(2, "psychic"),
+        )
+
+        found = errors(validate_sequence(plugin, game))
+
+        assert found[1] == ["Turn went back from 2 to 1."]
+        assert "out of order" in found[3][0]
+        assert found[4] == ["Unknown phase 'psychic'."]
+        assert 2 not in found
+
+    def test_players_alternate(self, plugin):
+        """A player cannot take both turns of a round or go first out of turn."""
+        game = transcript(
+            action(1, "movement"),
+            action(1, "shooting"),
+            action(1, "movement", MARINES),
+            action(2, "movement", ORKS),
+        )
+
+        found = errors(validate_sequence(plugin, game))
+
+        assert list(found) == [2, 3]
+        assert "did not alternate" in found[2][0]
+        assert "player 1 goes first" in found[3][0]
+
+    def test_strict_skips(self, plugin):
+        """Without allow_skips, skipped turns and required phases are errors."""
+        game = transcript(
+            action(1, "command"),
+            action(1, "movement"),
+            action(1, "shooting"),
+            action(1, "charge"),
+            action(1, "fight"),
+            action(3, "command", MARINES),
+            action(3, "shooting", MARINES),
+        )
+
+        assert validate_sequence(plugin, game).is_valid
+        found = errors(validate_sequence(plugin, game, allow_skips=False))
+        assert found == {
+            5: ["Turn jumped from 1 to 3."],
+            6: ["Skipped required phase 'movement'."],
+        }
+
+    def test_incremental(self, plugin):
+        """validate_new should only check appended actions."""
+        game = transcript(action(1, "movement"), action(1, "shooting"))
+        validator = PhaseSequenceValidator(plugin)
+        assert validator.validate_new(game).is_valid
+
+        game.add_action(action(1, "charge"))
+        game.add_action(action(1, "movement"))
+        game.add_action(action(1, "command"))
+        result = validator.validate_new(game)
+
+        assert len(result) == 3
+        assert result.invalid_indices() == [1, 2]
+        assert validator.checked == 5
+        assert len(validator.validate_new(game)) == 0
+
+    def test_fallback_indexes_follow_new_actions(self, plugin):
+        """A replaced action list is rechecked, indexed like appended actions."""
+        game = transcript(action(1, "movement"), action(1, "shooting"))
+        validator = PhaseSequenceValidator(plugin)
+        validator.validate_new(game)
+
+        game.actions = [*game.actions, action(1, "command"), action(1, "fight")]
+        result = validator.validate_new(game)
+
+        assert len(result) == 2
+        assert list(errors(result)) == [0]
+        assert "did not alternate" in result.errors[0][0]
+        assert validator.checked == 4
+
+    def test_mirror_match(self, plugin):
+        """Players with the same faction are told apart by their rosters."""
+        blue = UnitReference(name="Intercessors", faction="Space Marines")
+        red = UnitReference(name="Hellblasters", faction="Space Marines")
+        game = GameTranscript(
+            player1=Player(name="A", faction="Space Marines", units=[blue]),
+            player2=Player(name="B", faction="Space Marines", units=[red]),
+        )
+        game.actions.extend(
+            [
+                action(1, "movement", blue),
+                action(1, "movement", blue),
+                action(2, "movement", red),
+            ]
+        )
+
+        found = errors(validate_sequence(plugin, game))
+
+        assert list(found) == [2]
+        assert "player 1 goes first" in found[2][0]
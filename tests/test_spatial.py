@@ -0,0 +1,114 @@
+"""Tests for the spatial index."""
+
+import math
+import random
+from dataclasses import replace
+from uuid import uuid4
+
+import pytest
+
+from warscribe.schema.action import MoveAction
+from warscribe.schema.transcript import GameTranscript, Player
+from warscribe.schema.unit import UnitReference
+from warscribe.state.reducer import GameReplay, UnitState
+from warscribe.state.spatial import SpatialIndex
+
+
+def make_units(n, seed=0):
+    rng = random.Random(seed)
+    return [
+        UnitState(
+            id=uuid4(),
+            name=f"Unit {i}",
+            faction="Orks" if i % 2 else "Space Marines",
+            player=i % 2 + 1,
+            position=(rng.uniform(0, 60), rng.uniform(0, 44)),
+        )
+        for i in range(n)
+    ]
+
+
+def distance(a, b):
+    return math.dist(a.position, b.position)
+
+
+class TestSpatialIndex:
+    """Tests for SpatialIndex against brute force."""
+
+    def test_within(self):
+        """Radius queries should match a linear scan."""
+        units = make_units(60)
+        index = SpatialIndex(units)
+
+        for unit in units[:10]:
+            expected = sorted(
+                (distance(unit, o), o.id) for o in units if distance(unit, o) <= 9
+            )
+            found = index.within(unit.position, 9)
+            assert [(d, u.id) for u, d in found] == expected
+        assert all(u.player == 2 for u, _ in index.within((30, 22), 20, player=2))
+
+    def test_nearest_enemy(self):
+        """Nearest enemy should match a linear scan, on any cell size."""
+        units = make_units(40, seed=1)
+        for cell_size in (2.0, 6.0, 100.0):
+            index = SpatialIndex(units, cell_size=cell_size)
+            for unit in units:
+                enemies = [o for o in units if o.player != unit.player]
+                expected = min(enemies, key=lambda o: distance(unit, o))
+                found, found_distance = index.nearest_enemy(unit.id)
+                assert found.id == expected.id
+                assert found.player != unit.player
+                assert found_distance == pytest.approx(distance(unit, found))
+                assert found_distance == pytest.approx(distance(unit, expected))
+
+    def test_engagement(self):
+        """Engagement should only pair opposing units within range."""
+        a, b, c, d = make_units(4)
+        a = replace(a, position=(10.0, 10.0))
+        b = replace(b, position=(10.5, 10.5))
+        c = replace(c, position=(10.0, 10.9))
+        d = replace(d, position=(40.0, 40.0))
+        index = SpatialIndex([a, b, c, d])
+
+        assert [u.id for u, _ in index.in_engagement(a.id)] == [b.id]
+        assert [u.id for u, _ in index.in_engagement(d.id)] == []
+        pairs = index.engagements()
+        assert {frozenset((x.id, y.id)) for x, y in pairs} == {
+            frozenset((a.id, b.id)),
+            frozenset((b.id, c.id)),
+        }
+
+    def test_incremental_moves_and_state(self):
+        """The index should follow moves and build from replay snapshots."""
+        marines = UnitReference(
+            name="Intercessors",
+            faction="Space Marines",
+            position_x=5.0,
+            position_y=5.0,
+        )
+        orks = UnitReference(
+            name="Boyz", faction="Orks", position_x=30.0, position_y=5.0
+        )
+        transcript = GameTranscript(
+            player1=Player(name="A", faction="Space Marines", units=[marines]),
+            player2=Player(name="B", faction="Orks", units=[orks]),
+        )
+        move = MoveAction(
+            turn=1,
+            phase="movement",
+            actor=orks,
+            distance_inches=24.5,
+            end_position=(5.5, 5.0),
+        )
+        transcript.add_action(move)
+
+        index = SpatialIndex.from_state(GameReplay(transcript).state_at(1))
+        assert index.nearest_enemy(marines.id)[1] == pytest.approx(25.0)
+        index.apply(move)
+        assert [u.id for u, _ in index.in_engagement(marines.id)] == [orks.id]
+        assert index.units[orks.id].position == (5.5, 5.0)
+
+        index.remove(orks.id)
+        assert orks.id not in index
+        assert index.nearest_enemy(marines.id) is None
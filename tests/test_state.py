@@ -0,0 +1,152 @@
+"""Tests for game state replay."""
+
+import pytest
+
+from warscribe.schema.action import ChargeAction, FightAction, MoveAction, ShootAction
+from warscribe.schema.transcript import GameTranscript, Player
+from warscribe.schema.unit import UnitReference
+from warscribe.state.reducer import GameReplay
+
+
+@pytest.fixture
+def marines():
+    return UnitReference(
+        name="Intercessors",
+        faction="Space Marines",
+        wounds_remaining=10,
+        models_remaining=5,
+        position_x=0.0,
+        position_y=0.0,
+    )
+
+
+@pytest.fixture
+def orks():
+    return UnitReference(
+        name="Boyz", faction="Orks", wounds_remaining=10, models_remaining=10
+    )
+
+
+@pytest.fixture
+def transcript(marines, orks):
+    transcript = GameTranscript(
+        player1=Player(name="A", faction="Space Marines", units=[marines]),
+        player2=Player(name="B", faction="Orks"),
+    )
+    for turn in (1, 2):
+        transcript.add_action(
+            MoveAction(
+                turn=turn,
+                phase="movement",
+                actor=marines,
+                distance_inches=6,
+                end_position=(6.0 * turn, 1.0),
+            )
+        )
+        transcript.add_action(
+            ShootAction(
+                turn=turn,
+                phase="shooting",
+                actor=marines,
+                target=orks,
+                weapon_name="Bolt Rifle",
+                shots=10,
+                damage_dealt=3,
+                models_killed=3,
+            )
+        )
+        transcript.add_action(
+            ChargeAction(
+                turn=turn,
+                phase="charge",
+                actor=orks,
+                targets=[marines],
+                charge_roll=(4, 4),
+                distance_needed=7,
+                made_charge=turn == 2,
+            )
+        )
+    transcript.add_action(
+        FightAction(
+            turn=2,
+            phase="fight",
+            actor=orks,
+            target=marines,
+            weapon_name="Choppa",
+            attacks=20,
+            damage_dealt=12,
+            models_killed=6,
+        )
+    )
+    return transcript
+
+
+class TestGameReplay:
+    """Tests for GameReplay."""
+
+    def test_final_state(self, transcript, marines, orks):
+        """Actions should fold into unit state."""
+        state = GameReplay(transcript).current
+
+        assert state.applied == 7
+        assert (state.turn, state.phase) == (2, "fight")
+        marine = state.unit(marines.id)
+        assert marine.position == (12.0, 1.0)
+        assert marine.models_remaining == 0
+        assert marine.wounds_remaining == 0
+        assert marine.destroyed
+        ork = state.unit(orks.id)
+        assert (ork.models_remaining, ork.wounds_remaining) == (4, 4)
+        assert ork.charged_turn == 2
+        assert ork.player == 2
+        assert [u.name for u in state.units_for(1)] == ["Intercessors"]
+
+    def test_segment_snapshots(self, transcript, marines, orks):
+        """Snapshots should hold the state at the start of each segment."""
+        replay = GameReplay(transcript)
+
+        start = replay.state_at(1)
+        assert start.applied == 0
+        assert start.unit(marines.id).position == (0.0, 0.0)
+        assert orks.id not in start.units
+
+        turn2 = replay.state_at(2, "shooting")
+        assert turn2.applied == 4
+        assert turn2.unit(orks.id).models_remaining == 7
+        assert turn2.unit(marines.id).position == (12.0, 1.0)
+        assert len(replay.snapshots) == 7
+        with pytest.raises(KeyError, match="turn 3"):
+            replay.state_at(3)
+        with pytest.raises(KeyError):
+            replay.state_at(1, "fight")
+
+    def test_state_after_matches_full_replay(self, transcript):
+        """Seeking should match replaying a truncated transcript."""
+        replay = GameReplay(transcript)
+
+        for index in range(len(transcript.actions)):
+            partial = transcript.model_copy(
+                update={"actions": transcript.actions[: index + 1]}
+            )
+            assert replay.state_after(index) == GameReplay(partial).current
+        with pytest.raises(IndexError):
+            replay.state_after(7)
+
+    def test_incremental(self, transcript, marines):
+        """Appended actions should be folded in on the next query."""
+        replay = GameReplay(transcript)
+        assert replay.current.applied == 7
+
+        transcript.add_action(
+            MoveAction(
+                turn=3,
+                phase="movement",
+                actor=marines,
+                distance_inches=3,
+                end_position=(15.0, 1.0),
+            )
+        )
+
+        assert replay.current.applied == 8
+        assert replay.state_at(3).applied == 7
+        assert replay.current.unit(marines.id).position == (15.0, 1.0)
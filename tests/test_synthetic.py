@@ -0,0 +1,120 @@
+"""Tests for the synthetic transcript generator."""
+
+import pytest
+
+from warscribe.corpus import ArmySpec, TranscriptGenerator
+from warscribe.edition import validate_sequence
+from warscribe.edition.tenth import TenthEditionPlugin
+from warscribe.schema.action import ActionType
+from warscribe.schema.transcript import GameTranscript
+
+
+@pytest.fixture(scope="module")
+def plugin():
+    return TenthEditionPlugin()
+
+
+def test_same_seed_same_game():
+    first = TranscriptGenerator(seed=7, actions=200).game(3).transcript
+    second = TranscriptGenerator(seed=7, actions=200).game(3).transcript
+    assert first == second
+    assert first != TranscriptGenerator(seed=8, actions=200).game(3).transcript
+    assert first != TranscriptGenerator(seed=7, actions=200).game(4).transcript
+
+
+def test_games_stream():
+    generator = TranscriptGenerator(actions=50)
+    games = list(generator.games(3))
+    assert len(games) == 3
+    assert games[1].transcript == generator.game(1).transcript
+    assert len(list(generator.transcripts(2))) == 2
+
+
+@pytest.mark.parametrize("size", [0, 1, 37, 500, 2000])
+def test_action_count(size):
+    transcript = TranscriptGenerator(actions=size).game(0).transcript
+    assert len(transcript.actions) == size
+
+
+def test_action_mix_and_ids():
+    transcript = TranscriptGenerator(actions=1000).game(0).transcript
+    types = {action.action_type for action in transcript.actions}
+    assert types == {
+        ActionType.MOVE,
+        ActionType.SHOOT,
+        ActionType.CHARGE,
+        ActionType.FIGHT,
+    }
+    ids = {action.id for action in transcript.actions}
+    assert len(ids) == 1000
+    assert all(action_id.version == 4 for action_id in ids)
+    times = [action.timestamp for action in transcript.actions]
+    assert times == sorted(times)
+    assert transcript.current_turn == 5
+
+
+def test_clean_games_validate(plugin):
+    for game in TranscriptGenerator(seed=3, actions=800).games(3):
+        assert game.invalid == []
+        assert plugin.validate_actions(game.transcript.actions).is_valid
+        assert validate_sequence(plugin, game.transcript).is_valid
+
+
+def test_invalid_actions_are_reported(plugin):
+    game = TranscriptGenerator(seed=5, actions=2000, invalid_rate=0.1).game(0)
+    assert 100 < len(game.invalid) < 300
+    batch = plugin.validate_actions(game.transcript.actions)
+    assert batch.invalid_indices() == game.invalid
+
+
+def test_round_trip():
+    transcript = TranscriptGenerator(actions=300, invalid_rate=0.1).game(0).transcript
+    assert GameTranscript.from_json(transcript.to_json()) == transcript
+
+
+def test_units_are_not_shared():
+    """Like from_json, each occurrence of a unit is its own instance."""
+    transcript = TranscriptGenerator(actions=100).game(0).transcript
+    roster = transcript.player1.units[0]
+    acting = [a.actor for a in transcript.actions if a.actor.id == roster.id]
+    assert len(acting) > 1
+
+    acting[0].models_remaining = 0
+
+    assert acting[1].models_remaining == roster.models_remaining > 0
+    assert len({id(actor) for actor in acting}) == len(acting)
+    assert all(actor is not roster for actor in acting)
+
+
+def test_army_composition():
+    armies = (
+        ArmySpec("Necrons", units=("Warriors", "Immortals"), skill=4, save=4),
+        ArmySpec("Tau Empire", units=("Fire Warriors",), models=10, wounds=1),
+    )
+    transcript = TranscriptGenerator(actions=100, armies=armies).game(0).transcript
+    assert transcript.player1.faction == "Necrons"
+    assert [unit.name for unit in transcript.player2.units] == ["Fire Warriors"]
+    factions = {action.actor.faction for action in transcript.actions}
+    assert factions == {"Necrons", "Tau Empire"}
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"actions": -1},
+        {"rounds": 0},
+        {"invalid_rate": 1.5},
+        {"armies": (ArmySpec("Orks"),)},
+    ],
+)
+def test_invalid_settings(kwargs):
+    with pytest.raises(ValueError):
+        TranscriptGenerator(**kwargs)
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"units": ()}, {"skill": 1}, {"save": 8}, {"models": 0}]
+)
+def test_invalid_army(kwargs):
+    with pytest.raises(ValueError):
+        ArmySpec("Orks", **kwargs)
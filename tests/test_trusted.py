@@ -0,0 +1,137 @@
+"""Tests for trusted (unvalidated) transcript loading."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from warscribe.schema.action import (
+    ActionType,
+    ChargeAction,
+    FightAction,
+    MoveAction,
+    RelativeDistance,
+    ShootAction,
+)
+from warscribe.schema.transcript import GameTranscript, Player
+from warscribe.schema.unit import UnitReference
+
+
+@pytest.fixture
+def transcript():
+    marines = UnitReference(name="Intercessors", faction="Space Marines")
+    orks = UnitReference(name="Boyz", faction="Orks", models_remaining=10)
+    transcript = GameTranscript(
+        player1=Player(name="Alice", faction="Space Marines", units=[marines]),
+        player2=Player(name="Bob", faction="Orks", units=[orks]),
+        started_at=datetime(2026, 3, 1, 10, 0, tzinfo=timezone.utc),
+    )
+    transcript.add_action(
+        MoveAction(
+            turn=1,
+            phase="movement",
+            actor=marines,
+            distance_inches=6,
+            end_position=(10.0, 4.5),
+            relative_distances=[
+                RelativeDistance(target_unit_id=orks.id, delta_inches=-2.0)
+            ],
+        )
+    )
+    transcript.add_action(
+        MoveAction(
+            action_type=ActionType.ADVANCE,
+            turn=1,
+            phase="movement",
+            actor=orks,
+            distance_inches=9,
+            is_advance=True,
+        )
+    )
+    transcript.add_action(
+        ShootAction(
+            turn=1,
+            phase="shooting",
+            actor=marines,
+            target=orks,
+            weapon_name="Bolt Rifle",
+            shots=4,
+            dice_rolls={"hit": [2, 3, 5, 6]},
+            hits=2,
+        )
+    )
+    transcript.add_action(
+        ChargeAction(
+            turn=1,
+            phase="charge",
+            actor=orks,
+            targets=[marines],
+            charge_roll=(6, 3),
+            distance_needed=8,
+            made_charge=True,
+        )
+    )
+    transcript.add_action(
+        FightAction(
+            turn=1,
+            phase="fight",
+            actor=orks,
+            target=marines,
+            weapon_name="Choppa",
+            attacks=20,
+        )
+    )
+    transcript.ended_at = datetime(2026, 3, 1, 12, 0)
+    return transcript
+
+
+class TestTrustedLoad:
+    """Tests for to_trusted_json / from_trusted_json."""
+
+    def test_roundtrip(self, transcript):
+        """A trusted round-trip should match a validated one."""
+        restored = GameTranscript.from_trusted_json(transcript.to_trusted_json())
+
+        assert restored == transcript
+        assert restored == GameTranscript.from_json(transcript.to_json())
+        assert [type(a) for a in restored.actions] == [
+            type(a) for a in transcript.actions
+        ]
+        assert restored.actions[3].charge_roll == (6, 3)
+
+    def test_units_are_not_shared(self, transcript):
+        """Like ``from_json``, each occurrence of a unit is its own instance."""
+        restored = GameTranscript.from_trusted_json(transcript.to_trusted_json())
+
+        restored.actions[0].actor.wounds_remaining = 3
+
+        assert restored.actions[2].actor.wounds_remaining is None
+        assert restored.player1.units[0].wounds_remaining is None
+        assert restored.actions[2].actor == restored.player1.units[0]
+
+    def test_indexes_work_after_trusted_load(self, transcript):
+        """Lookups should work on a trusted-loaded transcript."""
+        restored = GameTranscript.from_trusted_json(transcript.to_trusted_json())
+        orks = transcript.player2.units[0]
+
+        assert len(restored.get_actions_by_unit(orks.id)) == 3
+        assert len(restored.get_actions_targeting(orks.id)) == 1
+
+    def test_plain_json_rejected(self, transcript):
+        """Ordinary JSON must go through from_json."""
+        with pytest.raises(ValueError, match="Not a trusted transcript"):
+            GameTranscript.from_trusted_json(transcript.to_json())
+
+    def test_tampered_body_rejected(self, transcript):
+        """An edited body should fail the checksum."""
+        data = transcript.to_trusted_json().replace('"turn":1', '"turn":0', 1)
+
+        with pytest.raises(ValueError, match="checksum"):
+            GameTranscript.from_trusted_json(data)
+
+    def test_version_mismatch_rejected(self, transcript):
+        """Output of another format or schema version should be rejected."""
+        marker, _, body = transcript.to_trusted_json().partition("\n")
+        data = marker.replace(" v1 ", " v0 ") + "\n" + body
+
+        with pytest.raises(ValueError, match="different format"):
+            GameTranscript.from_trusted_json(data)
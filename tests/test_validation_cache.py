@@ -0,0 +1,153 @@
+"""Tests for the content-hash validation cache."""
+
+import pytest
+
+from warscribe.edition import ValidationCache
+from warscribe.edition.tenth import TenthEditionPlugin
+from warscribe.schema.action import (
+    ActionType,
+    MoveAction,
+    RelativeDistance,
+    ShootAction,
+)
+from warscribe.schema.unit import UnitReference
+
+UNIT = UnitReference(name="Intercessors", faction="Space Marines")
+TARGET = UnitReference(name="Boyz", faction="Orks")
+
+
+def move(distance=5.0, turn=1, fall_back=False):
+    return MoveAction(
+        action_type=ActionType.MOVE,
+        turn=turn,
+        phase="movement",
+        actor=UNIT,
+        distance_inches=distance,
+        is_advance=fall_back,
+        is_fall_back=fall_back,
+    )
+
+
+class CountingPlugin(TenthEditionPlugin):
+    """10th Edition plugin that counts the actions it validates."""
+
+    def __init__(self, version="1"):
+        self.version = version
+        self.validated = 0
+
+    @property
+    def plugin_version(self):
+        return self.version
+
+    def validate_action(self, action, game_state=None):
+        self.validated += 1
+        return super().validate_action(action, game_state)
+
+
+class TestValidationCache:
+    """Tests for ValidationCache."""
+
+    def test_unchanged_content_hits(self):
+        """A re-created action with the same content is not validated again."""
+        plugin = CountingPlugin()
+        cache = ValidationCache(plugin)
+
+        first = cache.validate_action(move(fall_back=True))
+        second = cache.validate_action(move(fall_back=True))
+
+        assert not first.is_valid
+        assert second.errors == first.errors
+        assert (cache.hits, cache.misses, plugin.validated) == (1, 1, 1)
+
+    def test_changed_content_misses(self):
+        cache = ValidationCache(CountingPlugin())
+        cache.validate_action(move(5.0))
+        cache.validate_action(move(5.5))
+        cache.validate_action(move(5.0, turn=2))
+
+        assert cache.misses == 3
+        assert len(cache) == 3
+
+    def test_in_place_edits_miss(self):
+        """An action edited after it was cached is keyed by its new content."""
+        plugin = CountingPlugin()
+        cache = ValidationCache(plugin)
+        action = move()
+        cache.validate_action(action)
+
+        action.is_advance = action.is_fall_back = True
+        assert not cache.validate_action(action).is_valid
+        action.relative_distances.append(
+            RelativeDistance(target_unit_id=TARGET.id, delta_inches=-1.0)
+        )
+        cache.validate_actions([action])
+
+        assert (cache.hits, cache.misses, plugin.validated) == (0, 3, 3)
+
+    def test_results_are_copies(self):
+        cache = ValidationCache(CountingPlugin())
+        cache.validate_action(move()).add_warning("mutated")
+
+        assert cache.validate_action(move()).warnings == []
+
+    def test_version_and_edition_in_key(self):
+        action = move()
+        old = ValidationCache(CountingPlugin("1"))
+        new = ValidationCache(CountingPlugin("2"))
+
+        assert old.key(action) != new.key(action)
+        assert old.key(action) == ValidationCache(CountingPlugin("1")).key(move())
+
+    def test_lru_eviction(self):
+        cache = ValidationCache(CountingPlugin(), maxsize=2)
+        a, b, c = move(1.0), move(2.0), move(3.0)
+        cache.validate_action(a)
+        cache.validate_action(b)
+        cache.validate_action(a)
+        cache.validate_action(c)
+
+        assert len(cache) == 2
+        assert a in cache
+        assert b not in cache
+
+    def test_game_state_bypasses_cache(self):
+        plugin = CountingPlugin()
+        cache = ValidationCache(plugin)
+        cache.validate_action(move(), game_state={})
+        cache.validate_action(move(), game_state={})
+
+        assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+        assert plugin.validated == 2
+
+    def test_batch_validates_only_misses(self):
+        plugin = CountingPlugin()
+        cache = ValidationCache(plugin)
+        shoot = ShootAction(
+            action_type=ActionType.SHOOT,
+            turn=1,
+            phase="shooting",
+            actor=UNIT,
+            target=TARGET,
+            weapon_name="Bolt rifle",
+            shots=2,
+            hits=3,
+        )
+        cache.validate_action(move())
+
+        batch = cache.validate_actions([move(), shoot, move(fall_back=True), shoot])
+
+        assert plugin.validated == 3
+        assert (cache.hits, cache.misses) == (2, 3)
+        assert batch.invalid_indices() == [1, 2, 3]
+        assert batch.result(3).errors == batch.result(1).errors
+
+    def test_clear(self):
+        cache = ValidationCache(CountingPlugin())
+        cache.validate_action(move())
+        cache.clear()
+
+        assert (len(cache), cache.hits, cache.misses) == (0, 0, 0)
+
+    def test_invalid_maxsize(self):
+        with pytest.raises(ValueError):
+            ValidationCache(CountingPlugin(), maxsize=0)